@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary column width estimator
+"""
+
+from tpDcc.tools.datalibrary.core import columnwidth
+
+
+class _Item(object):
+    def __init__(self, *texts):
+        self.texts = list(texts)
+
+
+def _create_estimator(measured):
+    def _width(item, column):
+        measured.append(item)
+        return len(item.texts[column]) if item.texts else None
+    return columnwidth.ColumnWidthEstimator(_width)
+
+
+def test_items_are_measured_once():
+    measured = list()
+    items = [_Item('a', 'bbb'), _Item('cccc', 'd')]
+    estimator = _create_estimator(measured)
+
+    assert estimator.width(0, lambda: items) == 4
+    assert estimator.width(0, lambda: items) == 4
+    assert len(measured) == 2
+    assert estimator.width(1, lambda: items) == 3
+    assert not estimator.is_tracking(2)
+
+
+def test_incremental_updates():
+    measured = list()
+    items = [_Item('a'), _Item('cccc'), _Item('cccc')]
+    estimator = _create_estimator(measured)
+    estimator.width(0, lambda: items)
+
+    new_item = _Item('eeeeee')
+    estimator.add_items([new_item, _Item()])
+    assert estimator.width(0) == 6
+    estimator.remove_items([new_item, items[1]])
+    assert estimator.width(0) == 4
+    estimator.remove_items([items[2]])
+    assert estimator.width(0) == 1
+    estimator.remove_items([items[0]])
+    assert estimator.width(0) == 0
+
+
+def test_update_and_invalidate():
+    measured = list()
+    item = _Item('a')
+    estimator = _create_estimator(measured)
+    estimator.width(0, lambda: [item])
+
+    item.texts[0] = 'abc'
+    assert estimator.width(0) == 1
+    estimator.update_items([item])
+    assert estimator.width(0) == 3
+
+    estimator.invalidate()
+    assert not estimator.is_tracking(0)
+    assert estimator.width(0, lambda: [item, _Item('abcdefgh')]) == 8
@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary custom order store
+"""
+
+from tpDcc.tools.datalibrary.core import customorder
+
+
+def _store(identifiers):
+    store = customorder.CustomOrderStore()
+    store.append(identifiers)
+    store.take_changes()
+    return store
+
+
+def test_move_only_updates_moved_items():
+    store = _store(['a', 'b', 'c', 'd', 'e'])
+
+    assert sorted(store.move(['d', 'e'], before='b')) == ['d', 'e']
+    assert store.identifiers() == ['a', 'd', 'e', 'b', 'c']
+    assert sorted(store.take_changes()) == ['d', 'e']
+
+    store.move(['a'])
+    assert store.identifiers() == ['d', 'e', 'b', 'c', 'a']
+
+    # Moving items before one of the moved items moves them before the next one that is not moved
+    store.move(['b', 'c'], before='c')
+    assert store.identifiers() == ['d', 'e', 'b', 'c', 'a']
+    store.move(['d', 'c'], before='d')
+    assert store.identifiers() == ['d', 'c', 'e', 'b', 'a']
+
+
+def test_full_gaps_renumber_items():
+    store = _store(['a', 'b', 'c'])
+    for _ in range(20):
+        store.move(['c'], before='b')
+        store.move(['b'], before='c')
+    assert store.identifiers() == ['a', 'b', 'c']
+
+    ranks = store.ranks()
+    assert len(set(ranks.values())) == 3
+    assert set(store.take_changes()) == {'b', 'c'}
+
+
+def test_ranks_are_persisted():
+    store = _store(['a', 'b', 'c'])
+    store.move(['c'], before='a')
+
+    loaded = customorder.CustomOrderStore(store.ranks())
+    assert loaded.identifiers() == ['c', 'a', 'b']
+    assert loaded.sorted_identifiers(['new', 'b', 'c']) == ['c', 'b', 'new']
+    # Items without identifier or with the same identifier are not lost
+    assert loaded.sorted_indices([None, 'b', None, 'c']) == [3, 1, 0, 2]
+    assert 'new' not in loaded and loaded.rank('new') is None
+
+    # Invalid or duplicated ranks are ignored
+    assert len(customorder.CustomOrderStore({'a': 1, 'b': 'x'})) == 1
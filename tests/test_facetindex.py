@@ -0,0 +1,112 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary facet index
+"""
+
+from tpDcc.tools.datalibrary.core import facetindex
+
+
+def _item(name, item_type):
+    return {'name': name, 'type': item_type}
+
+
+def _index(calls=None):
+    def _value(item, field):
+        if calls is not None:
+            calls.append(item['name'])
+        return item.get(field)
+    return facetindex.FacetIndex(_value)
+
+
+def test_facet_counts():
+    items = [_item('a', 'pose'), _item('b', 'anim'), _item('c', 'pose')]
+    index = _index()
+    index.update(items)
+
+    assert index.facets('type') == [{'name': 'anim', 'count': 1}, {'name': 'pose', 'count': 2}]
+    assert index.count('type', 'pose') == 2
+    assert index.count('type', 'mirror') == 0
+
+
+def test_index_is_updated_incrementally():
+    calls = list()
+    a, b, c = _item('a', 'pose'), _item('b', 'anim'), _item('c', 'pose')
+    index = _index(calls)
+    index.update([a, b])
+    index.values('type')
+    assert calls == ['a', 'b']
+
+    # Kept items are read again to find changes, removed items release their slot
+    index.update([b, c])
+    assert calls == ['a', 'b', 'b', 'c']
+    assert len(index) == 2
+    assert index.facets('type') == [{'name': 'anim', 'count': 1}, {'name': 'pose', 'count': 1}]
+
+    index.update([])
+    assert index.facets('type') == [] and index.mask() == 0
+
+
+def test_excluded_values_are_filtered_with_bitsets():
+    items = [_item('a', 'pose'), _item('b', 'anim'), _item('c', 'pose'), _item('d', 'mirror')]
+    index = _index()
+    index.update(items)
+
+    mask = index.mask('type', ['pose', 'unknown'])
+    assert index.accepted_rows(items, mask) == [1, 3]
+    assert index.accepted_rows(items, index.mask()) == [0, 1, 2, 3]
+    assert index.facets('type', mask=mask) == [{'name': 'anim', 'count': 1}, {'name': 'mirror', 'count': 1}]
+
+
+def test_changed_items_are_indexed_again():
+    a, b = _item('a', 'pose'), _item('b', 'anim')
+    index = _index()
+    index.update([a, b])
+    index.set_query({'name': 'types', 'filters': [('type', 'is', 'pose')]})
+    assert index.facets('type') == [{'name': 'anim', 'count': 1}, {'name': 'pose', 'count': 1}]
+    assert index.accepted_rows([a, b], index.query_mask()) == [0]
+
+    b['type'] = 'pose'
+    index.update([a, b])
+    assert index.facets('type') == [{'name': 'pose', 'count': 2}]
+    assert index.accepted_rows([a, b], index.query_mask()) == [0, 1]
+
+
+def test_queries_are_cached_as_bitsets(monkeypatch):
+    calls = list()
+    match_query = facetindex.queries.match_query
+    monkeypatch.setattr(
+        facetindex.queries, 'match_query', lambda *args: calls.append(args[1]['name']) or match_query(*args))
+    items = [_item('walk', 'anim'), _item('run', 'anim'), _item('walk_pose', 'pose')]
+    index = _index()
+    index.update(items)
+
+    assert index.set_query({'name': 'search', 'filters': [('name', 'contains', 'walk')]})
+    assert index.set_query({'name': 'types', 'filters': [('type', 'not', 'pose')]})
+    assert index.accepted_rows(items, index.query_mask()) == [0]
+    assert index.accepted_rows(items, index.query_mask(exclude=['search'])) == [0, 1]
+
+    # Setting the same filters again or changing other query does not evaluate the cached query again
+    del calls[:]
+    assert not index.set_query({'name': 'search', 'filters': [('name', 'contains', 'walk')]})
+    assert index.set_query({'name': 'search', 'filters': [('name', 'contains', 'run')]})
+    assert index.accepted_rows(items, index.query_mask()) == [1]
+    assert calls == ['search', 'search', 'search']
+
+    # New items are only evaluated against cached queries
+    del calls[:]
+    items.append(_item('run_fast', 'anim'))
+    index.update(items)
+    assert index.accepted_rows(items, index.query_mask()) == [1, 3]
+    assert sorted(calls) == ['search', 'types']
+
+    assert index.remove_query('types')
+    assert index.accepted_rows(items, index.query_mask()) == [1, 3]
+    index.clear()
+    assert index.queries() == ['search']
+
+
+def test_slots_bits():
+    assert facetindex.slots_bits([]) == 0
+    assert facetindex.slots_bits([0, 3, 3]) == 0b1001
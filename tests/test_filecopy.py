@@ -0,0 +1,95 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary parallel file copy
+"""
+
+import os
+
+from tpDcc.tools.datalibrary.core import filecopy
+
+
+def _create_sequence(root, count=20):
+    os.makedirs(os.path.join(str(root), 'sub'))
+    for i in range(count):
+        with open(os.path.join(str(root), 'frame.{:04d}.png'.format(i)), 'wb') as f:
+            f.write(os.urandom(1024 * (i + 1)))
+    with open(os.path.join(str(root), 'sub', 'data.json'), 'w') as f:
+        f.write('{}')
+
+
+def _read_tree(root):
+    contents = dict()
+    for folder, _, files in os.walk(str(root)):
+        for file_name in files:
+            path = os.path.join(folder, file_name)
+            with open(path, 'rb') as f:
+                contents[os.path.relpath(path, str(root))] = f.read()
+    return contents
+
+
+def test_copy_folder(tmpdir):
+    source = tmpdir.join('source')
+    target = tmpdir.join('target')
+    _create_sequence(source)
+    calls = list()
+
+    progress = filecopy.copy(str(source), str(target), threads=4, callback=calls.append)
+
+    assert _read_tree(target) == _read_tree(source)
+    assert progress.copied_files == progress.total_files == 21
+    assert progress.copied_bytes == progress.total_bytes
+    assert progress.is_finished() and progress.percent() == 100.0
+    assert calls and calls[-1] is progress
+
+
+def test_copy_file(tmpdir):
+    source = tmpdir.join('image.png')
+    source.write_binary(b'abc')
+    target = tmpdir.join('folder', 'copy.png')
+
+    progress = filecopy.copy(str(source), str(target))
+
+    assert target.read_binary() == b'abc'
+    assert progress.copied_files == 1
+
+
+def test_resume_skips_copied_files(tmpdir):
+    source = tmpdir.join('source')
+    target = tmpdir.join('target')
+    _create_sequence(source)
+    filecopy.copy(str(source), str(target))
+
+    # Simulate an interrupted copy: one file partially written and one missing
+    target.join('frame.0003.png').write_binary(b'partial')
+    target.join('frame.0004.png').remove()
+
+    progress = filecopy.copy(str(source), str(target), resume=True)
+
+    assert _read_tree(target) == _read_tree(source)
+    assert progress.copied_files == 2
+    assert progress.skipped_files == 19
+
+
+def test_cancel(tmpdir):
+    source = tmpdir.join('source')
+    _create_sequence(source, count=50)
+
+    progress = filecopy.copy(str(source), str(tmpdir.join('target')), threads=1, callback=lambda p: False)
+
+    assert progress.cancelled
+    assert progress.copied_files < progress.total_files
+
+
+def test_kernel_copy_without_data_falls_back(tmpdir, monkeypatch):
+    source = tmpdir.join('source.bin')
+    source.write_binary(b'data' * 100)
+    target = tmpdir.join('target.bin')
+
+    # File systems that report no data for non empty files
+    monkeypatch.setattr(os, 'copy_file_range', lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, 'sendfile', lambda *args: 0, raising=False)
+
+    assert filecopy.copy_file(str(source), str(target)) == 400
+    assert target.read_binary() == b'data' * 100
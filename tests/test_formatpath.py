@@ -0,0 +1,38 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary format path memoization
+"""
+
+import pytest
+
+utils = pytest.importorskip('tpDcc.tools.datalibrary.core.utils', exc_type=ImportError)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    utils.clear_format_path_cache()
+    yield
+    utils.clear_format_path_cache()
+
+
+def test_invariant_paths_are_resolved_once():
+    path = utils.format_path('{temp}/library')
+    assert path == utils.format_path('{temp}/library')
+    assert utils._FORMAT_RESULTS['{temp}/library'] == path
+    assert list(utils._FORMAT_TEMPLATES) == ['{temp}/library']
+
+
+def test_format_caches_are_bounded(monkeypatch):
+    monkeypatch.setattr(utils, 'FORMAT_CACHE_SIZE', 4)
+
+    for i in range(10):
+        utils.format_path('{temp}/library_%d' % i)
+    utils.format_path('{temp}/library_6')
+    utils.format_path('{temp}/library_10')
+
+    # Least recently used format strings are discarded first
+    expected = ['{temp}/library_%d' % i for i in (8, 9, 6, 10)]
+    assert list(utils._FORMAT_RESULTS) == expected
+    assert list(utils._FORMAT_TEMPLATES) == expected
@@ -0,0 +1,38 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary sequence frames ring buffer
+"""
+
+from tpDcc.tools.datalibrary.core import framebuffer
+
+
+def test_window_wraps_around():
+    buffer = framebuffer.FrameRingBuffer(10, size=4)
+    assert buffer.window(0) == [0, 1, 2, 3]
+    assert buffer.window(8) == [8, 9, 0, 1]
+    assert framebuffer.FrameRingBuffer(2, size=4).window(1) == [1, 0]
+    assert framebuffer.FrameRingBuffer(0).window(0) == []
+
+
+def test_frames_outside_window_are_discarded():
+    buffer = framebuffer.FrameRingBuffer(10, size=3)
+    for frame in range(3):
+        assert buffer.put(frame, 'frame{}'.format(frame), 0)
+
+    # Playback moved forward: old frames are evicted and late frames are not stored
+    assert buffer.put(3, 'frame3', 2)
+    assert not buffer.put(0, 'frame0', 2)
+    assert 0 not in buffer and 1 not in buffer
+    assert buffer.get(2) == 'frame2' and len(buffer) == 2
+    assert sorted(buffer.values()) == ['frame2', 'frame3']
+
+
+def test_missing_frames():
+    buffer = framebuffer.FrameRingBuffer(10, size=4)
+    buffer.put(1, 'frame1', 0)
+    assert buffer.missing(0) == [0, 2, 3]
+    assert buffer.missing(0, pending={0}) == [2, 3]
+    buffer.clear()
+    assert buffer.missing(0) == [0, 1, 2, 3]
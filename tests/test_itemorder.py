@@ -0,0 +1,81 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary items order index
+"""
+
+from tpDcc.tools.datalibrary.core import itemorder
+
+
+def _item(name, item_type, modified=None):
+    return {'name': name, 'type': item_type, 'modified': modified}
+
+
+def _index(items, calls=None):
+    def _value(item, field):
+        if calls is not None:
+            calls.append(field)
+        return item.get(field)
+    return itemorder.ItemOrderIndex(items, _value)
+
+
+def test_parse_order():
+    assert itemorder.parse_order(['name:dsc']) == ('name', True)
+    assert itemorder.parse_order('type:asc') == ('type', False)
+    assert itemorder.parse_order(None) == (None, False)
+    assert itemorder.parse_order([]) == (None, False)
+
+
+def test_sort_keys():
+    values = ['b', None, 10, 'A', 2.5, '']
+    assert sorted(values, key=itemorder.sort_key) == [2.5, 10, 'A', 'b', None, '']
+    assert sorted([u'\xf1u', u'\xc1rbol', 'b'], key=itemorder.sort_key) == ['b', u'\xc1rbol', u'\xf1u']
+
+
+def test_value_text():
+    assert itemorder.value_text(u'\xc1rbol') == u'\xc1rbol'
+    assert itemorder.value_text(2) == '2'
+    assert itemorder.value_text(None) == 'None'
+
+
+def test_items_are_grouped_and_sorted():
+    a, b, c, d, e = _item('a', 'pose'), _item('B', 'anim'), _item('c', 'pose'), _item('d', None), _item('e', '')
+    index = _index([c, d, a, b, e])
+
+    groups = index.grouped(['type:asc'], ['name:asc'])
+    assert list(groups.keys()) == ['anim', 'pose', itemorder.EMPTY_GROUP]
+    assert groups['pose'] == [a, c]
+    assert groups[itemorder.EMPTY_GROUP] == [d, e]
+
+    # Empty values are always the last ones
+    groups = index.grouped(['type:dsc'], ['name:dsc'])
+    assert list(groups.keys()) == ['pose', 'anim', itemorder.EMPTY_GROUP]
+    assert groups['pose'] == [c, a]
+    assert groups[itemorder.EMPTY_GROUP] == [e, d]
+    assert index.sorted_rows('type', descending=True) == [0, 2, 3, 1, 4]
+
+    # Without group by and sort by items keep their default order
+    assert index.grouped() == {itemorder.NO_GROUP: [c, d, a, b, e]}
+
+
+def test_sort_keys_are_computed_once_per_field():
+    calls = list()
+    items = [_item(str(i), 'pose', modified=i) for i in range(5)]
+    index = _index(items, calls)
+
+    index.grouped(['type:asc'], ['modified:dsc'])
+    index.grouped(['type:asc'], ['modified:asc'])
+    index.grouped(None, ['modified:dsc'])
+    # Group names are taken from the first item of each group
+    assert calls.count('modified') == 5 and calls.count('type') == 5 + 2
+    assert index.sorted_rows('modified', descending=True) == [4, 3, 2, 1, 0]
+
+
+def test_groups_without_shown_items_are_not_returned():
+    a, b, c = _item('a', 'pose'), _item('b', 'anim'), _item('c', 'pose')
+    index = _index([a, b, c])
+
+    # Groups are only created for the rows that are shown, so groups never need to hide themselves
+    assert index.grouped(['type:asc'], ['name:asc'], rows=[0, 2]) == {'pose': [a, c]}
+    assert index.grouped(['type:asc'], ['name:asc'], rows=[]) == {}
@@ -0,0 +1,69 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary JSON paths conversion
+"""
+
+import json
+
+import pytest
+
+from tpDcc.tools.datalibrary.core import jsonpaths
+
+START = '/projects/show/assets/library/.metadata.json'
+
+
+def test_parent_paths():
+    assert jsonpaths.parent_paths(START) == (
+        '/projects/show/assets/library/', '/projects/show/assets/', '/projects/show/')
+    assert jsonpaths.parent_paths('C:\\library\\data.json')[0] == 'C:/library/'
+
+
+@pytest.mark.parametrize('absolute, relative', [
+    ('/projects/show/assets/library/anim/walk.anim', '../anim/walk.anim'),
+    ('/projects/show/assets/props/chair.ma', '../../props/chair.ma'),
+    ('/projects/show/shots/sh010.ma', '../../../shots/sh010.ma'),
+    ('/other/show/shots/sh010.ma', '/other/show/shots/sh010.ma'),
+    ('/projects/showcase/shots/sh010.ma', '/projects/showcase/shots/sh010.ma'),
+])
+def test_round_trip(absolute, relative):
+    data = {'path': absolute, 'items': [absolute], absolute: 1}
+    relative_data = jsonpaths.relative_paths(data, START)
+    assert relative_data == {'path': relative, 'items': [relative], relative: 1}
+    assert jsonpaths.absolute_paths(relative_data, START) == data
+
+
+def test_unrelated_strings_are_not_modified():
+    data = {
+        'comment': 'moved from ../old to /projects/show/ yesterday',
+        'number': 1,
+        'flag': True,
+        'empty': None,
+        'nested': {'values': [1.5, 'a../b']}
+    }
+    assert jsonpaths.absolute_paths(data, START) == data
+    assert jsonpaths.relative_paths(data, START) == data
+
+
+def test_loads():
+    text = json.dumps({'path': '../anim/walk.anim', 'items': [['../../props/chair.ma']], 'comment': 'a ../b'})
+    assert jsonpaths.loads(text, START) == {
+        'path': '/projects/show/assets/library/anim/walk.anim',
+        'items': [['/projects/show/assets/props/chair.ma']],
+        'comment': 'a ../b'
+    }
+    assert jsonpaths.loads(json.dumps(['../anim']), START) == ['/projects/show/assets/library/anim']
+
+
+def test_input_data_is_not_modified():
+    data = {'items': ['../anim/walk.anim']}
+    jsonpaths.absolute_paths(data, START)
+    assert data == {'items': ['../anim/walk.anim']}
+
+
+def test_serialized_checks():
+    assert jsonpaths.has_relative_paths(json.dumps({'a': '../anim'}))
+    assert not jsonpaths.has_relative_paths(json.dumps({'a': 'anim/../x'}))
+    assert jsonpaths.has_absolute_paths(json.dumps({'a': '/projects/show/x'}), START)
+    assert not jsonpaths.has_absolute_paths(json.dumps({'a': '/projects/other/x'}), START)
@@ -0,0 +1,33 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary delayed JSON updates
+"""
+
+import pytest
+
+utils = pytest.importorskip('tpDcc.tools.datalibrary.core.utils', exc_type=ImportError)
+
+
+def test_updates_merged_while_flushing_are_written(tmpdir, monkeypatch):
+    path = str(tmpdir.join('data.json'))
+    utils.save_json(path, {'a': 0})
+    utils.update_json(path, {'a': 1}, delay=60)
+
+    write = utils.write
+    written = list()
+
+    def _write(*args, **kwargs):
+        if not written:
+            # Pending update stays visible while it is written
+            assert utils.read_json(path)['a'] == 1
+            utils.update_json(path, {'b': 2}, delay=60)
+        written.append(args[1])
+        return write(*args, **kwargs)
+
+    monkeypatch.setattr(utils, 'write', _write)
+    assert utils.flush_json(path) == 1
+    assert len(written) == 2
+    assert utils.read_json(path, use_cache=False) == {'a': 1, 'b': 2}
+    assert not utils.flush_json()
@@ -0,0 +1,67 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary Maya namespaces cache
+"""
+
+import pytest
+
+from tpDcc.tools.datalibrary.dccs.maya.core import namespaces
+
+
+class _SceneStandIn(object):
+    def __init__(self, namespaces_list):
+        self.namespaces = list(namespaces_list)
+        self.queries = 0
+
+    def query(self):
+        self.queries += 1
+        return self.namespaces
+
+
+def test_namespaces_are_sorted_and_filtered():
+    scene = _SceneStandIn(['rig', 'UI', 'anim', 'shared', 'anim'])
+    cache = namespaces.NamespacesCache(query_fn=scene.query)
+    assert cache.namespaces() == ['anim', 'rig']
+
+
+def test_namespaces_are_cached_until_invalidated():
+    scene = _SceneStandIn(['rig'])
+    cache = namespaces.NamespacesCache(query_fn=scene.query)
+    assert not cache.is_valid()
+    cache.namespaces()
+    cache.namespaces()
+    assert scene.queries == 1
+    assert cache.is_valid()
+
+    scene.namespaces.append('prop')
+    assert cache.namespaces() == ['rig']
+    cache.invalidate('prop', None)
+    assert cache.namespaces() == ['prop', 'rig']
+    assert scene.queries == 2
+
+
+def test_force_query_namespaces():
+    scene = _SceneStandIn(['rig'])
+    cache = namespaces.NamespacesCache(query_fn=scene.query)
+    cache.namespaces()
+    cache.namespaces(force=True)
+    assert scene.queries == 2
+
+
+def test_returned_namespaces_do_not_modify_cache():
+    cache = namespaces.NamespacesCache(query_fn=lambda: ['rig'])
+    cache.namespaces().append('other')
+    assert cache.namespaces() == ['rig']
+
+
+def test_callbacks_without_maya():
+    try:
+        import maya.api.OpenMaya
+        pytest.skip('Maya API is available')
+    except ImportError:
+        pass
+    cache = namespaces.NamespacesCache(query_fn=lambda: list())
+    assert not cache.register_callbacks()
+    assert not cache.is_tracking()
@@ -0,0 +1,69 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary paint cache
+"""
+
+from tpDcc.tools.datalibrary.core import paintcache
+
+
+def test_least_recently_used_values_are_discarded():
+    cache = paintcache.PaintCache(10)
+    cache.set('a', 'A', 4)
+    cache.set('b', 'B', 4)
+    assert cache.get('a') == 'A'
+
+    cache.set('c', 'C', 4)
+
+    assert 'b' not in cache
+    assert cache.get('a') == 'A' and cache.get('c') == 'C'
+    assert cache.cost() == 8
+
+
+def test_replace_and_oversized_values():
+    cache = paintcache.PaintCache(10)
+    cache.set('a', 'A', 4)
+    cache.set('a', 'A2', 6)
+    assert cache.get('a') == 'A2' and cache.cost() == 6
+
+    assert not cache.set('b', 'B', 11)
+    assert 'b' not in cache and len(cache) == 1
+
+
+def test_set_max_cost():
+    cache = paintcache.PaintCache(10)
+    for key in 'abcde':
+        cache.set(key, key, 2)
+
+    cache.set_max_cost(4)
+
+    assert len(cache) == 2 and cache.cost() == 4
+    assert cache.get('e') == 'e' and cache.get('a') is None
+    cache.clear()
+    assert not len(cache) and cache.cost() == 0
+
+
+def test_popped_values_release_their_cost():
+    cache = paintcache.PaintCache(10)
+    cache.set('a', 'A', 4)
+    cache.set('b', 'B', 6)
+    assert cache.pop('a') == 'A'
+    assert cache.pop('a', 'missing') == 'missing'
+    assert 'a' not in cache and cache.cost() == 6
+
+
+def test_discarded_values_are_released():
+    released = list()
+    cache = paintcache.PaintCache(10, evict_fn=released.append)
+    cache.set('a', 'A', 4)
+    cache.set('b', 'B', 4)
+    cache.set('c', 'C', 4)
+    assert released == ['A']
+
+    assert cache.pop('b') == 'B'
+    cache.set('c', 'C2', 4)
+    cache.remove('c')
+    assert not cache.set('d', 'D', 11)
+    assert released == ['A', 'C', 'C2', 'D']
+    assert cache.keys() == []
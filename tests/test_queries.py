@@ -0,0 +1,48 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary library queries
+"""
+
+from tpDcc.tools.datalibrary.core import queries
+
+
+def _value(item, field):
+    return item.get(field)
+
+
+def test_match_filter():
+    assert queries.match_filter('Walk_Cycle', 'contains', 'cycle')
+    assert queries.match_filter('walk', 'not_contains', 'run')
+    assert queries.match_filter('.PYC', 'is', '.pyc')
+    assert queries.match_filter('.anim', 'not', '.pyc')
+    assert queries.match_filter('/library/poses/a', 'startswith', '/library/')
+    assert queries.match_filter('', 'not', '.pyc')
+    assert not queries.match_filter(None, 'contains', 'trash')
+    assert not queries.match_filter('walk', 'unknown', 'walk')
+
+
+def test_match_query():
+    item = {'identifier': 'walk_cycle', 'extension': '.anim'}
+    assert queries.match_query(item, {'name': 'empty', 'filters': []}, _value)
+    assert queries.match_query(item, {'filters': [('identifier', 'contains', 'walk'),
+                                                  ('identifier', 'contains', 'cycle')]}, _value)
+    assert not queries.match_query(item, {'filters': [('identifier', 'contains', 'walk'),
+                                                      ('identifier', 'contains', 'run')]}, _value)
+    assert queries.match_query(item, {'operator': 'or', 'filters': [('identifier', 'contains', 'run'),
+                                                                    ('extension', 'is', '.anim')]}, _value)
+
+
+def test_query_key_ignores_query_name():
+    filters = [('identifier', 'contains', 'walk')]
+    assert queries.query_key({'name': 'a', 'filters': filters}) == queries.query_key({'name': 'b', 'filters': filters})
+    assert queries.query_key({'filters': filters}) != queries.query_key({'operator': 'or', 'filters': filters})
+
+
+def test_empty_values_only_match_negative_conditions():
+    item = {'name': 'walk'}
+    assert queries.match_query(item, {'filters': [('extension', 'not', '.pyc')]}, _value)
+    assert queries.match_query(item, {'filters': [('path', 'not_contains', 'trash')]}, _value)
+    assert not queries.match_query(item, {'filters': [('extension', 'is', '.pyc')]}, _value)
+    assert not queries.match_query(item, {'filters': [('identifier', 'contains', 'walk')]}, _value)
@@ -0,0 +1,47 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary widget settings
+"""
+
+import pytest
+
+settings = pytest.importorskip('tpDcc.tools.datalibrary.core.settings')
+
+
+@pytest.fixture
+def writes(tmpdir, monkeypatch):
+    written = list()
+    monkeypatch.setattr(settings, 'path', lambda: str(tmpdir.join('widgetSettings.json')))
+    monkeypatch.setattr(settings.utils, 'update_json', lambda path, data: written.append(dict(data)))
+    monkeypatch.setattr(settings, 'SAVE_DELAY', 60)
+    monkeypatch.setattr(settings, '_SETTINGS', dict())
+    yield written
+    settings.reset()
+
+
+def test_changes_are_written_at_once(writes):
+    flush_count = settings.flush_count()
+    saved_count = settings.saved_flush_count()
+
+    settings.set('a', 1)
+    settings.set('b', 2)
+    settings.save({'a': 3})
+    assert settings.get('a') == 3 and settings.is_dirty()
+    assert not writes
+
+    assert settings.flush()
+    assert not settings.flush()
+    assert writes == [{'a': 3, 'b': 2}]
+    assert settings.flush_count() == flush_count + 1
+    assert settings.saved_flush_count() == saved_count + 2
+
+
+def test_pending_changes_are_written_at_exit(writes):
+    settings.set('a', 1)
+    assert not writes
+
+    # flush is the function registered to run at exit
+    settings.flush()
+    assert writes == [{'a': 1}] and not settings.is_dirty()
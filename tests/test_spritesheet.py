@@ -0,0 +1,88 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary sprite sheet sequence format
+"""
+
+import os
+
+import pytest
+
+from tpDcc.tools.datalibrary.core import spritesheet
+
+
+def _write_sheet(path, frames):
+    with spritesheet.SpriteSheetWriter(path) as writer:
+        for i, data in enumerate(frames):
+            writer.add_frame(data, 10 + i, 20 + i)
+
+
+def test_frames_are_read_in_any_order(tmpdir):
+    path = str(tmpdir.join('sequence.spritesheet'))
+    frames = [b'frame0', b'', b'frame-number-2' * 100]
+    _write_sheet(path, frames)
+
+    assert spritesheet.is_sprite_sheet(path)
+    assert not os.path.exists('{}.tmp'.format(path))
+    with spritesheet.SpriteSheet(path) as sheet:
+        assert sheet.frame_count() == len(sheet) == 3
+        assert sheet.image_format() == 'jpg'
+        assert sheet.frame_data(2) == frames[2]
+        assert sheet.frame_data(0) == frames[0]
+        assert sheet.frame_data(1) == b''
+        assert sheet.frame_size(1) == (11, 21)
+
+
+def test_failed_write_keeps_previous_sheet(tmpdir):
+    path = str(tmpdir.join('sequence.spritesheet'))
+    _write_sheet(path, [b'old'])
+
+    with pytest.raises(RuntimeError):
+        with spritesheet.SpriteSheetWriter(path) as writer:
+            writer.add_frame(b'new', 1, 1)
+            raise RuntimeError('capture failed')
+
+    assert os.listdir(str(tmpdir)) == ['sequence.spritesheet']
+    with spritesheet.SpriteSheet(path) as sheet:
+        assert sheet.frame_data(0) == b'old'
+
+
+def test_invalid_files_are_rejected(tmpdir):
+    path = tmpdir.join('sequence.spritesheet')
+    path.write_binary(b'')
+    with pytest.raises(IOError):
+        spritesheet.SpriteSheet(str(path))
+
+    path.write_binary(b'not a sprite sheet' * 10)
+    with pytest.raises(IOError):
+        spritesheet.SpriteSheet(str(path))
+
+    assert not spritesheet.is_sprite_sheet(str(tmpdir))
+    assert not spritesheet.is_sprite_sheet('')
+
+
+def test_extract_frame(tmpdir):
+    path = str(tmpdir.join('sequence.spritesheet'))
+    _write_sheet(path, [b'frame0', b'frame1'])
+
+    frame_path = spritesheet.extract_frame(path, 1, str(tmpdir.join('thumbnail')))
+    assert frame_path.endswith('thumbnail.jpg')
+    with open(frame_path, 'rb') as frame_file:
+        assert frame_file.read() == b'frame1'
+
+
+def test_closed_sheets_release_the_file(tmpdir):
+    path = str(tmpdir.join('sequence.spritesheet'))
+    _write_sheet(path, [b'old'])
+
+    sheet = spritesheet.SpriteSheet(path)
+    sheet.close()
+    sheet.close()
+    assert sheet.is_closed()
+    with pytest.raises(IOError):
+        sheet.frame_data(0)
+
+    _write_sheet(path, [b'new'])
+    with spritesheet.SpriteSheet(path) as sheet:
+        assert sheet.frame_data(0) == b'new'
@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary background tasks
+"""
+
+import threading
+
+import pytest
+
+from tpDcc.tools.datalibrary.core import tasks
+
+
+def test_task_result_is_available_after_finishing():
+    release = threading.Event()
+
+    def _work(value, offset=0):
+        release.wait(5)
+        return value + offset
+
+    task = tasks.BackgroundTask(_work, 1, offset=2).start()
+    assert not task.is_done()
+    assert not task.wait(0.01)
+    release.set()
+    assert task.result(5) == 3
+    assert task.is_done()
+
+
+def test_task_exceptions_are_raised_when_retrieving_result():
+    def _work():
+        raise IOError('copy failed')
+
+    task = tasks.BackgroundTask(_work).start()
+    assert task.wait(5)
+    with pytest.raises(IOError):
+        task.result()
+
+
+def test_tasks_can_wait_for_other_tasks():
+    first = tasks.BackgroundTask(lambda: 'thumbnail').start()
+    second = tasks.BackgroundTask(lambda task: task.result() + '_proxy', first).start()
+    assert second.result(5) == 'thumbnail_proxy'
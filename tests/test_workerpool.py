@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-tools-datalibrary worker pool
+"""
+
+from tpDcc.tools.datalibrary.core import workerpool
+
+
+class _Worker(object):
+    def __init__(self, finished_callback):
+        self.finish = finished_callback
+
+
+def test_workers_are_reused():
+    results = list()
+    pool = workerpool.WorkerPool(_Worker)
+
+    worker = pool.acquire(results.append)
+    assert pool.live_count() == pool.busy_count() == 1
+    worker.finish('image')
+
+    assert results == ['image']
+    assert pool.busy_count() == 0 and pool.live_count() == 1
+    assert pool.acquire(results.append) is worker
+    assert pool.created_count() == 1
+
+
+def test_concurrent_workers_and_idle_limit():
+    pool = workerpool.WorkerPool(_Worker, max_idle=1)
+    workers = [pool.acquire(lambda image: None) for _ in range(3)]
+    assert pool.created_count() == 3
+
+    for worker in workers:
+        worker.finish(None)
+
+    assert pool.live_count() == 1
+    pool.clear()
+    assert pool.live_count() == 0
+
+
+def test_workers_are_released_after_callback():
+    pool = workerpool.WorkerPool(_Worker)
+    acquired = list()
+    worker = pool.acquire(lambda image: acquired.append(pool.acquire(lambda other_image: None)))
+    worker.finish(None)
+
+    assert acquired[0] is not worker
+    assert pool.busy_count() == 1 and pool.live_count() == 2
+
+
+def test_failed_callback_releases_worker():
+    def _fail(image):
+        raise RuntimeError('Internal C++ object already deleted')
+
+    pool = workerpool.WorkerPool(_Worker)
+    worker = pool.acquire(_fail)
+    worker.finish(None)
+    worker.finish(None)
+
+    assert pool.busy_count() == 0 and pool.live_count() == 1
@@ -44,14 +44,16 @@ class DataLibraryClient(client.DccClient, object):
 
         return reply_dict['result']
 
-    def list_namespaces(self):
+    def list_namespaces(self, force=False):
         """
         Returns a list of all available namespaces
+        :param force: bool, Whether to force the query of the namespaces ignoring server cached ones
         :return: list(str)
         """
 
         cmd = {
-            'cmd': 'list_namespaces'
+            'cmd': 'list_namespaces',
+            'force': force
         }
 
         reply_dict = self.send(cmd)
@@ -178,6 +180,26 @@ class DataLibraryClient(client.DccClient, object):
 
         return reply_dict['success'], reply_dict.get('msg', '')
 
+    def load_multiple_data(self, library_path, data_paths, functionality='load'):
+        """
+        Loads all given paths in given library within a single DCC operation
+        :param library_path: str
+        :param data_paths: list(str)
+        :param functionality: str, data functionality to execute ('load' or 'import_data')
+        :return: tuple(bool, str, dict), dict contains per item results and total elapsed time
+        """
+
+        cmd = {
+            'cmd': 'load_multiple_data',
+            'library_path': library_path,
+            'data_paths': data_paths,
+            'functionality': functionality
+        }
+
+        reply_dict = self.send(cmd)
+
+        return reply_dict['success'], reply_dict.get('msg', ''), reply_dict.get('result', dict())
+
     def reference_data(self, library_path, data_path):
         """
         References given path in given library
@@ -195,3 +217,22 @@ class DataLibraryClient(client.DccClient, object):
         reply_dict = self.send(cmd)
 
         return reply_dict['success'], reply_dict.get('msg', '')
+
+    def clear_data_items_cache(self, library_path=None):
+        """
+        Clears the data items cached by the server for the given library or for all libraries if no library is given
+        :param library_path: str or None
+        :return: bool
+        """
+
+        cmd = {
+            'cmd': 'clear_data_items_cache',
+            'library_path': library_path
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return False
+
+        return reply_dict['success']
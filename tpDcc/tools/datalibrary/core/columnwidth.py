@@ -0,0 +1,128 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains an incremental estimator of the width needed to show the contents of view columns
+"""
+
+from __future__ import print_function, division, absolute_import
+
+
+class ColumnWidthEstimator(object):
+    """
+    Class that keeps track of the maximum width of the contents of view columns
+    A column is tracked after its width is requested for the first time (which measures all given items once). After
+    that, widths are updated incrementally when items are added or removed, so views with lots of items do not need
+    to measure all their items each time a column is resized
+    """
+
+    def __init__(self, width_fn):
+        """
+        :param width_fn: callable, function that receives an item and a column and returns the width of the item
+            contents in the given column or None if the item must be ignored
+        """
+
+        self._width_fn = width_fn
+        self._widths = dict()       # {column: {item: width}}
+        self._counts = dict()       # {column: {width: number of items with that width}}
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def is_tracking(self, column):
+        """
+        Returns whether the given column widths are being tracked or not
+        :param column: int
+        :return: bool
+        """
+
+        return column in self._widths
+
+    def width(self, column, items_fn=None):
+        """
+        Returns the maximum width of the contents of the given column
+        :param column: int
+        :param items_fn: callable or None, function that returns all the items. Only called if the column is not
+            tracked yet
+        :return: int
+        """
+
+        if column not in self._widths:
+            self._widths[column] = dict()
+            self._counts[column] = dict()
+            self._add(column, items_fn() if items_fn else list())
+
+        counts = self._counts[column]
+
+        return max(counts) if counts else 0
+
+    def add_items(self, items):
+        """
+        Updates tracked columns with the widths of the given items
+        :param items: list
+        """
+
+        for column in self._widths:
+            self._add(column, items)
+
+    def remove_items(self, items):
+        """
+        Updates tracked columns removing the widths of the given items
+        :param items: list
+        """
+
+        for column, widths in self._widths.items():
+            counts = self._counts[column]
+            for item in items:
+                width = widths.pop(item, None)
+                if width is None:
+                    continue
+                counts[width] -= 1
+                if not counts[width]:
+                    del counts[width]
+
+    def update_items(self, items):
+        """
+        Measures again the given items. Must be called when items contents change
+        :param items: list
+        """
+
+        self.remove_items(items)
+        self.add_items(items)
+
+    def invalidate(self, column=None):
+        """
+        Stops tracking the given column or all columns if no column is given
+        Widths will be measured again next time they are requested
+        :param column: int or None
+        """
+
+        if column is None:
+            self._widths.clear()
+            self._counts.clear()
+        else:
+            self._widths.pop(column, None)
+            self._counts.pop(column, None)
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _add(self, column, items):
+        """
+        Internal function that measures given items and adds their widths to the given column
+        :param column: int
+        :param items: list
+        """
+
+        widths = self._widths[column]
+        counts = self._counts[column]
+        for item in items:
+            if item in widths:
+                continue
+            width = self._width_fn(item, column)
+            if width is None:
+                continue
+            widths[item] = width
+            counts[width] = counts.get(width, 0) + 1
@@ -16,11 +16,16 @@ DEFAULT_RECURSIVE_SEARCH_ENABLED = False
 DEFAULT_RECURSIVE_DEPTH = 8
 
 ITEM_DEFAULT_THUMBNAIL_NAME = 'thumbnail.jpg'
+ITEM_DEFAULT_PROXY_SEQUENCE_NAME = 'sequence'
+ITEM_DEFAULT_PROXY_SIZE = 256
 ITEM_DEFAULT_MAX_ICON_SIZE = 256
 ITEM_DEFAULT_FONT_SIZE = 12
 ITEM_DEFAULT_PLAYHEAD_COLOR = QColor(255, 255, 255, 220)
 ITEM_DEFAULT_THUMBNAIL_COLUMN = 0
 ITEM_DEFAULT_ENABLE_THUMBNAIL_THREAD = True
+ITEM_DEFAULT_ENABLE_PAINT_CACHE = True
+ITEM_DEFAULT_PAINT_CACHE_SIZE = 64 * 1024 * 1024
+ITEM_DEFAULT_SEQUENCE_POOL_SIZE = 64 * 1024 * 1024
 
 GROUP_ITEM_DEFAULT_FONT_SIZE = 24
 GROUP_ITEM_PADDING_LEFT = 2
@@ -35,6 +40,8 @@ ITEM_DEFAULT_EXTENSION = ''
 
 TRASH_NAME = 'trash'
 TRASH_ENABLED = True
+CUSTOM_ORDER_FILE_NAME = 'custom_order.json'
+CUSTOM_ORDER_SAVE_DELAY = 1.0
 ICON_BADGE_COLOR = QColor(230, 230, 0)
 
 DEFAULT_ICON_MODE = 'icon'
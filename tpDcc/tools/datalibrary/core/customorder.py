@@ -0,0 +1,234 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the store used to keep the custom order of the items of a library
+Each item identifier has an integer rank. Ranks are spaced, so moving items only gives new ranks, taken from the gap
+between their new neighbours, to the moved items. Ranks of all items are only computed again when a gap is full
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import bisect
+
+CUSTOM_ORDER_FIELD = 'Custom Order'
+
+
+class CustomOrderStore(object):
+    """
+    Class that stores the rank of each item identifier in the custom order
+    """
+
+    STEP = 1024
+
+    def __init__(self, ranks=None):
+        """
+        :param ranks: dict(str, int) or None, ranks of the item identifiers, as returned by ranks function
+        """
+
+        self._ranks = dict()
+        self._identifiers = dict()
+        self._sorted_ranks = list()
+        self._changes = dict()
+        self.set_ranks(ranks)
+
+    def __len__(self):
+        return len(self._ranks)
+
+    def __contains__(self, identifier):
+        return identifier in self._ranks
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def rank(self, identifier, default=None):
+        """
+        Returns the rank of the given item identifier
+        :param identifier: str
+        :param default: object, value returned if the identifier has no rank
+        :return: int or object
+        """
+
+        return self._ranks.get(identifier, default)
+
+    def ranks(self):
+        """
+        Returns the ranks of all the item identifiers. Returned dictionary can be stored and given to a new store
+        :return: dict(str, int)
+        """
+
+        return dict(self._ranks)
+
+    def set_ranks(self, ranks):
+        """
+        Replaces all the ranks of the store
+        :param ranks: dict(str, int) or None
+        """
+
+        self._ranks = dict()
+        self._identifiers = dict()
+        self._changes = dict()
+        for identifier, rank in (ranks or dict()).items():
+            if isinstance(rank, int) and rank not in self._identifiers:
+                self._ranks[identifier] = rank
+                self._identifiers[rank] = identifier
+        self._sorted_ranks = sorted(self._identifiers)
+
+    def identifiers(self):
+        """
+        Returns all the item identifiers sorted by their rank
+        :return: list(str)
+        """
+
+        return [self._identifiers[rank] for rank in self._sorted_ranks]
+
+    def sorted_identifiers(self, identifiers):
+        """
+        Returns the given item identifiers sorted by their rank. Identifiers without rank keep their order and are
+        sorted last
+        :param identifiers: list(str)
+        :return: list(str)
+        """
+
+        return [identifiers[i] for i in self.sorted_indices(identifiers)]
+
+    def sorted_indices(self, identifiers):
+        """
+        Returns the positions of the given item identifiers sorted by their rank. Identifiers without rank keep their
+        order and are sorted last. Repeated identifiers keep all their positions
+        :param identifiers: list(str)
+        :return: list(int)
+        """
+
+        last_rank = self._sorted_ranks[-1] + 1 if self._sorted_ranks else 0
+        ranked = [(self._ranks.get(identifier, last_rank), i) for i, identifier in enumerate(identifiers)]
+
+        return [i for _, i in sorted(ranked)]
+
+    def append(self, identifiers):
+        """
+        Gives a rank after all the ranked items to the given item identifiers that have no rank yet
+        :param identifiers: list(str)
+        :return: list(str), identifiers that got a new rank
+        """
+
+        added = list()
+        for identifier in identifiers:
+            if identifier in self._ranks:
+                continue
+            rank = self._sorted_ranks[-1] + self.STEP if self._sorted_ranks else self.STEP
+            self._set_rank(identifier, rank)
+            added.append(identifier)
+
+        return added
+
+    def move(self, identifiers, before=None):
+        """
+        Moves the given item identifiers, keeping their order, before the given one
+        Only the moved identifiers get a new rank, unless there is no gap left between their new neighbours
+        :param identifiers: list(str)
+        :param before: str or None, identifier the items are moved before. If None, items are moved to the end
+        :return: dict(str, int), identifiers whose rank changed with their new rank
+        """
+
+        moved = list()
+        moved_set = set()
+        for identifier in identifiers:
+            if identifier not in moved_set:
+                moved.append(identifier)
+                moved_set.add(identifier)
+        if not moved:
+            return dict()
+        self.append(moved + ([before] if before is not None else list()))
+
+        # If the target item is also moved, items are moved before the next item that is not moved
+        if before in moved_set:
+            index = bisect.bisect_left(self._sorted_ranks, self._ranks[before])
+            while before is not None and before in moved_set:
+                index += 1
+                before = self._identifiers[self._sorted_ranks[index]] if index < len(self._sorted_ranks) else None
+
+        for identifier in moved:
+            self._remove_rank(identifier)
+
+        count = len(moved)
+        if before is None:
+            low = self._sorted_ranks[-1] if self._sorted_ranks else 0
+            high = low + self.STEP * (count + 1)
+        else:
+            high = self._ranks[before]
+            index = bisect.bisect_left(self._sorted_ranks, high)
+            low = self._sorted_ranks[index - 1] if index else high - self.STEP * (count + 1)
+
+        if high - low <= count:
+            return self._renumber(moved, before)
+
+        changes = dict()
+        step = (high - low) // (count + 1)
+        for i, identifier in enumerate(moved):
+            changes[identifier] = low + step * (i + 1)
+            self._set_rank(identifier, changes[identifier])
+
+        return changes
+
+    def take_changes(self):
+        """
+        Returns the ranks that changed since the last time this function was called
+        :return: dict(str, int)
+        """
+
+        changes = self._changes
+        self._changes = dict()
+
+        return changes
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _set_rank(self, identifier, rank):
+        """
+        Internal function that sets the rank of the given item identifier
+        :param identifier: str
+        :param rank: int
+        """
+
+        self._ranks[identifier] = rank
+        self._identifiers[rank] = identifier
+        bisect.insort(self._sorted_ranks, rank)
+        self._changes[identifier] = rank
+
+    def _remove_rank(self, identifier):
+        """
+        Internal function that removes the rank of the given item identifier
+        :param identifier: str
+        """
+
+        rank = self._ranks.pop(identifier)
+        del self._identifiers[rank]
+        del self._sorted_ranks[bisect.bisect_left(self._sorted_ranks, rank)]
+
+    def _renumber(self, moved, before):
+        """
+        Internal function that gives a new rank to all item identifiers, inserting the moved ones before the given one
+        :param moved: list(str), identifiers without rank
+        :param before: str or None
+        :return: dict(str, int), identifiers whose rank changed with their new rank
+        """
+
+        identifiers = self.identifiers()
+        index = identifiers.index(before) if before is not None else len(identifiers)
+        identifiers[index:index] = moved
+
+        changes = dict()
+        for i, identifier in enumerate(identifiers):
+            rank = (i + 1) * self.STEP
+            if self._ranks.get(identifier) != rank:
+                changes[identifier] = rank
+        pending_changes = self._changes
+        self.set_ranks(dict((identifier, (i + 1) * self.STEP) for i, identifier in enumerate(identifiers)))
+        pending_changes.update(changes)
+        self._changes = pending_changes
+
+        return changes
@@ -0,0 +1,392 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the index used to count and filter items by the values of their fields (facets)
+Each item has a slot and each value of an indexed field stores the slots of the items that have that value as the bits
+of an integer, so counting items is a bit count and filtering items is an intersection of bitsets
+Named queries are stored as bitsets over the same slots and are only evaluated again when their filters change
+The values read for each item are kept, so only the bits of the items whose values changed are updated
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from tpDcc.tools.datalibrary.core import queries, itemorder
+
+
+def bit_count(bits):
+    """
+    Returns the number of bits set in the given bitset
+    :param bits: int
+    :return: int
+    """
+
+    return bin(bits).count('1')
+
+
+def slots_bits(slots):
+    """
+    Returns the bitset with the bits of the given slots set. Bitset is built at once instead of setting its bits one by
+    one, which would copy the whole integer for each slot
+    :param slots: list(int)
+    :return: int
+    """
+
+    if not slots:
+        return 0
+
+    digits = ['0'] * (max(slots) + 1)
+    for slot in slots:
+        digits[slot] = '1'
+
+    return int(''.join(reversed(digits)), 2)
+
+
+class FacetIndex(object):
+    """
+    Class that stores, for each value of the indexed fields, the bitset of the items that have that value
+    The index is updated incrementally: removed items only clear their bits and items whose values did not change keep
+    their bits
+    """
+
+    def __init__(self, value_fn):
+        """
+        :param value_fn: callable, function that receives an item and a field name and returns the item field value
+        """
+
+        self._value_fn = value_fn
+        self._slots = dict()
+        self._items = dict()
+        self._slot_values = dict()
+        self._free_slots = list()
+        self._slot_count = 0
+        self._all_bits = 0
+        self._fields = dict()
+        self._queries = dict()
+
+    def __len__(self):
+        return len(self._slots)
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def update(self, items):
+        """
+        Updates the index so it contains the given items. Values of items that were already indexed are read again,
+        because items can be reused after their data changes, but only the bits of the items whose values changed are
+        updated
+        :param items: list(object)
+        """
+
+        keys = set()
+        added_slots = list()
+        kept_slots = list()
+        for item in items:
+            key = id(item)
+            keys.add(key)
+            slot = self._slots.get(key)
+            if slot is not None:
+                kept_slots.append(slot)
+                continue
+            slot = self._free_slots.pop() if self._free_slots else self._new_slot()
+            self._slots[key] = slot
+            self._items[slot] = item
+            self._slot_values[slot] = dict()
+            added_slots.append(slot)
+
+        removed_slots = list()
+        for key in [key for key in self._slots if key not in keys]:
+            slot = self._slots.pop(key)
+            self._items.pop(slot)
+            self._slot_values.pop(slot)
+            removed_slots.append(slot)
+        self._free_slots.extend(removed_slots)
+        self._all_bits &= ~slots_bits(removed_slots)
+        self._all_bits |= slots_bits(added_slots)
+
+        # Changed items are removed from the values and queries they matched and added again with their new values
+        changed_slots = self._changed_slots(kept_slots)
+        stale_bits = slots_bits(removed_slots + changed_slots)
+        if stale_bits:
+            for field in self._fields:
+                self._remove_bits(field, stale_bits)
+            for query_data in self._queries.values():
+                if query_data[2] is not None:
+                    query_data[2] &= ~stale_bits
+
+        updated_slots = added_slots + changed_slots
+        for field in self._fields:
+            self._add_slots(field, updated_slots)
+        for query_data in self._queries.values():
+            if query_data[2] is not None:
+                query_data[2] |= self._match_slots(query_data[1], updated_slots)
+
+    def fields(self):
+        """
+        Returns the names of the indexed fields
+        :return: list(str)
+        """
+
+        return list(self._fields)
+
+    def values(self, field):
+        """
+        Returns the bitsets of all the values of the given field. Field is indexed the first time it is used
+        :param field: str
+        :return: dict(object, int)
+        """
+
+        if field not in self._fields:
+            self._fields[field] = dict()
+            self._add_slots(field, list(self._items))
+
+        return self._fields[field]
+
+    def bits(self, field, value):
+        """
+        Returns the bitset of the items that have the given field value
+        :param field: str
+        :param value: object
+        :return: int
+        """
+
+        return self.values(field).get(value, 0)
+
+    def count(self, field, value, mask=None):
+        """
+        Returns the number of items that have the given field value
+        :param field: str
+        :param value: object
+        :param mask: int or None, if given, only items of the mask are counted
+        :return: int
+        """
+
+        bits = self.bits(field, value)
+
+        return bit_count(bits if mask is None else bits & mask)
+
+    def facets(self, field, mask=None):
+        """
+        Returns the values of the given field with the number of items that have them, sorted by value name
+        :param field: str
+        :param mask: int or None, if given, only items of the mask are counted
+        :return: list(dict), list of dictionaries with "name" and "count" keys
+        """
+
+        facets = list()
+        for value, bits in self._sorted_values(field):
+            count = bit_count(bits if mask is None else bits & mask)
+            if count:
+                facets.append({'name': value, 'count': count})
+
+        return facets
+
+    def mask(self, field=None, excluded_values=None):
+        """
+        Returns the bitset of the items whose given field value is not excluded
+        :param field: str or None
+        :param excluded_values: list(object) or None
+        :return: int
+        """
+
+        mask = self._all_bits
+        if field and excluded_values:
+            field_values = self.values(field)
+            for value in excluded_values:
+                mask &= ~field_values.get(value, 0)
+
+        return mask
+
+    def queries(self):
+        """
+        Returns the names of the stored queries
+        :return: list(str)
+        """
+
+        return list(self._queries)
+
+    def set_query(self, query):
+        """
+        Stores the given named query. Bitset of the query is only evaluated again if its filters changed
+        :param query: dict, library query with "name", "operator" and "filters" keys
+        :return: bool, True if the query changed; False otherwise
+        """
+
+        name = query.get('name')
+        key = queries.query_key(query)
+        query_data = self._queries.get(name)
+        if query_data is not None and query_data[0] == key:
+            return False
+
+        self._queries[name] = [key, dict(query), None]
+
+        return True
+
+    def remove_query(self, name):
+        """
+        Removes the query with the given name
+        :param name: str
+        :return: bool, True if the query was removed; False otherwise
+        """
+
+        return self._queries.pop(name, None) is not None
+
+    def query_bits(self, name):
+        """
+        Returns the bitset of the items that match the query with the given name. Query is evaluated the first time
+        it is used after its filters or the items change
+        :param name: str
+        :return: int
+        """
+
+        query_data = self._queries.get(name)
+        if query_data is None:
+            return self._all_bits
+        if query_data[2] is None:
+            query_data[2] = self._match_slots(query_data[1], list(self._items))
+
+        return query_data[2]
+
+    def query_mask(self, exclude=None):
+        """
+        Returns the bitset of the items that match all the stored queries
+        :param exclude: list(str) or None, names of the queries to ignore
+        :return: int
+        """
+
+        mask = self._all_bits
+        for name in self._queries:
+            if not exclude or name not in exclude:
+                mask &= self.query_bits(name)
+
+        return mask
+
+    def accepted_rows(self, items, mask):
+        """
+        Returns the positions of the given items that are included in the given bitset
+        :param items: list(object), indexed items
+        :param mask: int
+        :return: list(int)
+        """
+
+        bits = bin(mask)[:1:-1]
+        rows = list()
+        for row, item in enumerate(items):
+            slot = self._slots.get(id(item))
+            if slot is not None and slot < len(bits) and bits[slot] == '1':
+                rows.append(row)
+
+        return rows
+
+    def clear(self):
+        """
+        Removes all items from the index. Stored queries are kept
+        """
+
+        self._slots.clear()
+        self._items.clear()
+        self._slot_values.clear()
+        self._free_slots = list()
+        self._slot_count = 0
+        self._all_bits = 0
+        self._fields.clear()
+        for query_data in self._queries.values():
+            query_data[2] = None
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _new_slot(self):
+        """
+        Internal function that returns a slot that was never used
+        :return: int
+        """
+
+        slot = self._slot_count
+        self._slot_count += 1
+
+        return slot
+
+    def _slot_value(self, slot, field):
+        """
+        Internal function that returns the value of the given field of the item stored in the given slot
+        Read values are kept, so they can be compared when the index is updated
+        :param slot: int
+        :param field: str
+        :return: object
+        """
+
+        values = self._slot_values[slot]
+        if field not in values:
+            values[field] = self._value_fn(self._items[slot], field)
+
+        return values[field]
+
+    def _changed_slots(self, slots):
+        """
+        Internal function that returns the slots whose item values changed since they were read. Kept values of the
+        changed slots are discarded, so they are read again
+        Only the values that were read are compared: query results only depend on the fields the query read
+        :param slots: list(int)
+        :return: list(int)
+        """
+
+        changed_slots = list()
+        for slot in slots:
+            item = self._items[slot]
+            values = self._slot_values[slot]
+            if any(self._value_fn(item, field) != value for field, value in values.items()):
+                values.clear()
+                changed_slots.append(slot)
+
+        return changed_slots
+
+    def _sorted_values(self, field):
+        """
+        Internal function that returns the values of the given field sorted by name
+        :param field: str
+        :return: list(tuple(object, int))
+        """
+
+        return sorted(self.values(field).items(), key=lambda value_bits: itemorder.value_text(value_bits[0]).lower())
+
+    def _add_slots(self, field, slots):
+        """
+        Internal function that reads the field values of the items stored in the given slots
+        :param field: str
+        :param slots: list(int)
+        """
+
+        field_values = self._fields[field]
+        added_slots = dict()
+        for slot in slots:
+            added_slots.setdefault(self._slot_value(slot, field), list()).append(slot)
+        for value, value_slots in added_slots.items():
+            field_values[value] = field_values.get(value, 0) | slots_bits(value_slots)
+
+    def _match_slots(self, query, slots):
+        """
+        Internal function that returns the bitset of the items stored in the given slots that match the given query
+        :param query: dict
+        :param slots: list(int)
+        :return: int
+        """
+
+        return slots_bits([slot for slot in slots if queries.match_query(slot, query, self._slot_value)])
+
+    def _remove_bits(self, field, removed_bits):
+        """
+        Internal function that removes the given slots from all the values of the given field
+        :param field: str
+        :param removed_bits: int
+        """
+
+        field_values = self._fields[field]
+        for value in list(field_values):
+            bits = field_values[value] & ~removed_bits
+            if bits:
+                field_values[value] = bits
+            else:
+                del field_values[value]
@@ -0,0 +1,352 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to copy files and folders in parallel
+Copies can be resumed: files whose size and modification time already match the source ones are skipped
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import time
+import errno
+import shutil
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# Copies are I/O bound, so using more threads than cores is fine
+try:
+    DEFAULT_THREADS = min(8, 2 * os.cpu_count())
+except (AttributeError, TypeError):
+    DEFAULT_THREADS = 4
+
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Maximum difference in seconds between modification times to consider two files equal
+MTIME_TOLERANCE = 1.0
+
+# Errors raised by kernel copy functions when they are not supported for the given files
+_KERNEL_COPY_ERRORS = set(
+    getattr(errno, name) for name in ('ENOSYS', 'EXDEV', 'EINVAL', 'ENOTSUP', 'EOPNOTSUPP', 'EBADF', 'ENODATA')
+    if hasattr(errno, name))
+
+
+class CopyProgress(object):
+    """
+    Class that stores the progress of a copy operation
+    """
+
+    def __init__(self, total_files=0, total_bytes=0):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.copied_files = 0
+        self.copied_bytes = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+        self.errors = list()
+        self.cancelled = False
+        self.start_time = time.time()
+        self.end_time = None
+
+    def __repr__(self):
+        return '<CopyProgress {}>'.format(self.message())
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def processed_files(self):
+        """
+        Returns the number of files already processed (copied, skipped or failed)
+        :return: int
+        """
+
+        return self.copied_files + self.skipped_files + len(self.errors)
+
+    def elapsed_time(self):
+        """
+        Returns the number of seconds the copy operation took or has been running
+        :return: float
+        """
+
+        return (self.end_time or time.time()) - self.start_time
+
+    def throughput(self):
+        """
+        Returns the number of bytes copied per second. Skipped files are not taken into account
+        :return: float
+        """
+
+        elapsed_time = self.elapsed_time()
+
+        return self.copied_bytes / elapsed_time if elapsed_time > 0 else 0.0
+
+    def percent(self):
+        """
+        Returns copy operation progress percentage
+        :return: float
+        """
+
+        if not self.total_bytes:
+            return 100.0 if self.processed_files() >= self.total_files else 0.0
+
+        return min(100.0, 100.0 * (self.copied_bytes + self.skipped_bytes) / self.total_bytes)
+
+    def is_finished(self):
+        """
+        Returns whether the copy operation is finished or not
+        :return: bool
+        """
+
+        return self.end_time is not None
+
+    def message(self):
+        """
+        Returns a message that describes the current copy progress
+        :return: str
+        """
+
+        return 'Copied {}/{} files ({:.0f}%) at {:.1f} MB/s'.format(
+            self.processed_files(), self.total_files, self.percent(), self.throughput() / (1024 * 1024))
+
+
+def is_up_to_date(source, target, source_stat=None):
+    """
+    Returns whether target file has the same size and modification time than the source file
+    :param source: str
+    :param target: str
+    :param source_stat: os.stat_result or None, source stat if already available
+    :return: bool
+    """
+
+    try:
+        target_stat = os.stat(target)
+        source_stat = source_stat or os.stat(source)
+    except OSError:
+        return False
+
+    return target_stat.st_size == source_stat.st_size and abs(
+        target_stat.st_mtime - source_stat.st_mtime) <= MTIME_TOLERANCE
+
+
+def copy_file(source, target):
+    """
+    Copies source file contents and stat info into target file
+    Contents are copied by the kernel when possible (copy_file_range or sendfile), avoiding copies to user space
+    Modification time is copied after contents, so a partially copied file is never considered up to date
+    :param source: str
+    :param target: str
+    :return: int, number of copied bytes
+    """
+
+    with open(source, 'rb') as source_file:
+        with open(target, 'wb') as target_file:
+            copied = _kernel_copy(source_file.fileno(), target_file.fileno())
+            if copied is None:
+                shutil.copyfileobj(source_file, target_file, CHUNK_SIZE)
+                copied = source_file.tell()
+    shutil.copystat(source, target)
+
+    return copied
+
+
+def copy(source, target, resume=False, threads=None, callback=None, interval=0.1):
+    """
+    Copies the given source file or folder into the given target path using multiple threads
+    :param source: str
+    :param target: str
+    :param resume: bool, Whether to skip files that are already copied into target path
+    :param threads: int or None, number of threads used to copy files. If None, DEFAULT_THREADS is used
+    :param callback: callable or None, function called with CopyProgress instance each interval seconds and when the
+        copy ends. It is always called from the calling thread. If it returns False, copy is cancelled
+    :param interval: float, seconds between callback calls
+    :return: CopyProgress
+    """
+
+    directories, tasks = _collect(source, target, resume)
+    progress = CopyProgress(total_files=len(tasks), total_bytes=sum(task[2] for task in tasks))
+    for task in tasks:
+        if task[3]:
+            progress.skipped_files += 1
+            progress.skipped_bytes += task[2]
+    tasks = [task for task in tasks if not task[3]]
+
+    for directory in directories:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    threads = DEFAULT_THREADS if threads is None else threads
+    if threads <= 1 or len(tasks) <= 1:
+        _copy_sequential(tasks, progress, callback)
+    else:
+        _copy_parallel(tasks, progress, callback, threads, interval)
+
+    # Creating files modifies folders modification time, so folders stat info is copied once files are copied
+    if not progress.cancelled and os.path.isdir(source):
+        for directory in reversed(directories):
+            source_directory = os.path.join(source, os.path.relpath(directory, target))
+            try:
+                shutil.copystat(source_directory, directory)
+            except OSError as exc:
+                progress.errors.append((source_directory, directory, str(exc)))
+
+    progress.end_time = time.time()
+    if callback:
+        callback(progress)
+
+    if progress.errors:
+        raise shutil.Error(progress.errors)
+
+    return progress
+
+
+def _collect(source, target, resume):
+    """
+    Internal function that returns folders to create and files to copy
+    :param source: str
+    :param target: str
+    :param resume: bool
+    :return: tuple(list(str), list(tuple(str, str, int, bool))), folders and (source, target, size, skip) tuples
+    """
+
+    if os.path.isfile(source):
+        stat = os.stat(source)
+        skip = resume and is_up_to_date(source, target, stat)
+        return [os.path.dirname(target)], [(source, target, stat.st_size, skip)]
+
+    directories = list()
+    tasks = list()
+    for root, dirs, files in os.walk(source, followlinks=True):
+        relative_root = os.path.relpath(root, source)
+        target_root = target if relative_root == os.curdir else os.path.join(target, relative_root)
+        directories.append(target_root)
+        for file_name in files:
+            source_path = os.path.join(root, file_name)
+            target_path = os.path.join(target_root, file_name)
+            stat = os.stat(source_path)
+            skip = resume and is_up_to_date(source_path, target_path, stat)
+            tasks.append((source_path, target_path, stat.st_size, skip))
+
+    return directories, tasks
+
+
+def _copy_task(task, progress, lock):
+    """
+    Internal function that copies the file of the given task and updates the progress
+    :param task: tuple(str, str, int, bool)
+    :param progress: CopyProgress
+    :param lock: threading.Lock
+    """
+
+    source_path, target_path, size, _ = task
+    try:
+        copied = copy_file(source_path, target_path)
+    except (IOError, OSError) as exc:
+        with lock:
+            progress.errors.append((source_path, target_path, str(exc)))
+        return
+
+    with lock:
+        progress.copied_files += 1
+        progress.copied_bytes += copied
+
+
+def _copy_sequential(tasks, progress, callback):
+    """
+    Internal function that copies given tasks one after another in the calling thread
+    :param tasks: list(tuple(str, str, int, bool))
+    :param progress: CopyProgress
+    :param callback: callable or None
+    """
+
+    lock = threading.Lock()
+    for task in tasks:
+        _copy_task(task, progress, lock)
+        if callback and callback(progress) is False:
+            progress.cancelled = True
+            break
+
+
+def _copy_parallel(tasks, progress, callback, threads, interval):
+    """
+    Internal function that copies given tasks using a pool of threads
+    :param tasks: list(tuple(str, str, int, bool))
+    :param progress: CopyProgress
+    :param callback: callable or None
+    :param threads: int
+    :param interval: float
+    """
+
+    lock = threading.Lock()
+    cancel_event = threading.Event()
+    tasks_queue = queue.Queue()
+    for task in tasks:
+        tasks_queue.put(task)
+
+    def _worker():
+        while not cancel_event.is_set():
+            try:
+                task = tasks_queue.get_nowait()
+            except queue.Empty:
+                return
+            _copy_task(task, progress, lock)
+
+    workers = [threading.Thread(target=_worker) for _ in range(min(threads, len(tasks)))]
+    for worker in workers:
+        worker.daemon = True
+        worker.start()
+
+    while True:
+        alive_workers = [worker for worker in workers if worker.is_alive()]
+        if not alive_workers:
+            break
+        alive_workers[0].join(interval)
+        if callback and not cancel_event.is_set() and callback(progress) is False:
+            progress.cancelled = True
+            cancel_event.set()
+
+
+def _kernel_copy(source_fd, target_fd):
+    """
+    Internal function that copies file contents using kernel copy functions
+    :param source_fd: int
+    :param target_fd: int
+    :return: int or None, number of copied bytes or None if kernel copy is not supported for the given files
+    """
+
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    # sendfile only supports regular files as target in Linux
+    sendfile = getattr(os, 'sendfile', None) if sys.platform.startswith('linux') else None
+    if not copy_file_range and not sendfile:
+        return None
+
+    offset = 0
+    while True:
+        try:
+            if copy_file_range:
+                sent = copy_file_range(source_fd, target_fd, CHUNK_SIZE)
+            else:
+                sent = sendfile(target_fd, source_fd, offset, CHUNK_SIZE)
+        except OSError as exc:
+            if offset == 0 and exc.errno in _KERNEL_COPY_ERRORS:
+                if copy_file_range and sendfile:
+                    copy_file_range = None
+                    continue
+                return None
+            raise
+        if sent == 0:
+            # Some file systems (procfs, FUSE, network mounts) report no data instead of failing
+            if offset == 0 and os.fstat(source_fd).st_size > 0:
+                if copy_file_range and sendfile:
+                    copy_file_range = None
+                    continue
+                return None
+            break
+        offset += sent
+
+    return offset
@@ -0,0 +1,114 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a ring buffer that stores decoded frames of an image sequence
+"""
+
+from __future__ import print_function, division, absolute_import
+
+
+class FrameRingBuffer(object):
+    """
+    Class that keeps decoded frames from the current playback position to a given number of upcoming frames
+    Frames outside that window are discarded, so memory usage is bounded no matter the length of the sequence
+    """
+
+    def __init__(self, frame_count, size=12):
+        self._frame_count = frame_count
+        self._size = max(1, min(size, frame_count)) if frame_count else 0
+        self._frames = dict()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, frame):
+        return frame in self._frames
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def frame_count(self):
+        """
+        Returns the number of frames of the sequence
+        :return: int
+        """
+
+        return self._frame_count
+
+    def size(self):
+        """
+        Returns the maximum number of stored frames
+        :return: int
+        """
+
+        return self._size
+
+    def window(self, position):
+        """
+        Returns the frames that must be stored when playback is at the given position, ordered by playback order
+        :param position: int
+        :return: list(int)
+        """
+
+        if not self._frame_count:
+            return list()
+
+        return [(position + i) % self._frame_count for i in range(self._size)]
+
+    def get(self, frame):
+        """
+        Returns the decoded frame
+        :param frame: int
+        :return: object or None
+        """
+
+        return self._frames.get(frame)
+
+    def values(self):
+        """
+        Returns all the stored decoded frames
+        :return: list(object)
+        """
+
+        return list(self._frames.values())
+
+    def put(self, frame, value, position):
+        """
+        Stores the given decoded frame if it is inside the window of the given playback position
+        :param frame: int
+        :param value: object
+        :param position: int
+        :return: bool, True if the frame was stored; False otherwise
+        """
+
+        window = set(self.window(position))
+        for stored_frame in list(self._frames):
+            if stored_frame not in window:
+                del self._frames[stored_frame]
+        if frame not in window:
+            return False
+
+        self._frames[frame] = value
+
+        return True
+
+    def missing(self, position, pending=None):
+        """
+        Returns the frames of the window of the given position that are not decoded nor pending, nearest first
+        :param position: int
+        :param pending: set(int) or None, frames that are being decoded
+        :return: list(int)
+        """
+
+        pending = pending or set()
+
+        return [frame for frame in self.window(position) if frame not in self._frames and frame not in pending]
+
+    def clear(self):
+        """
+        Removes all stored frames
+        """
+
+        self._frames.clear()
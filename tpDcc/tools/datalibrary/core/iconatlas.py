@@ -0,0 +1,99 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the icon atlas shared by library items and sidebar items
+Resource paths are resolved and images are decoded only once, no matter how many items use them. Because Qt icons
+and pixmaps are implicitly shared, all items that use the same icon share the same image data in memory
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+
+from Qt.QtCore import Qt, QSize
+from Qt.QtGui import QIcon, QPixmap
+
+from tpDcc.managers import resources
+
+_PATHS = dict()
+_ICONS = dict()
+_PIXMAPS = dict()
+_CACHED = dict()
+
+
+def resource_path(*args):
+    """
+    Returns the path of the given resource. Paths are only resolved once
+    :param args: list(str), arguments passed to resources manager
+    :return: str or None
+    """
+
+    if args not in _PATHS:
+        _PATHS[args] = resources.get(*args)
+
+    return _PATHS[args]
+
+
+def icon(path):
+    """
+    Returns shared icon for the given path
+    :param path: str
+    :return: QIcon
+    """
+
+    item_icon = _ICONS.get(path)
+    if item_icon is None:
+        item_icon = _ICONS[path] = QIcon(path)
+
+    return item_icon
+
+
+def pixmap(path, size=None):
+    """
+    Returns shared pixmap for the given path, optionally scaled to fit the given size keeping the aspect ratio
+    :param path: str
+    :param size: QSize or None
+    :return: QPixmap or None, None if the file does not exist
+    """
+
+    if not path:
+        return None
+
+    key = (path, size.width(), size.height()) if size else (path, )
+    if key not in _PIXMAPS:
+        if not size:
+            _PIXMAPS[key] = QPixmap(path) if os.path.isfile(path) else None
+        else:
+            source = pixmap(path)
+            _PIXMAPS[key] = source.scaled(
+                QSize(size), Qt.KeepAspectRatio, Qt.SmoothTransformation) if source else None
+
+    return _PIXMAPS[key]
+
+
+def cached(key, create_fn):
+    """
+    Returns the pixmap or icon stored with the given key, creating it with the given function if it does not exist
+    Keys should contain all the values that modify the result (path, color, DPI, size, ...)
+    :param key: tuple
+    :param create_fn: callable
+    :return: QPixmap or QIcon
+    """
+
+    value = _CACHED.get(key)
+    if value is None:
+        value = _CACHED[key] = create_fn()
+
+    return value
+
+
+def clear():
+    """
+    Clears all stored paths, icons and pixmaps
+    """
+
+    _PATHS.clear()
+    _ICONS.clear()
+    _PIXMAPS.clear()
+    _CACHED.clear()
@@ -0,0 +1,180 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the index used to group and sort the items shown by viewers
+Sort keys of each field are computed once for all items, so changing the grouping or the sort order only changes the
+order of the items
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numbers
+from collections import OrderedDict
+
+try:
+    string_types = (str, unicode)
+except NameError:
+    string_types = (str,)
+
+NO_GROUP = 'None'
+EMPTY_GROUP = '(Empty)'
+
+# Sort key of empty values
+_EMPTY_KEY = (2, 0, '')
+
+
+def parse_order(order):
+    """
+    Returns the field and the direction of the given library group by or sort by value
+    :param order: list(str) or str or None, value with the format "field:asc" or "field:dsc"
+    :return: tuple(str or None, bool), field name and whether or not the order is descending
+    """
+
+    if isinstance(order, (list, tuple)):
+        order = order[0] if order else None
+    if not order:
+        return None, False
+
+    field, _, direction = order.partition(':')
+
+    return field or None, direction == 'dsc'
+
+
+def value_text(value):
+    """
+    Returns the text of the given value. Texts are returned as they are, so unicode texts are not encoded
+    :param value: object
+    :return: str
+    """
+
+    if isinstance(value, string_types):
+        return value
+
+    return str(value)
+
+
+def sort_key(value):
+    """
+    Returns the key used to sort the given value. Numbers are sorted numerically, texts are sorted without taking into
+    account the case and empty values are sorted last
+    :param value: object
+    :return: tuple
+    """
+
+    if value is None or value == '':
+        return _EMPTY_KEY
+    if isinstance(value, numbers.Number) and not isinstance(value, bool):
+        return 0, value, ''
+
+    return 1, 0, value_text(value).lower()
+
+
+class ItemOrderIndex(object):
+    """
+    Class that stores the sort keys of a list of items. Keys of a field are computed the first time the field is used
+    """
+
+    def __init__(self, items, value_fn):
+        """
+        :param items: list(object), items in their default order
+        :param value_fn: callable, function that receives an item and a field name and returns the item field value
+        """
+
+        self._items = list(items)
+        self._value_fn = value_fn
+        self._columns = dict()
+
+    def __len__(self):
+        return len(self._items)
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def items(self):
+        """
+        Returns all the items in their default order
+        :return: list(object)
+        """
+
+        return list(self._items)
+
+    def column(self, field):
+        """
+        Returns the sort keys of all the items for the given field
+        :param field: str
+        :return: list(tuple)
+        """
+
+        keys = self._columns.get(field)
+        if keys is None:
+            keys = self._columns[field] = [sort_key(self._value_fn(item, field)) for item in self._items]
+
+        return keys
+
+    def invalidate(self, field=None):
+        """
+        Removes the computed sort keys of the given field, so they are computed again the next time the field is used
+        :param field: str or None, if None, sort keys of all fields are removed
+        """
+
+        if field is None:
+            self._columns.clear()
+        else:
+            self._columns.pop(field, None)
+
+    def sorted_rows(self, field=None, descending=False, rows=None):
+        """
+        Returns the rows of the items sorted by the given field. Sort is stable, so items with the same value keep
+        their default order. Items with empty values are always sorted last
+        :param field: str or None, if None, rows keep their default order
+        :param descending: bool
+        :param rows: list(int) or None, rows to sort. If None, all rows are sorted
+        :return: list(int)
+        """
+
+        rows = list(range(len(self._items))) if rows is None else list(rows)
+        if field:
+            keys = self.column(field)
+            empty_rows = [row for row in rows if keys[row] == _EMPTY_KEY]
+            if empty_rows:
+                rows = [row for row in rows if keys[row] != _EMPTY_KEY]
+            rows.sort(key=keys.__getitem__, reverse=descending)
+            rows.extend(empty_rows)
+
+        return rows
+
+    def grouped(self, group_by=None, sort_by=None, rows=None):
+        """
+        Returns the items grouped and sorted by the given library values
+        :param group_by: list(str) or str or None, library group by value ("field:asc")
+        :param sort_by: list(str) or str or None, library sort by value ("field:asc")
+        :param rows: list(int) or None, rows of the items to return. If None, all items are returned
+        :return: OrderedDict(str, list(object)), items of each group. Items that are not grouped are stored in the
+            NO_GROUP group. Items with an empty group value are stored in the EMPTY_GROUP group, which is always the
+            last one
+        """
+
+        group_field, group_descending = parse_order(group_by)
+        sort_field, sort_descending = parse_order(sort_by)
+
+        rows = self.sorted_rows(sort_field, sort_descending, rows)
+        groups = OrderedDict()
+        if not group_field:
+            groups[NO_GROUP] = [self._items[row] for row in rows]
+            return groups
+
+        group_keys = self.column(group_field)
+        group_rows = OrderedDict()
+        for row in rows:
+            group_rows.setdefault(group_keys[row], list()).append(row)
+        empty_rows = group_rows.pop(_EMPTY_KEY, None)
+        for key in sorted(group_rows, reverse=group_descending):
+            group_items = [self._items[row] for row in group_rows[key]]
+            group_name = value_text(self._value_fn(group_items[0], group_field))
+            groups.setdefault(group_name, list()).extend(group_items)
+        if empty_rows:
+            groups.setdefault(EMPTY_GROUP, list()).extend(self._items[row] for row in empty_rows)
+
+        return groups
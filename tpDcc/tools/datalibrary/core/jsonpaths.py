@@ -0,0 +1,158 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to convert paths stored in JSON data between absolute and relative forms
+Unlike plain text replacement, only the strings (values and keys) that start with a path prefix are modified,
+so other strings that contain similar text are never corrupted
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import json
+
+try:
+    string_types = (str, unicode)
+except NameError:
+    string_types = (str,)
+
+
+def parent_paths(start):
+    """
+    Returns the three parent folder paths (ending with slash) used to convert paths relative to the given path
+    Paths are returned from deepest to shallowest
+    :param start: str
+    :return: tuple(str, str, str)
+    """
+
+    parents = list()
+    path = start.replace('\\', '/')
+    for _ in range(3):
+        path = os.path.dirname(path.rstrip('/')) if path not in ('', '/') else path
+        parent = path if path.endswith('/') else path + '/'
+        parents.append(parent)
+
+    return tuple(parents)
+
+
+def loads(text, start):
+    """
+    Deserializes the given JSON text converting relative paths to absolute ones while parsing
+    Strings are converted as objects are built, so data is traversed only once
+    :param text: str, JSON text
+    :param start: str, path of the file the text is read from
+    :return: object
+    """
+
+    if not has_relative_paths(text):
+        return json.loads(text)
+
+    _absolute = _absolute_fn(start)
+
+    def _convert(value):
+        if isinstance(value, string_types):
+            return _absolute(value)
+        elif isinstance(value, list):
+            return [_convert(item) for item in value]
+        return value
+
+    def _object_pairs_hook(pairs):
+        return dict((_convert(key), _convert(value)) for key, value in pairs)
+
+    data = json.loads(text, object_pairs_hook=_object_pairs_hook)
+
+    # Objects are already converted by the hook, only top level strings and lists need to be converted
+    return data if isinstance(data, dict) else _convert(data)
+
+
+def absolute_paths(data, start):
+    """
+    Returns a copy of the given JSON data where all relative paths are converted to absolute using the start path
+    :param data: object, JSON data
+    :param start: str, path of the file the data is read from
+    :return: object
+    """
+
+    return _walk(data, _absolute_fn(start))
+
+
+def relative_paths(data, start):
+    """
+    Returns a copy of the given JSON data where all paths located in one of the three parent folders of the start
+    path are converted to relative ones
+    :param data: object, JSON data
+    :param start: str, path of the file the data is written to
+    :return: object
+    """
+
+    parent1, parent2, parent3 = parent_paths(start)
+    replacements = ((parent1, '../'), (parent2, '../../'), (parent3, '../../../'))
+
+    def _relative(value):
+        if value.startswith(parent3):
+            for parent, prefix in replacements:
+                if value.startswith(parent):
+                    return prefix + value[len(parent):]
+        return value
+
+    return _walk(data, _relative)
+
+
+def has_relative_paths(text):
+    """
+    Returns whether the given serialized JSON text can contain relative paths
+    :param text: str
+    :return: bool
+    """
+
+    return '"../' in text
+
+
+def has_absolute_paths(text, start):
+    """
+    Returns whether the given serialized JSON text can contain paths that can be converted to relative ones
+    :param text: str
+    :param start: str, path of the file the data is written to
+    :return: bool
+    """
+
+    return json.dumps(parent_paths(start)[2])[1:-1] in text
+
+
+def _absolute_fn(start):
+    """
+    Internal function that returns a function that converts a relative path to absolute using the start path
+    :param start: str
+    :return: callable
+    """
+
+    parent1, parent2, parent3 = parent_paths(start)
+    replacements = (('../../../', parent3), ('../../', parent2), ('../', parent1))
+
+    def _absolute(value):
+        if value.startswith('../'):
+            for prefix, parent in replacements:
+                if value.startswith(prefix):
+                    return parent + value[len(prefix):]
+        return value
+
+    return _absolute
+
+
+def _walk(data, fn):
+    """
+    Internal function that returns a copy of the given JSON data with the given function applied to all strings
+    :param data: object
+    :param fn: callable
+    :return: object
+    """
+
+    if isinstance(data, dict):
+        return type(data)((_walk(key, fn), _walk(value, fn)) for key, value in data.items())
+    elif isinstance(data, list):
+        return [_walk(value, fn) for value in data]
+    elif isinstance(data, string_types):
+        return fn(data)
+
+    return data
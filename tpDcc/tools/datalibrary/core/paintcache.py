@@ -0,0 +1,171 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a least recently used cache with a maximum cost used to store pre-rendered items
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from collections import OrderedDict
+
+
+class PaintCache(object):
+    """
+    Class that stores values (usually pixmaps) until the sum of their costs exceeds the maximum cost. When that
+    happens, least recently used values are discarded
+    """
+
+    def __init__(self, max_cost, evict_fn=None):
+        """
+        :param max_cost: int
+        :param evict_fn: callable or None, function called with each value that is discarded or removed from the
+            cache, so the resources it holds can be released. It is not called for values returned by pop
+        """
+
+        self._max_cost = max_cost
+        self._evict_fn = evict_fn
+        self._cost = 0
+        self._values = OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def get(self, key, default=None):
+        """
+        Returns the value stored with the given key and marks it as the most recently used one
+        :param key: object
+        :param default: object
+        :return: object
+        """
+
+        entry = self._values.pop(key, None)
+        if entry is None:
+            return default
+        self._values[key] = entry
+
+        return entry[0]
+
+    def set(self, key, value, cost=1):
+        """
+        Stores the given value. Values with a cost bigger than the maximum cost are not stored
+        :param key: object
+        :param value: object
+        :param cost: int
+        :return: bool, True if the value was stored; False otherwise
+        """
+
+        entry = self._values.pop(key, None)
+        if entry is not None:
+            self._cost -= entry[1]
+            if entry[0] is not value:
+                self._evict(entry[0])
+        if cost > self._max_cost:
+            self._evict(value)
+            return False
+
+        self._values[key] = (value, cost)
+        self._cost += cost
+        self._discard_exceeding()
+
+        return True
+
+    def pop(self, key, default=None):
+        """
+        Removes the value stored with the given key and returns it
+        :param key: object
+        :param default: object
+        :return: object
+        """
+
+        entry = self._values.pop(key, None)
+        if entry is None:
+            return default
+        self._cost -= entry[1]
+
+        return entry[0]
+
+    def remove(self, key):
+        """
+        Removes the value stored with the given key
+        :param key: object
+        """
+
+        entry = self._values.pop(key, None)
+        if entry is not None:
+            self._cost -= entry[1]
+            self._evict(entry[0])
+
+    def keys(self):
+        """
+        Returns the keys of all stored values, from the least to the most recently used one
+        :return: list(object)
+        """
+
+        return list(self._values)
+
+    def clear(self):
+        """
+        Removes all stored values
+        """
+
+        values = [value for value, _ in self._values.values()]
+        self._values.clear()
+        self._cost = 0
+        for value in values:
+            self._evict(value)
+
+    def cost(self):
+        """
+        Returns the sum of the costs of all stored values
+        :return: int
+        """
+
+        return self._cost
+
+    def max_cost(self):
+        """
+        Returns the maximum cost of stored values
+        :return: int
+        """
+
+        return self._max_cost
+
+    def set_max_cost(self, max_cost):
+        """
+        Sets the maximum cost of stored values, discarding least recently used values if necessary
+        :param max_cost: int
+        """
+
+        self._max_cost = max_cost
+        self._discard_exceeding()
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _discard_exceeding(self):
+        """
+        Internal function that discards least recently used values until the cost does not exceed the maximum cost
+        """
+
+        while self._cost > self._max_cost:
+            _, (old_value, old_cost) = self._values.popitem(last=False)
+            self._cost -= old_cost
+            self._evict(old_value)
+
+    def _evict(self, value):
+        """
+        Internal function that releases the resources of a value that is no longer stored
+        :param value: object
+        """
+
+        if self._evict_fn is not None:
+            self._evict_fn(value)
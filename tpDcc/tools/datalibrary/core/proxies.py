@@ -0,0 +1,74 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to generate the downscaled proxy sequences used to preview items image sequences
+Proxy frames are small and stored in a single sprite sheet file, so hover previews open one file and read only a
+fraction of the bytes of the source frames
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+
+from Qt.QtCore import QSize, QBuffer, QIODevice, QByteArray
+
+from tpDcc.libs.python import path as path_utils
+
+from tpDcc.tools.datalibrary.core import consts, spritesheet, sequenceplayer
+
+PROXY_FRAME_FORMAT = 'JPG'
+PROXY_FRAME_QUALITY = 85
+
+
+def proxy_sequence_path(item_path):
+    """
+    Returns the path of the sprite sheet file where the proxy sequence of the given item is stored
+    :param item_path: str
+    :return: str
+    """
+
+    if not item_path:
+        return ''
+
+    item_folder = os.path.dirname(item_path) if os.path.isfile(item_path) else item_path
+
+    return path_utils.join_path(
+        item_folder, '{}{}'.format(consts.ITEM_DEFAULT_PROXY_SEQUENCE_NAME, spritesheet.EXTENSION))
+
+
+def create_proxy_sequence(source, target, size=None):
+    """
+    Writes downscaled versions of the frames of the source sequence into the target sprite sheet file
+    The sprite sheet replaces the target file only when all frames are written, so a proxy sequence is never left
+    half written
+    :param source: str, folder or sprite sheet file that contains the source frames
+    :param target: str, sprite sheet file where proxy frames are written
+    :param size: int or None, maximum width and height of proxy frames
+    :return: int, number of written frames
+    """
+
+    size = size or consts.ITEM_DEFAULT_PROXY_SIZE
+    writer = spritesheet.SpriteSheetWriter(target, PROXY_FRAME_FORMAT.lower())
+
+    try:
+        for i, frame_image in enumerate(sequenceplayer.read_frames(source, QSize(size, size))):
+            if frame_image.isNull():
+                raise IOError('Impossible to read frame {} of sequence "{}"'.format(i, source))
+            frame_data = QByteArray()
+            frame_buffer = QBuffer(frame_data)
+            frame_buffer.open(QIODevice.WriteOnly)
+            if not frame_image.save(frame_buffer, PROXY_FRAME_FORMAT, PROXY_FRAME_QUALITY):
+                raise IOError('Impossible to encode frame {} of sequence "{}"'.format(i, source))
+            frame_buffer.close()
+            writer.add_frame(frame_data.data(), frame_image.width(), frame_image.height())
+    except Exception:
+        writer.discard()
+        raise
+
+    if not writer.frame_count():
+        writer.discard()
+        return 0
+    writer.close()
+
+    return writer.frame_count()
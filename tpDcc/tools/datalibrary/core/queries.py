@@ -0,0 +1,85 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to evaluate library queries on items
+Queries use the library format: {'name': str, 'operator': 'and' or 'or', 'filters': [(field, condition, value)]}
+"""
+
+from __future__ import print_function, division, absolute_import
+
+try:
+    string_types = (str, unicode)
+except NameError:
+    string_types = (str,)
+
+CONDITIONS = ('is', 'not', 'contains', 'not_contains', 'startswith')
+
+
+def query_key(query):
+    """
+    Returns a hashable key that identifies the filters of the given query
+    :param query: dict
+    :return: tuple
+    """
+
+    filters = tuple(tuple(query_filter) for query_filter in query.get('filters') or list())
+
+    return query.get('operator', 'and'), filters
+
+
+def match_filter(item_value, condition, value):
+    """
+    Returns whether or not the given item value matches the given filter condition. Texts are compared without taking
+    into account the case. Empty item values only match negative conditions ("not" and "not_contains"), so items
+    without a value are not hidden by filters that exclude values
+    :param item_value: object
+    :param condition: str, one of the CONDITIONS
+    :param value: object
+    :return: bool
+    """
+
+    if not item_value:
+        return condition in ('not', 'not_contains')
+
+    if isinstance(value, string_types):
+        value = value.lower()
+    if isinstance(item_value, string_types):
+        item_value = item_value.lower()
+
+    if condition == 'contains':
+        return value in item_value
+    elif condition == 'not_contains':
+        return value not in item_value
+    elif condition == 'is':
+        return value == item_value
+    elif condition == 'not':
+        return value != item_value
+    elif condition == 'startswith':
+        return item_value.startswith(value)
+
+    return False
+
+
+def match_query(item, query, value_fn):
+    """
+    Returns whether or not the given item matches the given query. Queries without filters match all items
+    :param item: object
+    :param query: dict
+    :param value_fn: callable, function that receives an item and a field name and returns the item field value
+    :return: bool
+    """
+
+    operator, filters = query_key(query)
+    if not filters:
+        return True
+
+    match = False
+    for field, condition, value in filters:
+        match = match_filter(value_fn(item, field), condition, value)
+        if operator == 'or' and match:
+            break
+        if operator == 'and' and not match:
+            break
+
+    return match
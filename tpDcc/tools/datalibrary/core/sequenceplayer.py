@@ -0,0 +1,418 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains image sequence player used to play item thumbnails sequences
+Sequences can be stored as a folder of images or as a sprite sheet file
+Frames are decoded in background threads at the size they are displayed and stored in a bounded ring buffer of
+upcoming frames. The UI thread never waits for a frame: if a frame is not decoded in time it is dropped
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+
+from Qt.QtCore import Qt, Signal, QObject, QSize, QTimer, QBuffer, QIODevice, QByteArray, QRunnable, QThreadPool
+from Qt.QtGui import QIcon, QPixmap, QImageReader
+
+from tpDcc.tools.datalibrary.core import framebuffer, spritesheet
+
+
+def list_frames(path):
+    """
+    Returns the sorted paths of the image files contained in the given folder
+    :param path: str
+    :return: list(str)
+    """
+
+    if not path or not os.path.isdir(path):
+        return list()
+
+    extensions = SequencePlayer.image_extensions()
+    frames = list()
+    for file_name in sorted(os.listdir(path)):
+        if os.path.splitext(file_name)[-1].lower() in extensions:
+            frames.append(os.path.join(path, file_name))
+
+    return frames
+
+
+def read_image(path=None, size=None, data=None):
+    """
+    Decodes an image from a file or from encoded data. Images bigger than given size are decoded directly at that
+    size when the image format supports it
+    :param path: str or None, image file path
+    :param size: QSize or None, maximum size of the decoded image
+    :param data: bytes or None, encoded image data. If given, path is ignored
+    :return: QImage, null image if the image cannot be decoded
+    """
+
+    image_buffer = None
+    if data is not None:
+        image_buffer = QBuffer()
+        image_buffer.setData(QByteArray(data))
+        image_buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(image_buffer)
+    else:
+        reader = QImageReader(path)
+
+    if size:
+        source_size = reader.size()
+        if source_size.isValid() and (source_size.width() > size.width() or source_size.height() > size.height()):
+            reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatio))
+
+    return reader.read()
+
+
+def read_frames(path, size=None):
+    """
+    Decodes one by one the frames of the given folder or sprite sheet file
+    :param path: str
+    :param size: QSize or None, maximum size of the decoded frames
+    :return: generator(QImage)
+    """
+
+    if spritesheet.is_sprite_sheet(path):
+        with spritesheet.SpriteSheet(path) as sheet:
+            for frame in range(sheet.frame_count()):
+                yield read_image(size=size, data=sheet.frame_data(frame))
+    else:
+        for frame_path in list_frames(path):
+            yield read_image(frame_path, size=size)
+
+
+class _FrameDecoderSignals(QObject, object):
+    decoded = Signal(int, int, object)
+
+
+class _FrameDecoder(QRunnable, object):
+    """
+    Internal class that decodes a frame of a sequence in a background thread
+    """
+
+    def __init__(self, signals, generation, frame, path, size=None, sheet=None):
+        super(_FrameDecoder, self).__init__()
+
+        self._signals = signals
+        self._generation = generation
+        self._frame = frame
+        self._path = path
+        self._size = size
+        self._sheet = sheet
+
+    def run(self):
+        """
+        Overrides base QRunnable run function
+        Decodes the frame. Frames stored in sprite sheets are read from the memory mapped file
+        """
+
+        try:
+            data = self._sheet.frame_data(self._frame) if self._sheet else None
+        except IOError:
+            # Player was closed while the frame was waiting to be decoded
+            return
+
+        self._signals.decoded.emit(self._generation, self._frame, read_image(self._path, self._size, data))
+
+
+class SequencePlayer(QObject, object):
+    """
+    Class that plays a folder of images or a sprite sheet file without blocking the UI thread
+    It exposes the same API as image.ImageSequence used by item views
+    """
+
+    frameChanged = Signal(int)
+
+    DEFAULT_FPS = 24
+    DEFAULT_BUFFER_SIZE = 12
+    MAX_PENDING_FRAMES = 4
+
+    THREAD_POOL = QThreadPool()
+    THREAD_POOL.setMaxThreadCount(max(2, QThreadPool.globalInstance().maxThreadCount() // 2))
+
+    _IMAGE_EXTENSIONS = None
+
+    def __init__(self, path, size=None, fps=None, buffer_size=None, parent=None):
+        super(SequencePlayer, self).__init__(parent)
+
+        self._path = path
+        self._sheet = spritesheet.SpriteSheet(path) if spritesheet.is_sprite_sheet(path) else None
+        self._frames = list(range(self._sheet.frame_count())) if self._sheet else list_frames(path)
+        self._size = QSize(size) if size else None
+        self._buffer = framebuffer.FrameRingBuffer(len(self._frames), buffer_size or self.DEFAULT_BUFFER_SIZE)
+        self._pending = set()
+        self._generation = 0
+        self._position = 0
+        self._displayed_frame = -1
+        self._pixmap = None
+        self._dropped_frames = 0
+
+        self._signals = _FrameDecoderSignals()
+        self._signals.decoded.connect(self._on_frame_decoded)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_timeout)
+        self.set_fps(fps or self.DEFAULT_FPS)
+
+    # =================================================================================================================
+    # CLASS METHODS
+    # =================================================================================================================
+
+    @classmethod
+    def image_extensions(cls):
+        """
+        Returns the extensions of the image files that can be decoded
+        :return: set(str)
+        """
+
+        if cls._IMAGE_EXTENSIONS is None:
+            extensions = set()
+            for image_format in QImageReader.supportedImageFormats():
+                extensions.add('.{}'.format(bytes(image_format).decode('ascii', 'ignore').lower()))
+            cls._IMAGE_EXTENSIONS = extensions
+
+        return cls._IMAGE_EXTENSIONS
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def dirname(self):
+        """
+        Returns the folder or the sprite sheet file that contains the frames
+        :return: str
+        """
+
+        return self._path
+
+    def frames(self):
+        """
+        Returns all the frames: frame file paths for folders and frame numbers for sprite sheets
+        :return: list(str or int)
+        """
+
+        return list(self._frames)
+
+    def first_frame(self):
+        """
+        Returns the path of the first frame. Frames stored in sprite sheets return the sprite sheet path
+        :return: str
+        """
+
+        if not self._frames:
+            return ''
+
+        return self._path if self._sheet else self._frames[0]
+
+    def current_filename(self):
+        """
+        Returns the path of the current frame. Frames stored in sprite sheets return the sprite sheet path
+        :return: str
+        """
+
+        if not self._frames:
+            return ''
+
+        return self._path if self._sheet else self._frames[self._position]
+
+    def frame_count(self):
+        """
+        Returns the number of frames
+        :return: int
+        """
+
+        return len(self._frames)
+
+    def frameCount(self):
+        return self.frame_count()
+
+    def current_frame_number(self):
+        """
+        Returns the playback position. Playback position advances even if frames are dropped
+        :return: int
+        """
+
+        return self._position
+
+    def percent(self):
+        """
+        Returns current playback position as percentage of the sequence
+        :return: float
+        """
+
+        frame_count = self.frame_count()
+
+        return float(self._position) / (frame_count - 1) if frame_count > 1 else 0.0
+
+    def current_pixmap(self):
+        """
+        Returns the last displayed frame
+        :return: QPixmap
+        """
+
+        return self._pixmap or QPixmap()
+
+    def current_icon(self):
+        """
+        Returns the last displayed frame as icon
+        :return: QIcon
+        """
+
+        return QIcon(self.current_pixmap())
+
+    def dropped_frames(self):
+        """
+        Returns the number of frames that were not displayed because they were not decoded in time
+        :return: int
+        """
+
+        return self._dropped_frames
+
+    def memory_cost(self):
+        """
+        Returns the number of bytes used by the decoded frames
+        :return: int
+        """
+
+        return sum(pixmap.width() * pixmap.height() * 4 for pixmap in self._buffer.values())
+
+    def fps(self):
+        """
+        Returns the number of frames played per second
+        :return: int
+        """
+
+        return self._fps
+
+    def set_fps(self, fps):
+        """
+        Sets the number of frames played per second
+        :param fps: int
+        """
+
+        self._fps = fps
+        self._timer.setInterval(int(1000.0 / fps))
+
+    def start(self):
+        """
+        Starts playback
+        """
+
+        if not self._frames:
+            return
+
+        self._timer.start()
+        self._prefetch()
+
+    def pause(self):
+        """
+        Pauses playback, keeping decoded frames
+        """
+
+        self._timer.stop()
+
+    def stop(self):
+        """
+        Stops playback and releases decoded frames. Frames being decoded are ignored when they finish
+        """
+
+        self._timer.stop()
+        self._generation += 1
+        self._pending.clear()
+        self._buffer.clear()
+
+    def close(self):
+        """
+        Stops playback and releases the sprite sheet file, so it can be replaced or removed
+        The player can not be started again after it is closed
+        """
+
+        self.stop()
+        self._frames = list()
+        if self._sheet:
+            self._sheet.close()
+
+    def jump_to_frame(self, frame):
+        """
+        Moves playback to the given frame. The frame is displayed as soon as it is decoded
+        :param frame: int
+        """
+
+        if not self._frames:
+            return
+
+        self._position = int(frame) % len(self._frames)
+        self._show(self._position)
+        self._prefetch()
+
+    def jumpToFrame(self, frame):
+        self.jump_to_frame(frame)
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _show(self, frame):
+        """
+        Internal function that displays the given frame if it is already decoded
+        :param frame: int
+        :return: bool, True if the frame is decoded; False otherwise
+        """
+
+        pixmap = self._buffer.get(frame)
+        if pixmap is None:
+            return False
+
+        if frame != self._displayed_frame:
+            self._pixmap = pixmap
+            self._displayed_frame = frame
+            self.frameChanged.emit(frame)
+
+        return True
+
+    def _prefetch(self):
+        """
+        Internal function that starts decoding the upcoming frames that are not decoded yet
+        """
+
+        available = self.MAX_PENDING_FRAMES - len(self._pending)
+        if available <= 0:
+            return
+
+        for frame in self._buffer.missing(self._position, self._pending)[:available]:
+            self._pending.add(frame)
+            frame_path = None if self._sheet else self._frames[frame]
+            self.THREAD_POOL.start(
+                _FrameDecoder(self._signals, self._generation, frame, frame_path, self._size, self._sheet))
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_timeout(self):
+        """
+        Internal callback function that is called when the next frame must be displayed
+        """
+
+        self._position = (self._position + 1) % len(self._frames)
+        if not self._show(self._position):
+            self._dropped_frames += 1
+        self._prefetch()
+
+    def _on_frame_decoded(self, generation, frame, image):
+        """
+        Internal callback function that is called in the UI thread when a frame is decoded
+        :param generation: int
+        :param frame: int
+        :param image: QImage
+        """
+
+        if generation != self._generation:
+            return
+
+        self._pending.discard(frame)
+        # Frames that cannot be read are stored as empty pixmaps, so they are not decoded again and again
+        self._buffer.put(frame, QPixmap.fromImage(image), self._position)
+        if frame == self._position:
+            self._show(frame)
+        self._prefetch()
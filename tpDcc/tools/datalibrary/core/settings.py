@@ -8,6 +8,8 @@ Module that contains utils functions to handle persistent wigdet values settings
 from __future__ import print_function, division, absolute_import
 
 import os
+import atexit
+import threading
 
 from tpDcc.managers import libs
 from tpDcc.libs.python import path as path_utils
@@ -15,7 +17,16 @@ from tpDcc.libs.python import path as path_utils
 from tpDcc.tools.datalibrary.core import utils
 
 
-_SETTINGS = dict()
+_SETTINGS = None
+_DIRTY = False
+_TIMER = None
+_FLUSH_COUNT = 0
+_PENDING_SAVES = 0
+_MERGED_SAVES = 0
+_LOCK = threading.RLock()
+
+# Number of seconds settings changes are kept in memory before writing them to disk
+SAVE_DELAY = 0.5
 
 
 def path():
@@ -32,12 +43,15 @@ def path():
 def read():
     """
     Returns widget related settings
+    Settings are read from disk only once, after that in-memory settings are the authoritative ones
     :return: dict
     """
 
     global _SETTINGS
-    if not _SETTINGS:
-        _SETTINGS = utils.read_json(path())
+
+    with _LOCK:
+        if _SETTINGS is None:
+            _SETTINGS = utils.read_json(path())
 
     return _SETTINGS
 
@@ -45,12 +59,72 @@ def read():
 def save(data):
     """
     Saves the given data dictionary to settings
+    Changes are applied in memory immediately and written to disk after SAVE_DELAY seconds, so consecutive
+    changes are written with a single disk write
     :param data: dict
     """
 
-    global _SETTINGS
-    _SETTINGS = dict()
-    utils.update_json(path(), data)
+    global _DIRTY, _TIMER, _PENDING_SAVES
+
+    with _LOCK:
+        utils.update(read(), data)
+        _DIRTY = True
+        _PENDING_SAVES += 1
+        if _TIMER is None:
+            _TIMER = threading.Timer(SAVE_DELAY, flush)
+            _TIMER.daemon = True
+            _TIMER.start()
+
+
+def flush():
+    """
+    Writes to disk settings changes that are not stored yet
+    :return: bool, True if settings were written; False otherwise
+    """
+
+    global _DIRTY, _TIMER, _FLUSH_COUNT, _PENDING_SAVES, _MERGED_SAVES
+
+    with _LOCK:
+        if _TIMER is not None:
+            _TIMER.cancel()
+            _TIMER = None
+        if not _DIRTY:
+            return False
+        utils.update_json(path(), _SETTINGS)
+        _DIRTY = False
+        _FLUSH_COUNT += 1
+        # All the saves done since the previous write are stored with a single write
+        _MERGED_SAVES += max(0, _PENDING_SAVES - 1)
+        _PENDING_SAVES = 0
+
+    return True
+
+
+def is_dirty():
+    """
+    Returns whether there are settings changes that are not written to disk yet
+    :return: bool
+    """
+
+    return _DIRTY
+
+
+def flush_count():
+    """
+    Returns the number of times settings have been written to disk
+    :return: int
+    """
+
+    return _FLUSH_COUNT
+
+
+def saved_flush_count():
+    """
+    Returns the number of disk writes avoided because several settings changes were written at once
+    :return: int
+    """
+
+    return _MERGED_SAVES
 
 
 def get(key, default=None):
@@ -79,6 +153,16 @@ def reset():
     Removes and resets the item settings
     """
 
-    global _SETTINGS
-    _SETTINGS = dict()
-    utils.remove_path(path())
+    global _SETTINGS, _DIRTY, _TIMER, _PENDING_SAVES
+
+    with _LOCK:
+        if _TIMER is not None:
+            _TIMER.cancel()
+            _TIMER = None
+        _SETTINGS = None
+        _DIRTY = False
+        _PENDING_SAVES = 0
+        utils.remove_path(path())
+
+
+atexit.register(flush)
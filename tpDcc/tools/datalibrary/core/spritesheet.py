@@ -0,0 +1,250 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the sprite sheet format used to store image sequences in a single file
+A sprite sheet file stores the encoded frames one after the other followed by a small index with the location and
+size of each frame. Files are memory mapped when read, so any frame can be accessed without opening other files and
+only the bytes of the frames that are played are read from disk
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import json
+import mmap
+import struct
+
+MAGIC = b'TPSPRITE'
+VERSION = 1
+EXTENSION = '.spritesheet'
+
+# Trailer stored at the end of the file: index offset, index size, format version and magic
+_TRAILER = struct.Struct('<QQI8s')
+
+
+def is_sprite_sheet(path):
+    """
+    Returns whether or not given path is a sprite sheet file
+    :param path: str
+    :return: bool
+    """
+
+    return bool(path) and path.lower().endswith(EXTENSION) and os.path.isfile(path)
+
+
+def extract_frame(path, frame, target):
+    """
+    Writes the given frame of a sprite sheet into an image file
+    :param path: str, sprite sheet file path
+    :param frame: int
+    :param target: str, image file path without extension. Extension of the frames image format is added
+    :return: str, image file path
+    """
+
+    with SpriteSheet(path) as sheet:
+        target = '{}.{}'.format(target, sheet.image_format())
+        with open(target, 'wb') as frame_file:
+            frame_file.write(sheet.frame_data(frame))
+
+    return target
+
+
+class SpriteSheetWriter(object):
+    """
+    Class that writes frames into a new sprite sheet file
+    Frames are written into a temporary file that replaces the target file when the writer is closed, so readers
+    never find a half written sprite sheet
+    """
+
+    def __init__(self, path, image_format='jpg'):
+        self._path = path
+        self._temp_path = '{}.tmp'.format(path)
+        self._image_format = image_format
+        self._frames = list()
+        self._file = open(self._temp_path, 'wb')
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def path(self):
+        """
+        Returns the path of the sprite sheet file
+        :return: str
+        """
+
+        return self._path
+
+    def frame_count(self):
+        """
+        Returns the number of written frames
+        :return: int
+        """
+
+        return len(self._frames)
+
+    def add_frame(self, data, width, height):
+        """
+        Appends an encoded frame to the sprite sheet
+        :param data: bytes, encoded image data
+        :param width: int
+        :param height: int
+        """
+
+        data = bytes(data)
+        self._file.write(data)
+        self._frames.append([self._offset, len(data), int(width), int(height)])
+        self._offset += len(data)
+
+    def close(self):
+        """
+        Writes the index of the frames and moves the sprite sheet to its final location
+        """
+
+        index = json.dumps({'format': self._image_format, 'frames': self._frames}, separators=(',', ':'))
+        index = index.encode('utf-8')
+        self._file.write(index)
+        self._file.write(_TRAILER.pack(self._offset, len(index), VERSION, MAGIC))
+        self._file.close()
+
+        if hasattr(os, 'replace'):
+            os.replace(self._temp_path, self._path)
+        elif os.name != 'nt':
+            os.rename(self._temp_path, self._path)
+        else:
+            # Windows Python 2 rename does not overwrite existing files
+            if os.path.isfile(self._path):
+                os.remove(self._path)
+            os.rename(self._temp_path, self._path)
+
+    def discard(self):
+        """
+        Closes the writer without creating the sprite sheet
+        """
+
+        self._file.close()
+        if os.path.isfile(self._temp_path):
+            os.remove(self._temp_path)
+
+
+class SpriteSheet(object):
+    """
+    Class that gives random access to the frames stored in a sprite sheet file
+    Reading frames is thread safe, so frames can be decoded in background threads
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._map = None
+        with open(path, 'rb') as sheet_file:
+            try:
+                self._map = mmap.mmap(sheet_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise IOError('Sprite sheet "{}" is empty'.format(path))
+
+        if len(self._map) < len(MAGIC) + _TRAILER.size or self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise IOError('File "{}" is not a valid sprite sheet'.format(path))
+        index_offset, index_size, version, magic = _TRAILER.unpack(self._map[-_TRAILER.size:])
+        if magic != MAGIC or version > VERSION:
+            self.close()
+            raise IOError('Sprite sheet "{}" is corrupted or was written by a newer version'.format(path))
+
+        index = json.loads(self._map[index_offset:index_offset + index_size].decode('utf-8'))
+        self._image_format = index.get('format', '')
+        self._frames = [tuple(frame) for frame in index.get('frames', list())]
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def path(self):
+        """
+        Returns the path of the sprite sheet file
+        :return: str
+        """
+
+        return self._path
+
+    def image_format(self):
+        """
+        Returns the image format used to encode the frames
+        :return: str
+        """
+
+        return self._image_format
+
+    def frame_count(self):
+        """
+        Returns the number of frames
+        :return: int
+        """
+
+        return len(self._frames)
+
+    def frame_size(self, frame):
+        """
+        Returns the width and height of the given frame
+        :param frame: int
+        :return: tuple(int, int)
+        """
+
+        return self._frames[frame][2:4]
+
+    def frame_data(self, frame):
+        """
+        Returns the encoded data of the given frame
+        :param frame: int
+        :return: bytes
+        """
+
+        offset, size = self._frames[frame][:2]
+        sheet_map = self._map
+        try:
+            if sheet_map is None:
+                raise ValueError('mmap closed')
+            return sheet_map[offset:offset + size]
+        except ValueError:
+            # The sheet can be closed by the UI thread while a frame is read in a background thread
+            raise IOError('Sprite sheet "{}" is closed'.format(self._path))
+
+    def close(self):
+        """
+        Releases the memory map of the file. Open maps prevent replacing or removing the file on Windows
+        """
+
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def is_closed(self):
+        """
+        Returns whether or not the memory map of the file was released
+        :return: bool
+        """
+
+        return self._map is None
@@ -0,0 +1,90 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tasks used to run slow operations (file copies, image encoding, ...) without blocking the UI
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import threading
+
+
+class BackgroundTask(object):
+    """
+    Class that runs a function in a background thread and stores its result, so it can be retrieved later
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._result = None
+        self._exception = None
+        self._done = threading.Event()
+        self._thread = None
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def start(self):
+        """
+        Starts running the function in a background thread
+        :return: BackgroundTask, the task itself
+        """
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+        return self
+
+    def is_done(self):
+        """
+        Returns whether or not the function finished
+        :return: bool
+        """
+
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Waits until the function finishes
+        :param timeout: float or None, maximum number of seconds to wait. If None, waits until the function finishes
+        :return: bool, True if the function finished; False if the timeout expired
+        """
+
+        return self._done.wait(timeout)
+
+    def result(self, timeout=None):
+        """
+        Waits until the function finishes and returns its result. Exceptions raised by the function are raised again
+        :param timeout: float or None, maximum number of seconds to wait. If None, waits until the function finishes
+        :return: object
+        """
+
+        if not self._done.wait(timeout):
+            task_name = getattr(self._fn, '__name__', self._fn)
+            raise RuntimeError('Task "{}" did not finish in {} seconds'.format(task_name, timeout))
+        if self._exception is not None:
+            raise self._exception
+
+        return self._result
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _run(self):
+        """
+        Internal function that runs the function in the background thread
+        """
+
+        try:
+            self._result = self._fn(*self._args, **self._kwargs)
+        except Exception as exc:
+            self._exception = exc
+        finally:
+            self._done.set()
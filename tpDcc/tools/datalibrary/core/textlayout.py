@@ -0,0 +1,86 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a text layout cache shared by all library items
+Font metrics, text widths and elided texts are computed once and reused by items painting and column autosizing
+Fonts are identified by their key, which includes the pixel size, so DPI changes produce new cache entries
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from Qt.QtCore import Qt
+from Qt.QtGui import QFontMetrics
+
+# Maximum number of text widths and elided texts stored before the cache is cleared
+MAX_CACHE_SIZE = 50000
+
+_METRICS_CACHE = dict()
+_WIDTH_CACHE = dict()
+_ELIDED_CACHE = dict()
+
+
+def font_metrics(font):
+    """
+    Returns cached font metrics for the given font
+    :param font: QFont
+    :return: QFontMetrics
+    """
+
+    font_key = font.key()
+    metrics = _METRICS_CACHE.get(font_key)
+    if metrics is None:
+        metrics = _METRICS_CACHE[font_key] = QFontMetrics(font)
+
+    return metrics
+
+
+def text_width(text, font):
+    """
+    Returns the width of the given text painted with the given font
+    :param text: str
+    :param font: QFont
+    :return: int
+    """
+
+    if not text:
+        return 0
+
+    key = (text, font.key())
+    width = _WIDTH_CACHE.get(key)
+    if width is None:
+        if len(_WIDTH_CACHE) >= MAX_CACHE_SIZE:
+            _WIDTH_CACHE.clear()
+        width = _WIDTH_CACHE[key] = font_metrics(font).width(text)
+
+    return width
+
+
+def elided_text(text, font, width, mode=Qt.ElideMiddle):
+    """
+    Returns the given text elided to fit in the given width
+    :param text: str
+    :param font: QFont
+    :param width: int
+    :param mode: Qt.TextElideMode
+    :return: str
+    """
+
+    key = (text, font.key(), width, mode)
+    elided = _ELIDED_CACHE.get(key)
+    if elided is None:
+        if len(_ELIDED_CACHE) >= MAX_CACHE_SIZE:
+            _ELIDED_CACHE.clear()
+        elided = _ELIDED_CACHE[key] = font_metrics(font).elidedText(text, mode, width)
+
+    return elided
+
+
+def clear():
+    """
+    Clears all cached text layouts
+    """
+
+    _METRICS_CACHE.clear()
+    _WIDTH_CACHE.clear()
+    _ELIDED_CACHE.clear()
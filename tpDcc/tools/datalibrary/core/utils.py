@@ -8,18 +8,56 @@ Module that contains utils functions used by tpDcc-tools-datalibrary
 from __future__ import print_function, division, absolute_import
 
 import os
+import re
+import copy
 import json
+import uuid
+import atexit
 import locale
 import shutil
+import string
 import logging
+import marshal
 import tempfile
+import threading
 from collections import OrderedDict, Mapping
 
 from tpDcc.managers import configs
 from tpDcc.libs.python import osplatform, path as path_utils
 
+from tpDcc.tools.datalibrary.core import jsonpaths, filecopy
+
 LOGGER = logging.getLogger('tpDcc-tools-datalibrary')
 
+# fsync policies used when writing files to disk:
+#   none: data is flushed but it is up to the OS when data is stored on disk (fastest)
+#   file: file contents are stored on disk before replacing the old file
+#   full: file contents and the directory entry are stored on disk (safest, slow on network file systems)
+FSYNC_NONE = 'none'
+FSYNC_FILE = 'file'
+FSYNC_FULL = 'full'
+DEFAULT_FSYNC_POLICY = FSYNC_NONE
+
+# Parsed JSON files, stored as {path: ((mtime, size), marshalled data)}
+_JSON_CACHE = dict()
+# JSON updates not written to disk yet, stored as {path: [data, timer, version]}. Version increases each time another
+# update is merged, so writers know whether the update changed while it was written
+_PENDING_JSON_UPDATES = dict()
+# Locks that serialize reading, merging and writing each JSON file, stored as {path: lock}
+_JSON_FILE_LOCKS = dict()
+_JSON_LOCK = threading.RLock()
+
+# Format path fields that depend on the path being formatted
+_PATH_FORMAT_FIELDS = ('name', 'path', 'root', 'dirname', 'extension')
+# Maximum number of format strings kept compiled and resolved. Least recently used ones are discarded first
+FORMAT_CACHE_SIZE = 1024
+# Compiled format strings, stored as {format string: (normalized format string, referenced field names)}
+_FORMAT_TEMPLATES = OrderedDict()
+# Resolved format strings that only reference invariant fields, stored as {format string: resolved path}
+_FORMAT_RESULTS = OrderedDict()
+# Format fields that do not change during a session (user, temp, home and local folders)
+_FORMAT_INVARIANTS = dict()
+
 
 def absolute_path(data, start):
     """
@@ -66,10 +104,11 @@ def update(data, other):
     return data
 
 
-def read(path):
+def read(path, absolute=True):
     """
     Returns the contents of the given file
     :param path: str
+    :param absolute: bool, Whether to convert relative paths in the contents to absolute ones or not
     :return: str
     """
 
@@ -78,84 +117,122 @@ def read(path):
     if os.path.isfile(path):
         with open(path) as f:
             data = f.read() or data
-    data = absolute_path(data, path)
+    if absolute:
+        data = absolute_path(data, path)
 
     return data
 
 
-def write(path, data):
+def write(path, data, relative=True, fsync=None):
     """
     Writes the given data to the given file on disk
+    Data is written into an unique temporary file in the same directory that atomically replaces the given file
     :param path: str
     :param data: str
+    :param relative: bool, Whether to convert paths in data relative to the given path or not
+    :param fsync: str or None, fsync policy to use (FSYNC_NONE, FSYNC_FILE or FSYNC_FULL). If not given, the
+        default policy (DEFAULT_FSYNC_POLICY) will be used
     """
 
     path = path_utils.normalize_path(path)
-    data = path_utils.get_relative_path(data, path)
-
-    tmp = path + '.tmp'
-    bak = path + '.bak'
+    fsync = fsync or DEFAULT_FSYNC_POLICY
+    if relative and _has_relative_paths(data, path):
+        data = path_utils.get_relative_path(data, path)
 
     dirname = os.path.dirname(path)
-    if not os.path.exists(dirname):
+    if not os.path.isdir(dirname):
         os.makedirs(dirname)
 
-    if os.path.exists(tmp):
-        try:
-            os.remove(tmp)
-        except Exception:
-            pass
-        if os.path.exists(tmp):
-            msg = 'The path is locked for writing and cannot be accessed {}'.format(tmp)
-            raise IOError(msg)
-
+    # Temporary file name is unique so concurrent writers (other users of a shared library) never clash
+    tmp = '{}.{}.tmp'.format(path, uuid.uuid4().hex[:12])
+    file_handle = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
     try:
-        with open(tmp, 'w') as f:
+        with os.fdopen(file_handle, 'w') as f:
             f.write(data)
             f.flush()
-
-        if os.path.exists(bak):
-            os.remove(bak)
-        if os.path.exists(path):
-            os.rename(path, bak)
-        if os.path.exists(tmp):
-            os.rename(tmp, path)
-        if os.path.exists(path) and os.path.exists(bak):
-            os.remove(bak)
+            if fsync in (FSYNC_FILE, FSYNC_FULL):
+                os.fsync(f.fileno())
+        _replace(tmp, path)
     except Exception:
-        if os.path.exists(tmp):
-            try:
-                os.remove(tmp)
-            except Exception:
-                pass
-        if not os.path.exists(path) and os.path.exists(bak):
-            os.rename(bak, path)
-
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
         raise
 
+    if fsync == FSYNC_FULL:
+        _fsync_directory(dirname)
 
-def update_json(path, data):
+
+def update_json(path, data, delay=0):
     """
     Update a JSON file with the given data
+    If a delay is given, the update is not written immediately. All the updates done to the same file within the delay
+    window are merged and written to disk at once.
     :param path: str
     :param data: dict
+    :param delay: float, number of seconds to wait before writing the update to disk
     """
 
-    data_ = read_json(path)
-    data_ = update(data_, data)
-    save_json(path, data_)
+    path = path_utils.normalize_path(path)
+    if not delay:
+        _write_json_update(path, data)
+        return
+
+    with _JSON_LOCK:
+        pending = _PENDING_JSON_UPDATES.get(path)
+        if pending:
+            update(pending[0], copy.deepcopy(data))
+            pending[2] += 1
+            return
+        timer = threading.Timer(delay, flush_json, args=(path,))
+        timer.daemon = True
+        _PENDING_JSON_UPDATES[path] = [copy.deepcopy(data), timer, 0]
+    timer.start()
+
+
+def flush_json(path=None):
+    """
+    Writes to disk pending JSON updates
+    :param path: str or None, JSON file to flush. If not given, all pending updates will be written.
+    :return: int, number of files written
+    """
+
+    if path:
+        paths = [path_utils.normalize_path(path)]
+    else:
+        with _JSON_LOCK:
+            paths = list(_PENDING_JSON_UPDATES.keys())
 
+    flushed = 0
+    for json_path in paths:
+        try:
+            if _write_json_update(json_path):
+                flushed += 1
+        except Exception:
+            LOGGER.exception('Cannot write pending updates to "{}"'.format(json_path))
 
-def read_json(path):
+    return flushed
+
+
+def read_json(path, use_cache=True):
     """
     Reads the given JSON file and deserialize it to a Python object
+    Parsed contents are cached and only read again if file modification time or size changes. Returned data is
+    always a new copy, so it can be modified without affecting the cache.
     :param path: str
+    :param use_cache: bool
     :return: dict
     """
 
     path = path_utils.normalize_path(path)
-    data = read(path) or '{}'
-    data = json.loads(data)
+    data = _read_json_file(path, use_cache=use_cache)
+
+    # Updates not written to disk yet must be visible when reading the file
+    with _JSON_LOCK:
+        pending = _PENDING_JSON_UPDATES.get(path)
+        if pending:
+            data = update(data, copy.deepcopy(pending[0]))
 
     return data
 
@@ -168,9 +245,11 @@ def save_json(path, data):
     """
 
     path = path_utils.normalize_path(path)
-    data = OrderedDict(sorted(data.items(), key=lambda t: t[0]))
-    data = json.dumps(data, indent=4)
-    write(path, data)
+    with _json_file_lock(path):
+        _write_json_file(path, data)
+
+        # Written data replaces whole file contents, so pending updates are discarded
+        _pop_pending_update(path)
 
 
 def replace_json(path, old, new, count=-1):
@@ -186,6 +265,7 @@ def replace_json(path, old, new, count=-1):
     old = str(old.encode("unicode_escape"))
     new = str(new.encode("unicode_escape"))
 
+    flush_json(path)
     data = read(path) or "{}"
     data = data.replace(old, new, count)
     data = json.loads(data)
@@ -198,62 +278,69 @@ def replace_json(path, old, new, count=-1):
 def format_path(format_string, path='', **kwargs):
     """
     Resolves given path by replacing necessary info with proper data
+    Format strings are parsed only once and only the fields they reference are resolved. Format strings that only
+    reference invariant fields (user, temp, home and local) are resolved only once
     :param format_string: str
     :param path: str
     :param kwargs:
     :return: str
     """
 
-    dirname, name, extension = path_utils.split_path(path)
-    encoding = locale.getpreferredencoding()
-
-    temp = tempfile.gettempdir()
-    if temp:
-        try:
-            temp = temp.decode(encoding)
-        except Exception:
-            pass
-
-    username = osplatform.get_user(lower=True)
-    if username:
-        try:
-            username = username.decode(encoding)
-        except Exception:
-            pass
-
-    local = os.getenv('APPDATA') or os.getenv('HOME')
-    if local:
-        try:
-            local = local.decode(encoding)
-        except Exception:
-            pass
+    normalized_string, fields = _compile_format_path(format_string)
+
+    invariants = _format_invariants()
+    if fields.issubset(invariants):
+        resolve_path = _format_cache_get(_FORMAT_RESULTS, format_string)
+        if resolve_path is None:
+            resolve_path = path_utils.clean_path(normalized_string.format(**invariants))
+            _format_cache_set(_FORMAT_RESULTS, format_string, resolve_path)
+        return resolve_path
+
+    format_dict = dict()
+    for field in fields:
+        if field in _PATH_FORMAT_FIELDS:
+            dirname, name, extension = path_utils.split_path(path)
+            format_dict.update(
+                {'name': name, 'path': path, 'root': path, 'dirname': dirname, 'extension': extension})
+            break
+
+    # Fields precedence: path fields, invariant fields, environment variables and given keyword arguments
+    for field in fields:
+        if field in format_dict:
+            continue
+        elif field in invariants:
+            format_dict[field] = invariants[field]
+        elif field in os.environ:
+            format_dict[field] = os.environ[field]
+        elif field in kwargs:
+            format_dict[field] = kwargs[field]
+
+    resolve_string = normalized_string.format(**format_dict)
 
-    kwargs.update(os.environ)
+    return path_utils.clean_path(resolve_string)
 
-    format_dict = {
-        'name': name,
-        'path': path,
-        'root': path,
-        'user': username,
-        'temp': temp,
-        'home': local,
-        'local': local,
-        'dirname': dirname,
-        'extension': extension
-    }
-    kwargs.update(format_dict)
 
-    resolve_string = path_utils.normalize_path(format_string).format(**kwargs)
+def clear_format_path_cache():
+    """
+    Clears compiled format strings and invariant format fields. Should be called if user or environment folders change
+    """
 
-    return path_utils.clean_path(resolve_string)
+    _FORMAT_TEMPLATES.clear()
+    _FORMAT_RESULTS.clear()
+    _FORMAT_INVARIANTS.clear()
 
 
-def copy_path(source, target, force=False):
+def copy_path(source, target, force=False, resume=False, threads=None, callback=None):
     """
     Makes a copy of the given source path to the given destination path
+    Files are copied in parallel and the copy can be resumed: if resume is True, an existing target is not removed
+    and files that are already copied are skipped
     :param source: str
     :param target: str
     :param force: bool
+    :param resume: bool
+    :param threads: int or None, number of threads used to copy files
+    :param callback: callable or None, function called with the CopyProgress while copying
     :return: str
     """
 
@@ -266,24 +353,16 @@ def copy_path(source, target, force=False):
 
     if source == target:
         raise IOError('The source path and destination path are the same: {}'.format(source))
-    if not force and os.path.exists(target):
+    if not force and not resume and os.path.exists(target):
         raise IOError('Cannot copy over an existing path: {}'.format(target))
 
-    if force and os.path.exists(target):
+    if force and not resume and os.path.exists(target):
         if os.path.isdir(target):
             shutil.rmtree(target)
         else:
             os.remove(target)
 
-    # Ensure target directory exists
-    target_directory = os.path.dirname(target)
-    if not os.path.exists(target_directory):
-        os.makedirs(target_directory)
-
-    if os.path.isfile(source):
-        shutil.copy(source, target)
-    else:
-        shutil.copytree(source, target)
+    filecopy.copy(source, target, resume=resume, threads=threads, callback=callback)
 
     return target
 
@@ -296,10 +375,13 @@ def temp_path(*args):
 
     datalib_config = configs.get_library_config('tpDcc-libs-datalibrary')
     temp_path = datalib_config.get('temp_path')
-    if not temp_path:
-        temp_path = tempfile.mkdtemp()
+    if temp_path:
+        temp_path = format_path(temp_path)
+    else:
+        # New temporary folders have no format fields and are always different, so they are not formatted
+        temp_path = path_utils.clean_path(tempfile.mkdtemp())
 
-    temp_path = path_utils.normalize_path(os.path.join(format_path(temp_path), *args))
+    temp_path = path_utils.normalize_path(os.path.join(temp_path, *args))
 
     return temp_path
 
@@ -342,7 +424,7 @@ def update_settings(data, settings_file_path=None):
 
     settings = read_settings(settings_file_path)
     update(settings, data)
-    save_settings(settings)
+    save_settings(settings, settings_file_path=settings_file_path)
 
 
 def save_settings(data, settings_file_path=None):
@@ -357,3 +439,280 @@ def save_settings(data, settings_file_path=None):
         save_json(path, data)
     except Exception:
         LOGGER.exception('Cannot save settings to "{}"'.format(path))
+
+
+def _has_relative_paths(data, path):
+    """
+    Internal function that returns whether given data contains paths that can be converted to relative ones
+    All paths made relative by get_relative_path start with the third parent directory of the given path
+    :param data: str
+    :param path: str
+    :return: bool
+    """
+
+    root_path = path_utils.normalize_path(os.path.dirname(os.path.dirname(os.path.dirname(path))))
+    if not root_path.endswith('/'):
+        root_path += '/'
+
+    return root_path in data
+
+
+def _replace(source, target):
+    """
+    Internal function that atomically replaces target file with source file
+    :param source: str
+    :param target: str
+    """
+
+    if hasattr(os, 'replace'):
+        os.replace(source, target)
+    elif os.name != 'nt':
+        os.rename(source, target)
+    else:
+        # Windows Python 2 rename does not overwrite existing files
+        bak = target + '.bak'
+        if os.path.exists(bak):
+            os.remove(bak)
+        if os.path.exists(target):
+            os.rename(target, bak)
+        try:
+            os.rename(source, target)
+        except Exception:
+            if os.path.exists(bak):
+                os.rename(bak, target)
+            raise
+        if os.path.exists(bak):
+            os.remove(bak)
+
+
+def _fsync_directory(dirname):
+    """
+    Internal function that flushes the given directory entries to disk
+    Not all the platforms allow to open directories (Windows), in that case the operation is ignored
+    :param dirname: str
+    """
+
+    try:
+        directory_handle = os.open(dirname, os.O_RDONLY)
+    except (OSError, AttributeError):
+        return
+
+    try:
+        os.fsync(directory_handle)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_handle)
+
+
+def _file_stamp(path):
+    """
+    Internal function that returns the values used to check whether a file changed or not
+    :param path: str
+    :return: tuple(int, int) or None
+    """
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size
+
+
+def _compile_format_path(format_string):
+    """
+    Internal function that returns normalized version of the given format string and the names of the fields it uses
+    :param format_string: str
+    :return: tuple(str, frozenset(str))
+    """
+
+    template = _format_cache_get(_FORMAT_TEMPLATES, format_string)
+    if template is None:
+        normalized_string = path_utils.normalize_path(format_string)
+        fields = set()
+        for _, field_name, _, _ in string.Formatter().parse(normalized_string):
+            if field_name:
+                # Only the first part of attribute and index fields ({name.attr} or {name[0]}) is a keyword
+                fields.add(re.split(r'[.\[]', field_name, 1)[0])
+        template = (normalized_string, frozenset(fields))
+        _format_cache_set(_FORMAT_TEMPLATES, format_string, template)
+
+    return template
+
+
+def _format_cache_get(cache, format_string):
+    """
+    Internal function that returns the value stored for the given format string and marks it as recently used
+    :param cache: OrderedDict
+    :param format_string: str
+    :return: object or None
+    """
+
+    value = cache.pop(format_string, None)
+    if value is not None:
+        cache[format_string] = value
+
+    return value
+
+
+def _format_cache_set(cache, format_string, value):
+    """
+    Internal function that stores the value of the given format string, discarding least recently used values if
+    the cache is full
+    :param cache: OrderedDict
+    :param format_string: str
+    :param value: object
+    """
+
+    cache[format_string] = value
+    while len(cache) > FORMAT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _format_invariants():
+    """
+    Internal function that returns format fields that do not change during a session
+    :return: dict
+    """
+
+    if not _FORMAT_INVARIANTS:
+        encoding = locale.getpreferredencoding()
+
+        temp = tempfile.gettempdir()
+        if temp:
+            try:
+                temp = temp.decode(encoding)
+            except Exception:
+                pass
+
+        username = osplatform.get_user(lower=True)
+        if username:
+            try:
+                username = username.decode(encoding)
+            except Exception:
+                pass
+
+        local = os.getenv('APPDATA') or os.getenv('HOME')
+        if local:
+            try:
+                local = local.decode(encoding)
+            except Exception:
+                pass
+
+        _FORMAT_INVARIANTS.update({'user': username, 'temp': temp, 'home': local, 'local': local})
+
+    return _FORMAT_INVARIANTS
+
+
+def _json_file_lock(path):
+    """
+    Internal function that returns the lock used to read, merge and write the given JSON file
+    :param path: str
+    :return: threading.RLock
+    """
+
+    with _JSON_LOCK:
+        lock = _JSON_FILE_LOCKS.get(path)
+        if lock is None:
+            lock = _JSON_FILE_LOCKS[path] = threading.RLock()
+
+    return lock
+
+
+def _read_json_file(path, use_cache=True):
+    """
+    Internal function that returns the data stored in the given JSON file, without its pending updates
+    :param path: str
+    :param use_cache: bool
+    :return: dict
+    """
+
+    with _json_file_lock(path):
+        stamp = _file_stamp(path) if use_cache else None
+        cached = _JSON_CACHE.get(path) if stamp else None
+        if cached and cached[0] == stamp:
+            return marshal.loads(cached[1])
+
+        data = jsonpaths.loads(read(path, absolute=False) or '{}', path)
+        if stamp:
+            # Parsed data is stored serialized: loading it is faster than both JSON parsing and deep copying
+            _JSON_CACHE[path] = (stamp, marshal.dumps(data))
+
+    return data
+
+
+def _write_json_file(path, data):
+    """
+    Internal function that writes the given data to the given JSON file. Pending updates of the file are kept
+    :param path: str
+    :param data: dict
+    """
+
+    data = OrderedDict(sorted(data.items(), key=lambda t: t[0]))
+    text = json.dumps(data, indent=4)
+    if jsonpaths.has_absolute_paths(text, path):
+        text = json.dumps(jsonpaths.relative_paths(data, path), indent=4)
+
+    with _json_file_lock(path):
+        _JSON_CACHE.pop(path, None)
+        write(path, text, relative=False)
+
+
+def _write_json_update(path, data=None):
+    """
+    Internal function that merges the pending update of the given JSON file and the given data into the file
+    The file is read, merged and written while holding its lock, so concurrent updates are not lost. Pending update
+    stays visible to readers until it is written and it is only discarded if no other update was merged meanwhile;
+    otherwise it is written again
+    :param path: str
+    :param data: dict or None
+    :return: bool, True if the file was written; False if there was nothing to write
+    """
+
+    written = False
+    with _json_file_lock(path):
+        while True:
+            with _JSON_LOCK:
+                pending = _PENDING_JSON_UPDATES.get(path)
+                pending_data = copy.deepcopy(pending[0]) if pending else None
+                version = pending[2] if pending else None
+            if pending_data is None and data is None:
+                return written
+
+            file_data = _read_json_file(path)
+            if pending_data:
+                file_data = update(file_data, pending_data)
+            if data:
+                file_data = update(file_data, data)
+            _write_json_file(path, file_data)
+            written = True
+            data = None
+
+            with _JSON_LOCK:
+                if pending is None or _PENDING_JSON_UPDATES.get(path) is not pending:
+                    return written
+                if pending[2] == version:
+                    _pop_pending_update(path)
+                    return written
+
+
+def _pop_pending_update(path):
+    """
+    Internal function that removes and returns the pending update of the given JSON file
+    :param path: str
+    :return: dict or None
+    """
+
+    with _JSON_LOCK:
+        pending = _PENDING_JSON_UPDATES.pop(path, None)
+    if not pending:
+        return None
+
+    data, timer, _ = pending
+    timer.cancel()
+
+    return data
+
+
+atexit.register(flush_json)
@@ -9,10 +9,12 @@ from __future__ import print_function, division, absolute_import
 
 import os
 import math
+import logging
+import itertools
 
 from Qt.QtCore import Qt, Signal, QObject, QRect, QSize, QThreadPool, QUrl
-from Qt.QtWidgets import QApplication, QStyle, QTreeWidget, QTreeWidgetItem
-from Qt.QtGui import QFontMetrics, QColor, QIcon, QPixmap, QPen, QBrush, QMovie
+from Qt.QtWidgets import QApplication, QStyle, QStyleOptionViewItem, QTreeWidget, QTreeWidgetItem
+from Qt.QtGui import QColor, QIcon, QPixmap, QPainter, QPen, QBrush, QMovie, QImage
 
 from tpDcc import dcc
 from tpDcc.managers import resources
@@ -20,7 +22,10 @@ from tpDcc.libs.python import python, path as path_utils
 from tpDcc.libs.resources.core import theme
 from tpDcc.libs.qt.core import qtutils, image
 
-from tpDcc.tools.datalibrary.core import consts
+from tpDcc.tools.datalibrary.core import consts, textlayout, paintcache, iconatlas, workerpool, sequenceplayer, proxies
+from tpDcc.tools.datalibrary.core import spritesheet
+
+LOGGER = logging.getLogger('tpDcc-tools-datalibrary')
 
 
 class LabelDisplayOption:
@@ -38,6 +43,94 @@ class LabelDisplayOption:
         ]
 
 
+def _release_sequence(image_sequence):
+    """
+    Internal function that releases the files opened by a sequence discarded from the sequences pool
+    :param image_sequence: SequencePlayer or QMovie
+    """
+
+    if isinstance(image_sequence, sequenceplayer.SequencePlayer):
+        image_sequence.close()
+
+
+class _BlendState(object):
+    """
+    Internal class that stores the blending state of an item
+    """
+
+    __slots__ = ('enabled', 'down', 'value', 'prev_value', 'position')
+
+    def __init__(self):
+        self.enabled = False
+        self.down = False
+        self.value = 0.0
+        self.prev_value = 0.0
+        self.position = None
+
+
+class _SequenceState(object):
+    """
+    Internal class that stores the image sequence of an item
+    """
+
+    __slots__ = ('sequence', 'path', 'key')
+
+    def __init__(self):
+        self.sequence = None
+        self.path = ''
+        self.key = None
+
+
+class _ThumbnailWorker(image.ImageWorker, object):
+    """
+    Internal class that loads thumbnail images in a background thread
+    Unlike image.ImageWorker, it always notifies when it finishes, so the workers pool can reuse it. If the image can
+    not be loaded, None is sent
+    """
+
+    def __init__(self, *args):
+        super(_ThumbnailWorker, self).__init__(*args)
+
+        self._thumbnail_path = ''
+
+    def set_path(self, path):
+        """
+        Overrides base image.ImageWorker set_path function
+        :param path: str
+        """
+
+        super(_ThumbnailWorker, self).set_path(path)
+        self._thumbnail_path = path
+
+    def run(self):
+        """
+        Overrides base image.ImageWorker run function
+        """
+
+        thumbnail_image = None
+        try:
+            if self._thumbnail_path:
+                thumbnail_image = QImage(str(self._thumbnail_path))
+        except Exception:
+            LOGGER.exception('Cannot load thumbnail image "{}"'.format(self._thumbnail_path))
+
+        self.signals.triggered.emit(thumbnail_image)
+
+
+def _create_image_worker(finished_callback):
+    """
+    Internal function that creates a new reusable worker to load thumbnail images
+    :param finished_callback: callable
+    :return: _ThumbnailWorker
+    """
+
+    worker = _ThumbnailWorker()
+    worker.setAutoDelete(False)
+    worker.signals.triggered.connect(finished_callback)
+
+    return worker
+
+
 class GlobalDataItemSignals(QObject, object):
     blendChanged = Signal(float)
     loadValueChanged = Signal(object, object)
@@ -52,6 +145,9 @@ class ItemView(QTreeWidgetItem):
     REPRESENTING = []           # List of data types this view can represent
 
     THREAD_POOL = QThreadPool()
+    # Thumbnail workers are shared by all items: live workers are only the ones loading thumbnails (or waiting to be
+    # reused), no matter the number of items. Use THUMBNAIL_WORKERS.live_count() for diagnostics
+    THUMBNAIL_WORKERS = workerpool.WorkerPool(_create_image_worker)
 
     MAX_ICON_SIZE = consts.ITEM_DEFAULT_MAX_ICON_SIZE
     DEFAULT_FONT_SIZE = consts.ITEM_DEFAULT_FONT_SIZE
@@ -61,57 +157,46 @@ class ItemView(QTreeWidgetItem):
     DEFAULT_THUMBNAIL_COLUMN = consts.ITEM_DEFAULT_THUMBNAIL_COLUMN
     ENABLE_THUMBNAIL_THREAD = consts.ITEM_DEFAULT_ENABLE_THUMBNAIL_THREAD
 
+    # Icon mode cells are rendered once into pixmaps that are reused while the item does not change
+    ENABLE_PAINT_CACHE = consts.ITEM_DEFAULT_ENABLE_PAINT_CACHE
+    PAINT_CACHE = paintcache.PaintCache(consts.ITEM_DEFAULT_PAINT_CACHE_SIZE)
+
+    # Recently played sequences keep their decoded frames, so hovering an item again resumes playback instantly
+    SEQUENCE_POOL = paintcache.PaintCache(consts.ITEM_DEFAULT_SEQUENCE_POOL_SIZE, evict_fn=_release_sequence)
+
     PAINT_SLIDER = False
-    _TYPE_PIXMAP_CACHE = dict()
+    _PAINT_CACHE_VERSIONS = itertools.count()
 
     _globalSignals = GlobalDataItemSignals()
     blendChanged = _globalSignals.blendChanged
     loadValueChanged = _globalSignals.loadValueChanged
 
+    # Default values of the item state. Instance attributes are only created when an item modifies them, and rarely
+    # used state (blending and image sequences) is stored in side objects allocated on demand, so items are smaller
+    _size = None
+    _rect = None
+    _icon = None
+    _fonts = None
+    _thumbnail_icon = None
+    _pixmap_rect = None
+    _pixmap_scaled = None
+    _mime_text = None
+    _drag_enabled = True
+    _under_mouse = False
+    _search_text = None
+    _stretch_to_widget = None
+    _group_item = None
+    _icon_path = None
+    _worker_started = False
+    _blend = None
+    _sequence = None
+
     def __init__(self, data_item, *args, **kwargs):
         super(ItemView, self).__init__(*args, **kwargs)
 
-        self._size = None
-        self._rect = None
-        self._text_column_order = list()
-
         self._item = data_item
-
-        self._icon = dict()
-        self._thumbnail_icon = None
-        self._fonts = dict()
-        self._thread = None
         self._pixmap = dict()
-        self._pixmap_rect = None
-        self._pixmap_scaled = None
-        self._type_pixmap = None
-
-        self._mime_text = None
-        self._drag_enabled = True
-        self._under_mouse = False
-        self._search_text = None
-        self._info_widget = None
-        self._viewer = None
-        self._stretch_to_widget = None
-
-        self._group_item = None
-        self._group_column = 0
-
-        self._image_sequence = None
-        self._image_sequence_path = ''
-
-        self._blend_down = False
-        self._blend_value = 0.0
-        self._blend_prev_value = 0.0
-        self._blend_position = None
-        self._blending_enabled = False
-
-        self._worker = image.ImageWorker()
-        self._worker.setAutoDelete(False)
-        self._worker.signals.triggered.connect(self._on_thumbnail_from_image)
-        self._worker_started = False
-
-        self._icon_path = None
+        self._paint_cache_version = next(self._PAINT_CACHE_VERSIONS)
 
         icons_path = path_utils.join_path('icons', self.theme().name().lower())
         color_icons_path = path_utils.join_path('icons', 'color')
@@ -126,10 +211,10 @@ class ItemView(QTreeWidgetItem):
 
         dcc_name = dcc.client().get_name()
         type_icon = icon_name if icon_name == dcc_name + '.png' else None
-        self._type_icon_path = resources.get(color_icons_path, type_icon) if type_icon else ''
+        self._type_icon_path = iconatlas.resource_path(color_icons_path, type_icon) if type_icon else ''
 
-        self._default_thumbnail_path = resources.get(
-            icons_path, icon_name) or resources.get(icons_path, self.DEFAULT_THUMBNAIL_NAME)
+        self._default_thumbnail_path = iconatlas.resource_path(
+            icons_path, icon_name) or iconatlas.resource_path(icons_path, self.DEFAULT_THUMBNAIL_NAME)
 
     def __eq__(self, other):
         return id(other) == id(self)
@@ -240,6 +325,8 @@ class ItemView(QTreeWidgetItem):
             else:
                 icon = QIcon(icon)
         if python.is_string(column):
+            if self._icon is None:
+                self._icon = dict()
             self._icon[column] = icon
         else:
             self._pixmap[column] = None
@@ -255,7 +342,10 @@ class ItemView(QTreeWidgetItem):
         :param font: QFont
         """
 
+        if self._fonts is None:
+            self._fonts = dict()
         self._fonts[column] = font
+        self.clear_paint_cache()
 
     def textAlignment(self, column):
         """
@@ -347,6 +437,7 @@ class ItemView(QTreeWidgetItem):
         """
 
         self._pixmap[column] = pixmap
+        self.clear_paint_cache()
 
     def icon_path(self):
         """
@@ -408,6 +499,15 @@ class ItemView(QTreeWidgetItem):
         self._pixmap_rect = None
         self._pixmap_scaled = None
         self._thumbnail_icon = None
+        self.clear_paint_cache()
+
+    def clear_paint_cache(self):
+        """
+        Forces the item to be rendered again next time it is painted
+        """
+
+        # Old pixmaps are not accessible with the new version and are discarded by the cache when space is needed
+        self._paint_cache_version = next(self._PAINT_CACHE_VERSIONS)
 
     def update(self):
         """
@@ -483,7 +583,7 @@ class ItemView(QTreeWidgetItem):
         if event.button() == Qt.MidButton:
             if self.is_blending_enabled():
                 self.set_is_blending(True)
-                self._blend_position = event.pos()
+                self._blend_state().position = event.pos()
 
     def mouse_release_event(self, event):
         """
@@ -492,8 +592,8 @@ class ItemView(QTreeWidgetItem):
         """
 
         if self.is_blending():
-            self._blend_position = None
-            self._blend_prev_value = self.blend_value()
+            self._blend.position = None
+            self._blend.prev_value = self.blend_value()
 
     def key_press_event(self, event):
         """
@@ -549,7 +649,7 @@ class ItemView(QTreeWidgetItem):
         :return: QIcon
         """
 
-        return QIcon(self.default_thumbnail_path())
+        return iconatlas.icon(self.default_thumbnail_path())
 
     def type_icon_path(self):
         """
@@ -599,10 +699,14 @@ class ItemView(QTreeWidgetItem):
 
         thumbnail_path = self.thumbnail_path()
         if not self._thumbnail_icon:
-            if self.ENABLE_THUMBNAIL_THREAD and not self._worker_started:
+            if thumbnail_path == self._default_thumbnail_path:
+                # Default thumbnail is shared by all items, so it is not necessary to load it per item
+                self._thumbnail_icon = self.default_thumbnail_icon()
+            elif self.ENABLE_THUMBNAIL_THREAD and not self._worker_started:
                 self._worker_started = True
-                self._worker.set_path(thumbnail_path)
-                self.THREAD_POOL.start(self._worker)
+                worker = self.THUMBNAIL_WORKERS.acquire(self._on_thumbnail_from_image)
+                worker.set_path(thumbnail_path)
+                self.THREAD_POOL.start(worker)
                 self._thumbnail_icon = self.default_thumbnail_icon()
             else:
                 self._thumbnail_icon = QIcon(thumbnail_path)
@@ -613,21 +717,36 @@ class ItemView(QTreeWidgetItem):
     # SEQUENCE
     # =================================================================================================================
 
+    @classmethod
+    def release_pooled_sequences(cls, path):
+        """
+        Removes from the sequences pool the sequences that play the given path, releasing the files they keep open,
+        so the path can be replaced
+        :param path: str
+        """
+
+        path = os.path.normcase(os.path.normpath(path))
+        for key in cls.SEQUENCE_POOL.keys():
+            if os.path.normcase(os.path.normpath(key[0])) == path:
+                cls.SEQUENCE_POOL.remove(key)
+
     def image_sequence(self):
         """
         Return ImageSequence of the item
-        :return: image.ImageSequence or QMovie
+        :return: SequencePlayer or QMovie
         """
 
-        return self._image_sequence
+        return self._sequence.sequence if self._sequence else None
 
     def set_image_sequence(self, image_sequence):
         """
         Set the image sequence of the item
-        :param image_sequence: image.ImageSequence or QMovie
+        :param image_sequence: SequencePlayer or QMovie
         """
 
-        self._image_sequence = image_sequence
+        if image_sequence is None and not self._sequence:
+            return
+        self._sequence_state().sequence = image_sequence
 
     def image_sequence_path(self):
         """
@@ -635,7 +754,18 @@ class ItemView(QTreeWidgetItem):
         :return: str
         """
 
-        return self._image_sequence_path
+        return self._sequence.path if self._sequence else ''
+
+    def proxy_sequence_path(self):
+        """
+        Returns the path where the proxy image sequence generated when the item was saved is located on disk
+        :return: str, proxy sequence sprite sheet file or an empty string if the item has no proxy sequence
+        """
+
+        item_path = self.item.format_identifier() if self.item else None
+        path = proxies.proxy_sequence_path(item_path)
+
+        return path if spritesheet.is_sprite_sheet(path) else ''
 
     def set_image_sequence_path(self, path):
         """
@@ -643,39 +773,51 @@ class ItemView(QTreeWidgetItem):
         :param path: str
         """
 
-        self._image_sequence_path = path
+        if not path and not self._sequence:
+            return
+        self._sequence_state().path = path
 
     def reset_image_sequence(self):
         """
         Reset image sequence
         """
 
-        self._image_sequence = None
+        if self._sequence:
+            self._sequence.sequence = None
+            self._sequence.key = None
 
     def play(self):
         """
         Start play image sequence
+        If the item has no image sequence path, the proxy sequence generated when the item was saved is played
+        Sequences played recently are taken from the sequences pool, so their frames are not read nor decoded again
         """
 
-        self.reset_image_sequence()
-        path = self.image_sequence_path() or self.thumbnail_path()
+        self.stop()
+        path = self.image_sequence_path() or self.proxy_sequence_path() or self.thumbnail_path()
         movie = None
 
         if not path:
             return
 
         if os.path.isfile(path) and path.lower().endswith('.gif'):
-            movie = QMovie(path)
-            movie.setCacheMode(QMovie.CacheAll)
-            movie.frameChanged.connect(self._on_frame_changed)
-        elif os.path.isdir(path):
-            if not self.image_sequence():
-                movie = image.ImageSequence(path)
-                movie.frameChanged.connect(self._on_frame_changed)
+            key = (path, )
+            movie = self.SEQUENCE_POOL.pop(key)
+            if movie is None:
+                movie = QMovie(path)
+                movie.setCacheMode(QMovie.CacheAll)
+        elif os.path.isdir(path) or spritesheet.is_sprite_sheet(path):
+            size = self.rect().size() if self.rect() else None
+            key = (path, size.width(), size.height()) if size else (path, )
+            movie = self.SEQUENCE_POOL.pop(key)
+            if movie is None:
+                movie = sequenceplayer.SequencePlayer(path, size=size)
 
         if movie:
+            movie.frameChanged.connect(self._on_frame_changed)
             self.set_image_sequence(movie)
-            self.image_sequence().start()
+            self._sequence.key = key
+            movie.start()
 
     def update_frame(self):
         """
@@ -689,10 +831,25 @@ class ItemView(QTreeWidgetItem):
     def stop(self):
         """
         Stop play image sequence
+        The sequence is paused and stored in the sequences pool with its decoded frames
         """
 
-        if self._image_sequence:
-            self._image_sequence.stop()
+        image_sequence = self.image_sequence()
+        if not image_sequence:
+            return
+
+        image_sequence.frameChanged.disconnect(self._on_frame_changed)
+        if isinstance(image_sequence, QMovie):
+            image_sequence.setPaused(True)
+            frame_size = image_sequence.currentPixmap().size()
+            cost = max(1, image_sequence.frameCount()) * frame_size.width() * frame_size.height() * 4
+        else:
+            image_sequence.pause()
+            cost = image_sequence.memory_cost()
+        key = self._sequence.key
+        self.reset_image_sequence()
+        if key:
+            self.SEQUENCE_POOL.set(key, image_sequence, cost)
 
     def playhead_color(self):
         """
@@ -900,12 +1057,7 @@ class ItemView(QTreeWidgetItem):
         :return: QPixmap
         """
 
-        path = self.type_icon_path()
-        pixmap = self._TYPE_PIXMAP_CACHE.get(path)
-        if not pixmap and path and os.path.isfile(path):
-            self._TYPE_PIXMAP_CACHE[path] = QPixmap(path)
-
-        return self._TYPE_PIXMAP_CACHE.get(path)
+        return iconatlas.pixmap(self.type_icon_path())
 
     def font_size(self):
         """
@@ -923,7 +1075,7 @@ class ItemView(QTreeWidgetItem):
         """
 
         default = QTreeWidgetItem.font(self, column)
-        font = self._fonts.get(column, default)
+        font = self._fonts.get(column, default) if self._fonts else default
         font.setPixelSize(self.font_size() * self.dpi())
 
         return font
@@ -935,21 +1087,23 @@ class ItemView(QTreeWidgetItem):
         :param font: QFont
         """
 
+        if self._fonts is None:
+            self._fonts = dict()
         self._fonts[column] = font
+        self.clear_paint_cache()
 
     def text_width(self, column):
         """
-        Returns the text width of the given column
+        Returns the width of the text painted in the given column. Text is measured with the same layout cache used
+        to paint it
         :param column: int
         :return: int
         """
 
-        text = self.text(column)
-        font = self.font(column)
-        metrics = QFontMetrics(font)
-        text_width = metrics.width(text)
+        label = self.label_from_column(column)
+        text = self.display_text(label) if label else ''
 
-        return text_width
+        return textlayout.text_width(text, self.font(column)) if text else 0
 
     def text_color(self):
         """
@@ -1074,19 +1228,34 @@ class ItemView(QTreeWidgetItem):
         self.set_rect(QRect(option.rect))
         painter.save()
         try:
-            self.paint_background(painter, option, index)
-            self.paint_icon(painter, option, index)
+            paint_cache_key = self._paint_cache_key(option, index)
+            if paint_cache_key:
+                self._paint_cached(painter, option, index, paint_cache_key)
+            else:
+                self.paint_static(painter, option, index)
             if index.column() == 0 and self.blend_value() != 0:
                 self.paint_blend_slider(painter, option, index)
-            if self.is_text_visible():
-                self.paint_text(painter, option, index)
-            if index.column() == 0:
-                self.paint_type_icon(painter, option)
             if index.column() == 0 and self.image_sequence():
                 self.paint_playhead(painter, option)
         finally:
             painter.restore()
 
+    def paint_static(self, painter, option, index):
+        """
+        Paints the elements of the item that only change when the item changes (background, icon, text and type icon)
+        Live elements (playhead and blend slider) are painted on top of them by paint function
+        :param painter: QPainter
+        :param option: QStyleOptionViewItem
+        :param index: QModelIndex
+        """
+
+        self.paint_background(painter, option, index)
+        self.paint_icon(painter, option, index)
+        if self.is_text_visible():
+            self.paint_text(painter, option, index)
+        if index.column() == 0:
+            self.paint_type_icon(painter, option)
+
     def paint_background(self, painter, option, index):
         """
         Draw the background for the item
@@ -1179,7 +1348,7 @@ class ItemView(QTreeWidgetItem):
         """
 
         rect = self.type_icon_rect(option)
-        type_pixmap = self.type_pixmap()
+        type_pixmap = iconatlas.pixmap(self.type_icon_path(), rect.size())
         if type_pixmap:
             painter.setOpacity(0.5)
             painter.drawPixmap(rect, type_pixmap)
@@ -1252,6 +1421,28 @@ class ItemView(QTreeWidgetItem):
     # INTERNAL
     # =================================================================================================================
 
+    def _blend_state(self):
+        """
+        Internal function that returns the blending state of the item, creating it if necessary
+        :return: _BlendState
+        """
+
+        if self._blend is None:
+            self._blend = _BlendState()
+
+        return self._blend
+
+    def _sequence_state(self):
+        """
+        Internal function that returns the image sequence state of the item, creating it if necessary
+        :return: _SequenceState
+        """
+
+        if self._sequence is None:
+            self._sequence = _SequenceState()
+
+        return self._sequence
+
     def _thumbnail_from_image(self, image):
         """
         Called after the given image object has finished loading
@@ -1289,6 +1480,63 @@ class ItemView(QTreeWidgetItem):
 
         return self._pixmap_scaled
 
+    def _paint_cache_key(self, option, index):
+        """
+        Internal function that returns the key used to store the rendered item in the paint cache
+        :param option: QStyleOptionViewItem
+        :param index: QModelIndex
+        :return: tuple or None, None if the item cannot be rendered from the paint cache
+        """
+
+        if not self.ENABLE_PAINT_CACHE or not self.viewer() or not self.viewer().is_icon_view():
+            return None
+
+        # Frames of the playing sequence change constantly, so they are not worth caching
+        if self.image_sequence() and self.under_mouse():
+            return None
+
+        is_selected = bool(option.state & QStyle.State_Selected)
+        is_mouse_over = bool(option.state & QStyle.State_MouseOver)
+        if is_selected:
+            background_color = self.background_selected_color()
+            text_color = self.text_selected_color()
+        else:
+            background_color = self.background_hover_color() if is_mouse_over else self.backgroundColor()
+            text_color = self.text_color()
+        text = self.item.full_name() if self.item else self.name()
+
+        return (
+            self._paint_cache_version, index.column(), option.rect.width(), option.rect.height(), self.dpi(),
+            is_selected, is_mouse_over, background_color.rgba(), text_color.rgba(), self.label_display_option(), text)
+
+    def _paint_cached(self, painter, option, index, key):
+        """
+        Internal function that paints the item using the pixmap stored in the paint cache, rendering it if necessary
+        :param painter: QPainter
+        :param option: QStyleOptionViewItem
+        :param index: QModelIndex
+        :param key: tuple
+        """
+
+        pixmap = self.PAINT_CACHE.get(key)
+        if pixmap is None:
+            rect = option.rect
+            ratio = painter.device().devicePixelRatio() if painter.device() else 1
+            pixmap = QPixmap(rect.width() * ratio, rect.height() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            cache_option = QStyleOptionViewItem(option)
+            cache_option.rect = QRect(0, 0, rect.width(), rect.height())
+            cache_painter = QPainter(pixmap)
+            try:
+                cache_painter.setRenderHints(painter.renderHints())
+                self.paint_static(cache_painter, cache_option, index)
+            finally:
+                cache_painter.end()
+            self.PAINT_CACHE.set(key, pixmap, pixmap.width() * pixmap.height() * 4)
+
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
+
     def _paint_text(self, painter, option, column):
         """
         Internal function used to paint the text
@@ -1320,13 +1568,10 @@ class ItemView(QTreeWidgetItem):
 
         font = self.font(column)
         align = self.textAlignment(column)
-        metrics = QFontMetrics(font)
-        text_width = 1
-        if text:
-            text_width = metrics.width(text)
+        text_width = textlayout.text_width(text, font) if text else 1
         if text_width > visual_rect.width() - padding:
             visual_width = visual_rect.width()
-            text = metrics.elidedText(text, Qt.ElideMiddle, visual_width)
+            text = textlayout.elided_text(text, font, visual_width, Qt.ElideMiddle)
             align = Qt.AlignLeft
 
         align = align | Qt.AlignVCenter
@@ -1335,7 +1580,7 @@ class ItemView(QTreeWidgetItem):
         if self.viewer().is_icon_view():
             if self.is_label_over_item() or self.is_label_under_item():
                 padding = 8 if padding < 8 else padding
-                height = metrics.height() + (padding / 2)
+                height = textlayout.font_metrics(font).height() + (padding / 2)
                 y = (rect.y() + rect.height()) - height
                 rect.setY(y)
                 rect.setHeight(height)
@@ -1361,7 +1606,7 @@ class ItemView(QTreeWidgetItem):
         :return: bool
         """
 
-        return self._blending_enabled
+        return self._blend.enabled if self._blend else False
 
     def set_blending_enabled(self, flag):
         """
@@ -1369,7 +1614,9 @@ class ItemView(QTreeWidgetItem):
         :param flag: bool
         """
 
-        self._blending_enabled = flag
+        if not flag and not self._blend:
+            return
+        self._blend_state().enabled = flag
 
     def is_blending(self):
         """
@@ -1377,7 +1624,7 @@ class ItemView(QTreeWidgetItem):
         :return: bool
         """
 
-        return self._blend_down
+        return self._blend.down if self._blend else False
 
     def set_is_blending(self, flag):
         """
@@ -1385,10 +1632,13 @@ class ItemView(QTreeWidgetItem):
         :return: QMouseEvent
         """
 
-        self._blend_down = flag
+        if not flag and not self._blend:
+            return
+        blend_state = self._blend_state()
+        blend_state.down = flag
         if not flag:
-            self._blend_position = None
-            self._blend_prev_value = self.blend_value()
+            blend_state.position = None
+            blend_state.prev_value = blend_state.value
 
     def blend_value(self):
         """
@@ -1396,7 +1646,7 @@ class ItemView(QTreeWidgetItem):
         :return: float
         """
 
-        return self._blend_value
+        return self._blend.value if self._blend else 0.0
 
     def set_blend_value(self, blend):
         """
@@ -1405,7 +1655,7 @@ class ItemView(QTreeWidgetItem):
         """
 
         if self.is_blending_enabled():
-            self._blend_value = blend
+            self._blend.value = blend
             if self.PAINT_SLIDER:
                 self.update()
             self.blendChanged.emit(blend)
@@ -1418,7 +1668,7 @@ class ItemView(QTreeWidgetItem):
         :return: float
         """
 
-        return self._blend_prev_value
+        return self._blend.prev_value if self._blend else 0.0
 
     def blend_position(self):
         """
@@ -1426,7 +1676,7 @@ class ItemView(QTreeWidgetItem):
         :return: QPoint
         """
 
-        return self._blend_position
+        return self._blend.position if self._blend else None
 
     def blending_event(self, event):
         """
@@ -1446,8 +1696,11 @@ class ItemView(QTreeWidgetItem):
         Resets the blending value to zero
         """
 
-        self._blend_value = 0.0
-        self._blend_prev_value = 0.09
+        # Items that never blended do not need to allocate blending state
+        if not self._blend:
+            return
+        self._blend.value = 0.0
+        self._blend.prev_value = 0.09
 
     # =================================================================================================================
     # CALLBACKS
@@ -1456,8 +1709,12 @@ class ItemView(QTreeWidgetItem):
     def _on_thumbnail_from_image(self, image):
         """
         Internal callback function that is called when an image object has finished loading
+        :param image: QImage or None, None if the image could not be loaded
         """
 
+        if image is None:
+            return
+
         self.clear_cache()
         pixmap = QPixmap()
         pixmap.convertFromImage(image)
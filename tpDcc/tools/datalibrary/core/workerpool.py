@@ -0,0 +1,112 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a pool of reusable workers
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+import itertools
+from functools import partial
+
+LOGGER = logging.getLogger('tpDcc-tools-datalibrary')
+
+
+class WorkerPool(object):
+    """
+    Class that creates workers on demand and reuses them once they finish their work
+    Workers are created by the factory function, which receives the function that workers must call when they finish
+    """
+
+    def __init__(self, factory, max_idle=16):
+        """
+        :param factory: callable, function that receives the finished callback and returns a new worker
+        :param max_idle: int, maximum number of finished workers kept to be reused
+        """
+
+        self._factory = factory
+        self._max_idle = max_idle
+        self._ids = itertools.count()
+        self._idle = list()
+        self._busy = dict()
+        self._created_count = 0
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def acquire(self, callback):
+        """
+        Returns a worker ready to be used. Given callback is called with the worker results when it finishes
+        :param callback: callable
+        :return: object
+        """
+
+        if self._idle:
+            worker_id, worker = self._idle.pop()
+        else:
+            worker_id = next(self._ids)
+            worker = self._factory(partial(self._on_worker_finished, worker_id))
+            self._created_count += 1
+        self._busy[worker_id] = (worker, callback)
+
+        return worker
+
+    def live_count(self):
+        """
+        Returns the number of workers alive (busy or waiting to be reused)
+        :return: int
+        """
+
+        return len(self._busy) + len(self._idle)
+
+    def busy_count(self):
+        """
+        Returns the number of workers doing some work
+        :return: int
+        """
+
+        return len(self._busy)
+
+    def created_count(self):
+        """
+        Returns the total number of workers created by the pool
+        :return: int
+        """
+
+        return self._created_count
+
+    def clear(self):
+        """
+        Removes all idle workers
+        """
+
+        self._idle = list()
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_worker_finished(self, worker_id, *args):
+        """
+        Internal callback function that is called when a worker finishes
+        The worker is released once the callback returns, so it is not reused while its results are processed. It is
+        released even if the callback fails
+        :param worker_id: int
+        :param args: list, worker results
+        """
+
+        worker, callback = self._busy.get(worker_id, (None, None))
+        if worker is None:
+            return
+
+        try:
+            callback(*args)
+        except Exception:
+            LOGGER.exception('Error while processing worker results')
+        finally:
+            self._busy.pop(worker_id, None)
+            if len(self._idle) < self._max_idle:
+                self._idle.append((worker_id, worker))
@@ -9,9 +9,9 @@ from __future__ import print_function, division, absolute_import
 
 from Qt.QtCore import Qt, QRect, QSize
 from Qt.QtWidgets import QTreeWidgetItem
-from Qt.QtGui import QFontMetrics, QColor, QPen, QBrush
+from Qt.QtGui import QColor, QPen, QBrush
 
-from tpDcc.tools.datalibrary.core import consts
+from tpDcc.tools.datalibrary.core import consts, textlayout
 from tpDcc.tools.datalibrary.core.views import item
 
 
@@ -26,6 +26,7 @@ class GroupDataItemView(item.ItemView, object):
     PADDING_LEFT = consts.GROUP_ITEM_PADDING_LEFT
     PADDING_RIGHT = consts.GROUP_ITEM_PADDING_RIGHT
     HEIGHT = consts.GROUP_ITEM_HEIGHT
+    ENABLE_PAINT_CACHE = False
 
     def __init__(self, *args):
         super(GroupDataItemView, self).__init__(data_item=None, *args)
@@ -143,8 +144,7 @@ class GroupDataItemView(item.ItemView, object):
         painter.setPen(QPen(Qt.NoPen))
         visual_rect = self.visualRect(option)
         text = self.name()
-        metrics = QFontMetrics(self._font)
-        text_width = metrics.width(text)
+        text_width = textlayout.text_width(text, self._font)
         padding = (25 * self.dpi())
         visual_rect.setX(text_width + padding)
         visual_rect.setY(visual_rect.y() + (visual_rect.height() / 2))
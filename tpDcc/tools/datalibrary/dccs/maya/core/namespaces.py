@@ -0,0 +1,134 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains scene namespaces cache used by tpDcc-tools-datalibrary Maya server
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+
+LOGGER = logging.getLogger('tpDcc-tools-datalibrary')
+
+EXCLUDE_NAMESPACES = ['UI', 'shared']
+
+
+def query_scene_namespaces():
+    """
+    Returns all the namespaces in current Maya scene
+    :return: list(str)
+    """
+
+    import maya.cmds
+
+    return maya.cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True) or list()
+
+
+class NamespacesCache(object):
+    """
+    Class that caches the namespaces of the current scene until something that can modify them happens
+    If Maya API is not available (or no callbacks are registered) the cache is only invalidated manually, which
+    allows to use it as a stand-in outside Maya
+    """
+
+    # Scene messages after which scene namespaces can be different
+    SCENE_MESSAGES = [
+        'kAfterNew', 'kAfterOpen', 'kAfterImport', 'kAfterCreateReference', 'kAfterRemoveReference',
+        'kAfterLoadReference', 'kAfterUnloadReference', 'kAfterImportReference'
+    ]
+
+    def __init__(self, query_fn=None, exclude=None):
+        self._query_fn = query_fn or query_scene_namespaces
+        self._exclude = set(EXCLUDE_NAMESPACES if exclude is None else exclude)
+        self._namespaces = None
+        self._callback_ids = list()
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def namespaces(self, force=False):
+        """
+        Returns sorted list of namespaces. Namespaces are only queried if the cache is not valid
+        :param force: bool, Whether to query namespaces even if the cache is valid
+        :return: list(str)
+        """
+
+        if force or self._namespaces is None:
+            namespaces = self._query_fn() or list()
+            self._namespaces = sorted(set(namespaces) - self._exclude)
+
+        return list(self._namespaces)
+
+    def is_valid(self):
+        """
+        Returns whether cached namespaces can be used or not
+        :return: bool
+        """
+
+        return self._namespaces is not None
+
+    def invalidate(self, *args):
+        """
+        Clears cached namespaces. Can be used directly as Maya message callback
+        """
+
+        self._namespaces = None
+
+    def is_tracking(self):
+        """
+        Returns whether scene callbacks that invalidate the cache are registered or not
+        :return: bool
+        """
+
+        return bool(self._callback_ids)
+
+    def register_callbacks(self):
+        """
+        Registers Maya callbacks that invalidate the cache when namespaces can change
+        :return: bool, True if the callbacks are registered; False otherwise
+        """
+
+        if self._callback_ids:
+            return True
+
+        try:
+            import maya.api.OpenMaya as OpenMaya
+        except ImportError:
+            return False
+
+        try:
+            for message_name in self.SCENE_MESSAGES:
+                message = getattr(OpenMaya.MSceneMessage, message_name, None)
+                if message is None:
+                    continue
+                self._callback_ids.append(OpenMaya.MSceneMessage.addCallback(message, self.invalidate))
+            self._callback_ids.append(OpenMaya.MNamespaceMessage.addNamespaceAddedCallback(self.invalidate))
+            self._callback_ids.append(OpenMaya.MNamespaceMessage.addNamespaceRemovedCallback(self.invalidate))
+            self._callback_ids.append(OpenMaya.MNamespaceMessage.addNamespaceRenamedCallback(self.invalidate))
+        except Exception:
+            LOGGER.exception('Impossible to register namespaces cache callbacks')
+            self.unregister_callbacks()
+            return False
+
+        self.invalidate()
+
+        return True
+
+    def unregister_callbacks(self):
+        """
+        Removes all registered Maya callbacks
+        """
+
+        if not self._callback_ids:
+            return
+
+        try:
+            import maya.api.OpenMaya as OpenMaya
+            OpenMaya.MMessage.removeCallbacks(self._callback_ids)
+        except Exception:
+            LOGGER.exception('Impossible to unregister namespaces cache callbacks')
+        finally:
+            self._callback_ids = list()
+            self.invalidate()
@@ -8,6 +8,8 @@ Module that contains tpDcc-tools-datalibrary server implementation for Maya
 from __future__ import print_function, division, absolute_import
 
 import os
+import time
+import traceback
 
 import maya.cmds
 
@@ -16,6 +18,8 @@ from tpDcc.libs.python import path as path_utils
 
 from tpDcc.libs.datalibrary.core import datalib
 
+from tpDcc.tools.datalibrary.dccs.maya.core import namespaces
+
 
 class DataLibraryServer(server.DccServer, object):
 
@@ -25,6 +29,25 @@ class DataLibraryServer(server.DccServer, object):
         super(DataLibraryServer, self).__init__(*args, **kwargs)
 
         self._data_library = None
+        self._data_items_cache = dict()
+        self._namespaces_cache = namespaces.NamespacesCache()
+        self._namespaces_cache.register_callbacks()
+
+        # Maya callbacks must be removed even if the server is deleted without being closed
+        destroyed_signal = getattr(self, 'destroyed', None)
+        if destroyed_signal is not None:
+            destroyed_signal.connect(self._namespaces_cache.unregister_callbacks)
+
+    def close(self):
+        """
+        Closes the server and unregisters the Maya callbacks used to keep cached namespaces up to date
+        """
+
+        self._namespaces_cache.unregister_callbacks()
+
+        close_fn = getattr(super(DataLibraryServer, self), 'close', None)
+        if close_fn:
+            return close_fn()
 
     def load_data_items(self, data, reply):
 
@@ -41,13 +64,10 @@ class DataLibraryServer(server.DccServer, object):
 
     def list_namespaces(self, data, reply):
 
-        exclude_list = ['UI', 'shared']
+        # If scene callbacks are not available we cannot know when cached namespaces are outdated
+        force = data.get('force', False) or not self._namespaces_cache.is_tracking()
 
-        namespaces = maya.cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True)
-        namespaces = list(set(namespaces) - set(exclude_list))
-        namespaces = sorted(namespaces)
-
-        reply['result'] = namespaces
+        reply['result'] = self._namespaces_cache.namespaces(force=force)
         reply['success'] = True
 
     def list_nodes(self, data, reply):
@@ -80,6 +100,16 @@ class DataLibraryServer(server.DccServer, object):
 
         reply['success'] = True
 
+    def clear_data_items_cache(self, data, reply):
+        library_path = data.get('library_path', None)
+
+        if library_path:
+            self._data_items_cache.pop(path_utils.clean_path(library_path), None)
+        else:
+            self._data_items_cache.clear()
+
+        reply['success'] = True
+
     def save_data(self, data, reply):
         library_path = data['library_path']
         data_path = data['data_path']
@@ -91,14 +121,16 @@ class DataLibraryServer(server.DccServer, object):
                 data_path, library_path)
             return
 
-        data_lib = self._get_data_library(library_path)
-        data_item = data_lib.get(data_path, only_extension=True)
+        # Save functions store state in their data item, so saves always use a new data item
+        data_item, functionality = self._get_data_item(
+            library_path, data_path, only_extension=True, use_cache=False)
         if not data_item:
             reply['success'] = False
-            reply['msg'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(data_path, data_lib)
+            reply['msg'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(
+                data_path, self._data_library)
             return
 
-        save_function = data_item.functionality().get('save')
+        save_function = functionality.get('save')
         if not save_function:
             reply['success'] = False
             reply['msg'] = 'Save functionality is not available for data: "{}"'.format(data_item)
@@ -120,14 +152,16 @@ class DataLibraryServer(server.DccServer, object):
                 data_path, library_path)
             return
 
-        data_lib = self._get_data_library(library_path)
-        data_item = data_lib.get(data_path, only_extension=True)
+        # Save functions store state in their data item, so saves always use a new data item
+        data_item, functionality = self._get_data_item(
+            library_path, data_path, only_extension=True, use_cache=False)
         if not data_item:
             reply['success'] = False
-            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(data_path, data_lib)
+            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(
+                data_path, self._data_library)
             return
 
-        export_function = data_item.functionality().get('save')
+        export_function = functionality.get('save')
         if not export_function:
             reply['success'] = False
             reply['message'] = 'Export functionality is not available for data: "{}"'.format(data_item)
@@ -153,14 +187,14 @@ class DataLibraryServer(server.DccServer, object):
             reply['message'] = 'Impossible to load data "{}" because it does not exist!'.format(data_path)
             return
 
-        data_lib = self._get_data_library(library_path)
-        data_item = data_lib.get(data_path)
+        data_item, functionality = self._get_data_item(library_path, data_path)
         if not data_item:
             reply['success'] = False
-            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(data_path, data_lib)
+            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(
+                data_path, self._data_library)
             return
 
-        load_function = data_item.functionality().get('load')
+        load_function = functionality.get('load')
         if not load_function:
             reply['success'] = False
             reply['message'] = 'Load functionality is not available for data: "{}"'.format(data_item)
@@ -185,14 +219,14 @@ class DataLibraryServer(server.DccServer, object):
             reply['message'] = 'Impossible to import data "{}" because it does not exist!'.format(data_path)
             return
 
-        data_lib = self._get_data_library(library_path)
-        data_item = data_lib.get(data_path)
+        data_item, functionality = self._get_data_item(library_path, data_path)
         if not data_item:
             reply['success'] = False
-            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(data_path, data_lib)
+            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(
+                data_path, self._data_library)
             return
 
-        import_function = data_item.functionality().get('import_data')
+        import_function = functionality.get('import_data')
         if not import_function:
             reply['success'] = False
             reply['message'] = 'Import functionality is not available for data: "{}"'.format(data_item)
@@ -217,14 +251,14 @@ class DataLibraryServer(server.DccServer, object):
             reply['message'] = 'Impossible to reference data "{}" because it does not exist!'.format(data_path)
             return
 
-        data_lib = self._get_data_library(library_path)
-        data_item = data_lib.get(data_path)
+        data_item, functionality = self._get_data_item(library_path, data_path)
         if not data_item:
             reply['success'] = False
-            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(data_path, data_lib)
+            reply['message'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(
+                data_path, self._data_library)
             return
 
-        reference_function = data_item.functionality().get('reference_data')
+        reference_function = functionality.get('reference_data')
         if not reference_function:
             reply['success'] = False
             reply['message'] = 'Reference functionality is not available for data: "{}"'.format(data_item)
@@ -234,6 +268,38 @@ class DataLibraryServer(server.DccServer, object):
 
         reply['success'] = True
 
+    def load_multiple_data(self, data, reply):
+        library_path = data['library_path']
+        data_paths = data['data_paths']
+        functionality_name = data.get('functionality', 'load')
+
+        if not library_path or not os.path.isfile(library_path):
+            reply['success'] = False
+            reply['msg'] = 'Impossible to load data because library path "{}" does not exist!'.format(library_path)
+            return
+
+        results = list()
+        start_time = time.time()
+
+        # All data is applied within a single undo chunk and without refreshing the viewport after each operation
+        maya.cmds.undoInfo(openChunk=True, chunkName='DataLibrary: {} {} items'.format(
+            functionality_name, len(data_paths)))
+        maya.cmds.refresh(suspend=True)
+        try:
+            for data_path in data_paths:
+                results.append(self._apply_data(library_path, data_path, functionality_name))
+        finally:
+            maya.cmds.refresh(suspend=False)
+            maya.cmds.undoInfo(closeChunk=True)
+            maya.cmds.refresh()
+
+        failed = [result for result in results if not result['success']]
+
+        reply['success'] = not failed
+        reply['msg'] = '{} of {} data items failed to {}'.format(
+            len(failed), len(results), functionality_name) if failed else ''
+        reply['result'] = {'items': results, 'elapsed_time': time.time() - start_time}
+
     def _get_data_library(self, library_path):
         if self._data_library and path_utils.clean_path(
                 self._data_library.identifier) == path_utils.clean_path(library_path):
@@ -241,4 +307,99 @@ class DataLibraryServer(server.DccServer, object):
 
         self._data_library = datalib.DataLibrary.load(library_path)
 
+        # Items resolved by a previous instance of the library are not valid anymore
+        self._data_items_cache.pop(path_utils.clean_path(library_path), None)
+
         return self._data_library
+
+    def _get_data_item(self, library_path, data_path, only_extension=False, use_cache=True):
+        """
+        Internal function that returns the data item and its functionality for the given data path
+        Resolved data items are cached per library and they are resolved again only if the modification time
+        of the data file or of the data folder contents changes
+        :param library_path: str
+        :param data_path: str
+        :param only_extension: bool
+        :param use_cache: bool, whether to use a cached data item or to resolve a new one
+        :return: tuple(DataItem or None, dict)
+        """
+
+        data_lib = self._get_data_library(library_path)
+        library_cache = self._data_items_cache.setdefault(path_utils.clean_path(library_path), dict())
+
+        cache_key = (path_utils.clean_path(data_path), only_extension)
+        stamp = self._get_data_stamp(data_path) if use_cache else None
+        cached = library_cache.get(cache_key) if use_cache else None
+        if cached and cached[0] == stamp:
+            return cached[1], cached[2]
+
+        data_item = data_lib.get(data_path, only_extension=only_extension)
+        if not data_item:
+            library_cache.pop(cache_key, None)
+            return None, dict()
+
+        functionality = data_item.functionality() or dict()
+        if use_cache:
+            library_cache[cache_key] = (stamp, data_item, functionality)
+
+        return data_item, functionality
+
+    def _get_data_stamp(self, data_path):
+        """
+        Internal function that returns the value used to check whether the given data changed or not
+        Data stored in folders changes when any of their files changes, so the latest modification time of the folder
+        and its contents is used
+        :param data_path: str
+        :return: float or None, None if the data does not exist
+        """
+
+        if os.path.isfile(data_path):
+            return os.path.getmtime(data_path)
+        if not os.path.isdir(data_path):
+            return None
+
+        stamp = os.path.getmtime(data_path)
+        for root, dirs, files in os.walk(data_path):
+            for name in dirs + files:
+                try:
+                    stamp = max(stamp, os.path.getmtime(os.path.join(root, name)))
+                except OSError:
+                    pass
+
+        return stamp
+
+    def _apply_data(self, library_path, data_path, functionality_name):
+        """
+        Internal function that executes the given functionality of the given data and returns the result of
+        the operation and the time it took
+        :param library_path: str
+        :param data_path: str
+        :param functionality_name: str
+        :return: dict
+        """
+
+        result = {'data_path': data_path, 'success': False, 'msg': '', 'elapsed_time': 0.0}
+        start_time = time.time()
+
+        try:
+            if not os.path.isfile(data_path):
+                result['msg'] = 'Data "{}" does not exist!'.format(data_path)
+                return result
+            data_item, functionality = self._get_data_item(library_path, data_path)
+            if not data_item:
+                result['msg'] = 'Impossible to retrieve data "{}" from data library: "{}"!'.format(
+                    data_path, self._data_library)
+                return result
+            function = functionality.get(functionality_name)
+            if not function:
+                result['msg'] = '"{}" functionality is not available for data: "{}"'.format(
+                    functionality_name, data_item)
+                return result
+            function()
+            result['success'] = True
+        except Exception as exc:
+            result['msg'] = '{}\n{}'.format(exc, traceback.format_exc())
+        finally:
+            result['elapsed_time'] = time.time() - start_time
+
+        return result
@@ -176,8 +176,9 @@ class BaseLoadWidget(base.BaseWidget, object):
         self._sequence_widget = sequence.ImageSequenceWidget(self)
         thumbnail_frame_layout.insertWidget(0, self._sequence_widget)
 
-        if os.path.exists(self._item_view.image_sequence_path()):
-            self._sequence_widget.set_path(self._item_view.image_sequence_path())
+        sequence_path = self._item_view.image_sequence_path() or self._item_view.proxy_sequence_path()
+        if os.path.exists(sequence_path):
+            self._sequence_widget.set_path(sequence_path)
         elif os.path.exists(self._item_view.thumbnail_path()):
             self._sequence_widget.set_path(self._item_view.thumbnail_path())
 
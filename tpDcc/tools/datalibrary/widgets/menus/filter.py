@@ -9,7 +9,7 @@ from __future__ import print_function, division, absolute_import
 
 from functools import partial
 
-from Qt.QtCore import Qt
+from Qt.QtCore import Qt, Signal
 from Qt.QtWidgets import QFrame, QMenu, QWidgetAction
 from Qt.QtGui import QCursor
 
@@ -46,10 +46,14 @@ class GroupByMenu(QMenu):
 
 
 class FilterByMenu(QMenu):
+
+    filterChanged = Signal()
+
     def __init__(self, *args, **kwargs):
         super(FilterByMenu, self).__init__(*args, **kwargs)
 
         self._library = None
+        self._facet_index = None
         self._facets = list()
         self._options = {'field': 'type'}
         self._settings = dict()
@@ -67,8 +71,11 @@ class FilterByMenu(QMenu):
         self.clear()
 
         field = self._options.get('field')
-        queries = self.library().queries(exclude=self.name())
-        self._facets = self.library().distinct(field, queries=queries)
+        if self._facet_index is not None:
+            self._facets = self._facet_index.facets(field, mask=self._facet_index.query_mask())
+        else:
+            queries = self.library().queries(exclude=self.name())
+            self._facets = self.library().distinct(field, queries=queries)
 
         show_action = action.SeparatorAction('Show {}'.format(field.title()), self)
         self.addAction(show_action)
@@ -113,19 +120,24 @@ class FilterByMenu(QMenu):
         :param library: Library
         """
 
-        if library == self._library:
-            return
+        self._library = library
 
-        if not library and self._library:
-            try:
-                qtutils.safe_disconnect_signal(self._library.searchStarted)
-            except Exception as exc:
-                pass
+    def facet_index(self):
+        """
+        Returns the index used to count the items of each filter value
+        :return: FacetIndex or None
+        """
 
-        self._library = library
+        return self._facet_index
 
-        if self._library:
-            self._library.searchStarted.connect(self._on_search_init)
+    def set_facet_index(self, facet_index):
+        """
+        Sets the index used to count the items of each filter value
+        Facet counts are read from the index when the menu is shown, so the library is not queried
+        :param facet_index: FacetIndex
+        """
+
+        self._facet_index = facet_index
 
     def name(self):
         """
@@ -147,6 +159,17 @@ class FilterByMenu(QMenu):
 
         return False
 
+    def excluded_facets(self):
+        """
+        Returns the filtered field and the values that are not checked
+        Viewers hide the items that have one of the excluded values
+        :return: tuple(str, list(str))
+        """
+
+        settings = self.settings()
+
+        return self._options.get('field'), [name for name in settings if not settings.get(name, True)]
+
     def is_show_all_enabled(self):
         """
         Returns whether all current filters are enabled or not
@@ -196,39 +219,13 @@ class FilterByMenu(QMenu):
     # CALLBACKS
     # ============================================================================================================
 
-    def _on_search_init(self):
-        """
-        Internal callback function that is called before each search to update the filter men query
-        """
-
-        library = self.library()
-        if not library:
-            return
-
-        filters = list()
-
-        settings = self.settings()
-        field = self._options.get('field')
-        for name in settings:
-            checked = settings.get(name, True)
-            if not checked:
-                filters.append((field, 'not', name))
-
-        query = {
-            'name': self.name(),
-            'operator': 'and',
-            'filters': filters
-        }
-
-        self.library().add_query(query)
-
     def _on_show_all_action_clicked(self):
         """
         Internal callback function that is triggered when the user clicks the show all action
         """
 
         self.set_all_enabled(True)
-        self.library().search()
+        self.filterChanged.emit()
 
     def _on_action_checked(self, name, checked):
         """
@@ -243,7 +240,7 @@ class FilterByMenu(QMenu):
         else:
             self._settings[name] = checked
 
-        self.library().search()
+        self.filterChanged.emit()
 
 
 class FilterByAction(QWidgetAction, object):
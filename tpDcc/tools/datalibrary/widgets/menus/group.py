@@ -9,6 +9,7 @@ from __future__ import print_function, division, absolute_import
 
 from functools import partial
 
+from Qt.QtCore import Signal
 from Qt.QtWidgets import QMenu
 from Qt.QtGui import QCursor
 
@@ -16,6 +17,9 @@ from tpDcc.libs.qt.widgets import action
 
 
 class GroupByMenu(QMenu, object):
+
+    groupByChanged = Signal(object)
+
     def __init__(self, *args, **kwargs):
         super(GroupByMenu, self).__init__(*args, **kwargs)
 
@@ -104,6 +108,7 @@ class GroupByMenu(QMenu, object):
     def set_group_by(self, group_name, group_order):
         """
         Sets the group by value for the library
+        Items are not searched again: listeners of groupByChanged signal must regroup current items
         :param group_name: str
         :param group_order: str
         """
@@ -114,4 +119,4 @@ class GroupByMenu(QMenu, object):
             value = None
 
         self.library().set_group_by(value)
-        self.library().search()
+        self.groupByChanged.emit(value)
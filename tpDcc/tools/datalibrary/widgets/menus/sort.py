@@ -9,6 +9,7 @@ from __future__ import print_function, division, absolute_import
 
 from functools import partial
 
+from Qt.QtCore import Signal
 from Qt.QtWidgets import QMenu
 from Qt.QtGui import QCursor
 
@@ -16,6 +17,9 @@ from tpDcc.libs.qt.widgets import action
 
 
 class SortByMenu(QMenu, object):
+
+    sortByChanged = Signal(object)
+
     def __init__(self, *args, **kwargs):
         super(SortByMenu, self).__init__(*args, **kwargs)
 
@@ -97,6 +101,7 @@ class SortByMenu(QMenu, object):
     def set_sort_by(self, sort_name, sort_order):
         """
         Sets the sort by value for the library
+        Items are not searched again: listeners of sortByChanged signal must sort current items
         :param sort_name: str
         :param sort_order: str
         """
@@ -106,4 +111,4 @@ class SortByMenu(QMenu, object):
 
         value = sort_name + ':' + sort_order
         self.library().set_sort_by([value])
-        self.library().search()
+        self.sortByChanged.emit([value])
@@ -166,9 +166,10 @@ class PreviewWidget(base.BaseWidget, object):
         if icon:
             self._sequence_widget.setIcon(icon)
 
-        # Update images sequence (if exist)
-        if self._item_view.image_sequence_path():
-            self._sequence_widget.set_dirname(self._item_view.image_sequence_path())
+        # Update images sequence (if exist). Proxy sequence is played if the item has no image sequence path
+        sequence_path = self._item_view.image_sequence_path() or self._item_view.proxy_sequence_path()
+        if sequence_path:
+            self._sequence_widget.set_dirname(sequence_path)
 
     def update_thumbnail_size(self):
         """
@@ -11,8 +11,8 @@ import os
 import logging
 import traceback
 
-from Qt.QtCore import Signal, QSize
-from Qt.QtWidgets import QSizePolicy, QFrame, QDialogButtonBox, QFileDialog
+from Qt.QtCore import Signal, QSize, QEventLoop
+from Qt.QtWidgets import QApplication, QSizePolicy, QFrame, QDialogButtonBox, QFileDialog
 
 from tpDcc import dcc
 from tpDcc.managers import resources
@@ -21,7 +21,8 @@ from tpDcc.libs.python import decorators
 from tpDcc.libs.qt.core import base, qtutils
 from tpDcc.libs.qt.widgets import layouts, label, buttons, formwidget, messagebox, snapshot
 
-from tpDcc.tools.datalibrary.core import utils
+from tpDcc.tools.datalibrary.core import utils, tasks, proxies, spritesheet
+from tpDcc.tools.datalibrary.core.views import item as items_view
 from tpDcc.tools.datalibrary.widgets import sequence
 
 LOGGER = logging.getLogger('tpDcc-libs-datalibrary')
@@ -49,6 +50,8 @@ class BaseSaveWidget(base.BaseWidget, object):
 
     cancelled = Signal()
     saved = Signal()
+    thumbnailCopied = Signal(str)
+    thumbnailCopyProgress = Signal(str)
 
     ENABLE_THUMBNAIL_CAPTURE = True
 
@@ -58,6 +61,8 @@ class BaseSaveWidget(base.BaseWidget, object):
         self._client = client
         self._form_widget = None
         self._sequence_widget = None
+        self._thumbnail_copy_task = None
+        self._thumbnail_proxy_task = None
 
         super(BaseSaveWidget, self).__init__(*args, **kwargs)
 
@@ -137,6 +142,8 @@ class BaseSaveWidget(base.BaseWidget, object):
         self._menu_button.clicked.connect(self._on_show_menu)
         self._save_button.clicked.connect(self._on_save)
         self._cancel_button.clicked.connect(self._on_cancel)
+        self.thumbnailCopied.connect(self._on_thumbnail_copied)
+        self.thumbnailCopyProgress.connect(self._on_thumbnail_copy_progress)
 
     def resizeEvent(self, event):
         """
@@ -178,15 +185,21 @@ class BaseSaveWidget(base.BaseWidget, object):
 
     def set_thumbnail_path(self, path):
         """
-        Sets the path to the thumbnail image or the image sequence directory
+        Sets the path to the thumbnail image, the image sequence directory or the image sequence sprite sheet file
+        Thumbnail files are copied and its proxy sequence is encoded in background threads, so the widget stays
+        responsive. Save operation waits for them to finish
         :param path: str
         """
 
+        # Temporal files of the previous thumbnail cannot be overwritten while they are being written
+        self._wait_thumbnail_tasks()
+
         file_name, extension = os.path.splitext(path)
         target = utils.temp_path('thumbnail{}'.format(extension))
-        utils.copy_path(path, target, force=True)
-
-        self._sequence_widget.set_path(target)
+        proxy_path = utils.temp_path('thumbnail_proxy{}'.format(spritesheet.EXTENSION))
+        self._thumbnail_copy_task = tasks.BackgroundTask(self._copy_thumbnail, path, target).start()
+        self._thumbnail_proxy_task = tasks.BackgroundTask(
+            self._encode_proxy_sequence, self._thumbnail_copy_task, proxy_path).start()
 
     def library_window(self):
         """
@@ -364,6 +377,82 @@ class BaseSaveWidget(base.BaseWidget, object):
     # INTERNAL
     # ============================================================================================================
 
+    def _copy_thumbnail(self, source, target):
+        """
+        Internal function that copies the thumbnail files into the temporal folder
+        This function is called in a background thread, so it only communicates with the widget through signals
+        :param source: str
+        :param target: str
+        :return: str
+        """
+
+        utils.copy_path(source, target, force=True, callback=self._on_copy_progress)
+        self.thumbnailCopied.emit(target)
+
+        return target
+
+    def _encode_proxy_sequence(self, copy_task, proxy_path):
+        """
+        Internal function that encodes the proxy sequence of the thumbnail copied by the given task
+        This function is called in a background thread, so it only communicates with the widget through signals
+        :param copy_task: BackgroundTask
+        :param proxy_path: str
+        :return: str or None, proxy sequence path or None if the thumbnail is not an image sequence
+        """
+
+        thumbnail_path = copy_task.result()
+        if not os.path.isdir(thumbnail_path) and not spritesheet.is_sprite_sheet(thumbnail_path):
+            return None
+
+        return proxy_path if proxies.create_proxy_sequence(thumbnail_path, proxy_path) > 1 else None
+
+    def _wait_task(self, task):
+        """
+        Internal function that waits until the given task finishes. Events are processed while waiting, so the widget
+        is refreshed
+        :param task: BackgroundTask or None
+        :return: object, task result
+        """
+
+        if not task:
+            return None
+
+        while not task.wait(0.05):
+            QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+        # Signals emitted by the task before it finished are delivered
+        QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+
+        return task.result()
+
+    def _wait_thumbnail_tasks(self):
+        """
+        Internal function that waits until the thumbnail is copied and its proxy sequence is encoded
+        """
+
+        for task in (self._thumbnail_copy_task, self._thumbnail_proxy_task):
+            try:
+                self._wait_task(task)
+            except Exception:
+                # Errors are reported when saving, but only if the thumbnail is still the current one
+                pass
+
+    def _save_proxy_sequence(self, item_path):
+        """
+        Internal function that stores a downscaled version of the current image sequence next to the given item
+        Proxy sequence is encoded in background when the thumbnail is set, so usually it is already encoded when
+        the item is saved. Proxy sequences are used to preview the item, so a failure does not invalidate the save
+        :param item_path: str
+        """
+
+        try:
+            proxy_path = self._wait_task(self._thumbnail_proxy_task)
+            if proxy_path:
+                target_path = proxies.proxy_sequence_path(item_path)
+                items_view.ItemView.release_pooled_sequences(target_path)
+                utils.copy_path(proxy_path, target_path, force=True)
+        except Exception:
+            LOGGER.warning('Impossible to store proxy sequence for "{}": {}'.format(item_path, traceback.format_exc()))
+
     def _create_sequence_widget(self):
         """
         Internal function that creates a sequence widget to replace the static thumbnail widget
@@ -410,6 +499,11 @@ class BaseSaveWidget(base.BaseWidget, object):
         if not library:
             return False
 
+        try:
+            self._wait_task(self._thumbnail_copy_task)
+        except Exception:
+            LOGGER.error('Impossible to copy thumbnail: {}'.format(traceback.format_exc()))
+
         try:
             self.form_widget().validate()
             if self.form_widget().has_errors():
@@ -429,6 +523,8 @@ class BaseSaveWidget(base.BaseWidget, object):
 
             path = folder + '/' + name
             thumbnail = self._sequence_widget.first_frame()
+            if spritesheet.is_sprite_sheet(thumbnail):
+                thumbnail = spritesheet.extract_frame(thumbnail, 0, utils.temp_path('thumbnail_frame'))
 
             save_item = library.get(path, only_extension=True)
             save_function = save_item.functionality().get('save')
@@ -481,6 +577,8 @@ class BaseSaveWidget(base.BaseWidget, object):
         if thumbnail and os.path.isfile(thumbnail):
             save_item.store_thumbnail(thumbnail)
 
+        self._save_proxy_sequence(new_item_path)
+
         self.library_window().sync()
 
         save_item.update_dependencies(dependencies=dependencies)
@@ -516,6 +614,32 @@ class BaseSaveWidget(base.BaseWidget, object):
 
         self.thumbnail_capture(show=True)
 
+    def _on_copy_progress(self, progress):
+        """
+        Internal callback function that is called in a background thread while thumbnail files are being copied
+        :param progress: CopyProgress
+        """
+
+        self.thumbnailCopyProgress.emit(progress.message())
+
+    def _on_thumbnail_copy_progress(self, message):
+        """
+        Internal callback function that is called when the copy progress of the thumbnail files changes
+        :param message: str
+        """
+
+        library_window = self.item_view().library_window() if self.item_view() else None
+        if library_window:
+            library_window.show_info_message(message)
+
+    def _on_thumbnail_copied(self, thumbnail_path):
+        """
+        Internal callback function that is called when thumbnail files are copied into the temporal folder
+        :param thumbnail_path: str
+        """
+
+        self._sequence_widget.set_path(thumbnail_path)
+
     def _on_show_browse_image_dialog(self):
         """
         Internal callback function that shows a file dialog for choosing an image from disk
@@ -31,6 +31,7 @@ class DataSearcherWidget(QLineEdit):
         super(DataSearcherWidget, self).__init__(parent=parent)
 
         self._library = None
+        self._viewer = None
         self._space_operator = 'and'
 
         self._icon_btn = buttons.BaseButton(parent=self)
@@ -112,6 +113,23 @@ class DataSearcherWidget(QLineEdit):
 
         self._library = library
 
+    def viewer(self):
+        """
+        Returns the viewer that evaluates the search query on its items
+        :return: DataViewer or None
+        """
+
+        return self._viewer
+
+    def set_viewer(self, viewer):
+        """
+        Sets the viewer that evaluates the search query on its items. If set, changing the search text does not search
+        the library again, only the search query is evaluated on the items found by the library
+        :param viewer: DataViewer or None
+        """
+
+        self._viewer = viewer
+
     def space_operator(self):
         """
         Returns the space operator for the search widget
@@ -134,7 +152,10 @@ class DataSearcherWidget(QLineEdit):
         Run the search query on the library
         """
 
-        if self.library():
+        if self.viewer():
+            if self.viewer().set_item_query(self.query()):
+                self.viewer().reorder_items()
+        elif self.library():
             self.library().add_query(self.query())
             self.library().search()
         else:
@@ -14,6 +14,8 @@ from Qt.QtGui import QColor, QPainter, QBrush
 from tpDcc.libs.resources.core import icon
 from tpDcc.libs.qt.core import qtutils, image, animation
 
+from tpDcc.tools.datalibrary.core import spritesheet, sequenceplayer
+
 
 class ImageSequenceWidget(QToolButton, object):
 
@@ -192,8 +194,7 @@ class ImageSequenceWidget(QToolButton, object):
         :param path: str
         """
 
-        self._image_sequence.set_path(path)
-        self.update_icon()
+        self._set_image_sequence_path(path, single_frame=True)
 
     def set_dirname(self, dirname):
         """
@@ -201,8 +202,7 @@ class ImageSequenceWidget(QToolButton, object):
         :param dirname: str
         """
 
-        self._image_sequence.set_dirname(dirname)
-        self.update_icon()
+        self._set_image_sequence_path(dirname)
 
     def current_filename(self):
         """
@@ -253,6 +253,43 @@ class ImageSequenceWidget(QToolButton, object):
         y = self.height() - self._toolbar.height() - 12
         self._toolbar.setGeometry(x, y, self._toolbar.width(), self._toolbar.height())
 
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _set_image_sequence_path(self, path, single_frame=False):
+        """
+        Internal function that sets the location of the image sequence
+        Sprite sheet files are played by a sequence player, that reads frames from a single memory mapped file
+        :param path: str, image file, folder or sprite sheet file
+        :param single_frame: bool, whether path is a single frame image or the folder of the image sequence
+        """
+
+        is_sprite_sheet = spritesheet.is_sprite_sheet(path)
+        if is_sprite_sheet or isinstance(self._image_sequence, sequenceplayer.SequencePlayer):
+            self._image_sequence.pause()
+            self._image_sequence.frameChanged.disconnect(self._on_frame_changed)
+            if isinstance(self._image_sequence, sequenceplayer.SequencePlayer):
+                # Players are children of the widget, so they must be deleted to release their sprite sheet file
+                self._image_sequence.close()
+                self._image_sequence.deleteLater()
+            if is_sprite_sheet:
+                self._image_sequence = sequenceplayer.SequencePlayer(path, size=self._size, parent=self)
+            else:
+                self._image_sequence = image.ImageSequence('')
+            self._image_sequence.frameChanged.connect(self._on_frame_changed)
+
+        if is_sprite_sheet:
+            # Frames are decoded in background, so the icon is updated when the first frame is decoded
+            self._image_sequence.jump_to_frame(0)
+            return
+
+        if single_frame:
+            self._image_sequence.set_path(path)
+        else:
+            self._image_sequence.set_dirname(path)
+        self.update_icon()
+
     # =================================================================================================================
     # CALLBACKS
     # =================================================================================================================
@@ -22,6 +22,8 @@ from tpDcc.libs.resources.core import color, pixmap
 from tpDcc.libs.qt.core import base, menu, contexts as qt_contexts
 from tpDcc.libs.qt.widgets import layouts, buttons, search
 
+from tpDcc.tools.datalibrary.core import iconatlas
+
 LOGGER = logging.getLogger('tpDcc-libs-datalibrary')
 
 
@@ -955,8 +957,6 @@ class SidebarTree(QTreeWidget):
 
 class SidebarTreeItem(QTreeWidgetItem):
 
-    _PIXMAP_CACHE = dict()
-
     def __init__(self, *args, **kwargs):
         super(SidebarTreeItem, self).__init__(*args, **kwargs)
 
@@ -1268,25 +1268,30 @@ class SidebarTreeItem(QTreeWidgetItem):
             return QPixmap()
 
         dpi = self.treeWidget().dpi()
-        key = path + color + 'DPI-' + str(dpi)
-        item_pixmap = self._PIXMAP_CACHE.get(key)
-        if not item_pixmap:
+        # Under PyQt QColor string representation contains the object address, so the color name is used instead
+        color_key = QColor(color).name(QColor.HexArgb) if isinstance(color, QColor) else str(color)
+        key = ('sidebar', path, color_key, dpi)
+
+        def _create():
             width = 20 * dpi
             height = 18 * dpi
-            if '/' not in path and '\\' not in path:
-                path = resources.get('icons', path)
-            if not path or not os.path.exists(path):
-                path = self.default_icon_path()
-            pixmap2 = pixmap.Pixmap(path)
+            pixmap_path = path
+            if '/' not in pixmap_path and '\\' not in pixmap_path:
+                pixmap_path = iconatlas.resource_path('icons', pixmap_path)
+            if not pixmap_path or not os.path.exists(pixmap_path):
+                pixmap_path = self.default_icon_path()
+            pixmap2 = pixmap.Pixmap(pixmap_path)
             pixmap2.set_color(color)
             pixmap2 = pixmap2.scaled(16 * dpi, 16 * dpi, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             x = (width - pixmap2.width()) / 2
             y = (height - pixmap2.height()) / 2
-            item_pixmap = QPixmap(QSize(width, height))
-            item_pixmap.fill(Qt.transparent)
-            painter = QPainter(item_pixmap)
+            new_pixmap = QPixmap(QSize(width, height))
+            new_pixmap.fill(Qt.transparent)
+            painter = QPainter(new_pixmap)
             painter.drawPixmap(x, y, pixmap2)
             painter.end()
-            self._PIXMAP_CACHE[key] = item_pixmap
+            return new_pixmap
+
+        item_pixmap = iconatlas.cached(key, _create)
 
         return item_pixmap
@@ -12,11 +12,11 @@ from functools import partial
 
 from Qt.QtCore import Qt
 from Qt.QtWidgets import QApplication, QTreeWidget, QAbstractItemView, QMenu
-from Qt.QtGui import QCursor, QFontMetrics, QClipboard
+from Qt.QtGui import QCursor, QClipboard
 
 from tpDcc.libs.python import python
 
-from tpDcc.tools.datalibrary.core import consts
+from tpDcc.tools.datalibrary.core import consts, columnwidth
 from tpDcc.tools.datalibrary.data import group
 from tpDcc.tools.datalibrary.widgets import mixinview
 
@@ -30,6 +30,7 @@ class ViewerTreeView(mixinview.ViewerViewWidgetMixin, QTreeWidget):
 
         self._header_labels = list()
         self._hidden_columns = dict()
+        self._column_widths = columnwidth.ColumnWidthEstimator(self._item_column_width)
 
         self.setAutoScroll(False)
         self.setMouseTracking(True)
@@ -131,23 +132,51 @@ class ViewerTreeView(mixinview.ViewerViewWidgetMixin, QTreeWidget):
             width = consts.TREE_DEFAULT_WIDTH
             self.setColumnWidth(column, width)
 
-    def resizeColumnToContents(self, column):
+    def resizeColumnToContents(self, column, exact=False):
         """
         Overrides base QTreeWidget resizeColumnToContents function
         Resize the given column to the data of that column
+        By default, column widths tracked while items are added and removed are used. If exact is True, all items are
+        measured again
         :param column: int or str
+        :param exact: bool
         """
 
-        width = 0
-        for item in self.items():
-            text = item.text(column)
-            font = item.font(column)
-            metrics = QFontMetrics(font)
-            text_width = metrics.width(text) + item.padding()
-            width = max(width, text_width)
+        if python.is_string(column):
+            column = self.column_from_label(column)
+
+        if exact:
+            self._column_widths.invalidate(column)
+        width = self._column_widths.width(column, self.items)
 
         self.setColumnWidth(column, width)
 
+    def rowsInserted(self, parent, start, end):
+        """
+        Overrides base QTreeWidget rowsInserted function
+        Updates tracked column widths with inserted items
+        :param parent: QModelIndex
+        :param start: int
+        :param end: int
+        """
+
+        self._column_widths.add_items(self._items_in_rows(parent, start, end))
+
+        super(ViewerTreeView, self).rowsInserted(parent, start, end)
+
+    def rowsAboutToBeRemoved(self, parent, start, end):
+        """
+        Overrides base QTreeWidget rowsAboutToBeRemoved function
+        Removes items that are going to be removed from tracked column widths
+        :param parent: QModelIndex
+        :param start: int
+        :param end: int
+        """
+
+        self._column_widths.remove_items(self._items_in_rows(parent, start, end))
+
+        super(ViewerTreeView, self).rowsAboutToBeRemoved(parent, start, end)
+
     def setHeaderLabels(self, labels):
         """
         Overrides base QTreeWidget setHeaderLabels function
@@ -164,6 +193,8 @@ class ViewerTreeView(mixinview.ViewerViewWidgetMixin, QTreeWidget):
 
         column_settings = self.column_settings()
         super(ViewerTreeView, self).setHeaderLabels(labels)
+        # Columns can show other labels now, so their tracked widths are no longer valid
+        self._column_widths.invalidate()
         self._header_labels = labels
         self.update_column_hidden()
         self.set_column_settings(column_settings)
@@ -175,6 +206,7 @@ class ViewerTreeView(mixinview.ViewerViewWidgetMixin, QTreeWidget):
         """
 
         super(ViewerTreeView, self).clear(*args)
+        self._column_widths.invalidate()
         self.clean_dirty_objects()
 
     # ============================================================================================================
@@ -192,6 +224,18 @@ class ViewerTreeView(mixinview.ViewerViewWidgetMixin, QTreeWidget):
         self.addTopLevelItems(items)
         self.set_items_selected(selected_items, True)
 
+    def invalidate_column_widths(self, items=None):
+        """
+        Forces the measurement of the column widths used to resize columns to their contents
+        Must be called when items contents or fonts change
+        :param items: list(LibraryItem) or None, items whose contents changed. If None, all items are measured again
+        """
+
+        if items is None:
+            self._column_widths.invalidate()
+        else:
+            self._column_widths.update_items(items)
+
     def set_items_selected(self, items, value, scroll_to=True):
         """
         Selects the given library items
@@ -375,53 +419,45 @@ class ViewerTreeView(mixinview.ViewerViewWidgetMixin, QTreeWidget):
 
     def items_custom_order(self):
         """
-        Returns the items sorted by hte custom order data
+        Returns the items sorted by the custom order of the viewer. Items without custom order are sorted last
         :return: list(DataItem)
         """
 
         items = self.items()
+        identifiers = [self.viewer().item_identifier(item.item) for item in items]
 
-        def sort_key(item):
-            return item.item_data().get('Custom Order', 0)
-
-        custom_order = sorted(items, key=sort_key)
+        return [items[i] for i in self.viewer().custom_order().sorted_indices(identifiers)]
 
-        return custom_order
-
-    def set_items_custom_order(self, items, row=1, padding=5):
+    def set_items_custom_order(self, items):
         """
-        Sets the custom order for the given items by their list order
-        :param items:
-        :param row:
-        :param padding:
-        :return:
+        Sets the custom order for the given items by their list order. Items are placed after all other items
+        :param items: list(DataItem)
         """
 
-        for item in items:
-            item.item_data()['Custom Order'] = str(row).zfill(padding)
-            row += 1
+        identifiers = [self.viewer().item_identifier(item.item) for item in items]
+        self.viewer().custom_order().move(identifiers)
+        self.viewer().update_custom_order()
 
     def move_items(self, items, item_at):
         """
         Moves the given items to the position of the target row
+        Only the custom order of the moved items is updated, unless there is no free rank left at the target row
         :param items: list(DataItem)
-        :param item_at: DataItem
+        :param item_at: DataItem or None, if None, items are moved to the first row
         """
 
-        row = 0
-        ordered_items = self.items_custom_order()
-        if item_at:
-            row = ordered_items.index(item_at)
-        removed_items = list()
-
-        for item in items:
-            index = ordered_items.index(item)
-            removed_items.append(ordered_items.pop(index))
+        current_items = self.items()
+        if not items or not current_items:
+            return
 
-        for item in removed_items:
-            ordered_items.insert(row, item)
+        viewer = self.viewer()
+        custom_order = viewer.custom_order()
 
-        self.set_items_custom_order(ordered_items)
+        # Items without custom order keep their current row, after the ordered ones
+        custom_order.append([viewer.item_identifier(item.item) for item in current_items])
+        item_at = item_at or self.items_custom_order()[0]
+        custom_order.move([viewer.item_identifier(item.item) for item in items], viewer.item_identifier(item_at.item))
+        viewer.update_custom_order()
 
         for item in items:
             item.setSelected(True)
@@ -558,6 +594,41 @@ class ViewerTreeView(mixinview.ViewerViewWidgetMixin, QTreeWidget):
 
         return self.findItems('*', Qt.MatchWildcard | Qt.MatchRecursive)
 
+    def _items_in_rows(self, parent, start, end):
+        """
+        Internal function that returns the items in the given rows and all their children
+        :param parent: QModelIndex
+        :param start: int
+        :param end: int
+        :return: list(QTreeWidgetItem)
+        """
+
+        parent_item = self.itemFromIndex(parent) if parent.isValid() else None
+        if parent_item:
+            items = [parent_item.child(row) for row in range(start, end + 1)]
+        else:
+            items = [self.topLevelItem(row) for row in range(start, end + 1)]
+
+        # Children are appended while iterating, so children of children are also returned
+        for item in items:
+            if item is not None:
+                items.extend(item.child(row) for row in range(item.childCount()))
+
+        return items
+
+    def _item_column_width(self, item, column):
+        """
+        Internal function that returns the width needed to show the contents of the given item column
+        :param item: QTreeWidgetItem
+        :param column: int
+        :return: int or None
+        """
+
+        if item is None or isinstance(item, group.GroupDataItemView):
+            return None
+
+        return item.text_width(column) + item.padding()
+
     def _create_header_menu(self, column):
         """
         Internal function that creates a new header menu
@@ -7,6 +7,7 @@ Module that contains data library viewer widget implementation
 
 from __future__ import print_function, division, absolute_import
 
+import os
 import logging
 from functools import partial
 
@@ -18,7 +19,7 @@ from tpDcc.managers import resources
 from tpDcc.libs.qt.core import base, qtutils, contexts as qt_contexts
 from tpDcc.libs.qt.widgets import layouts, toast, action
 
-from tpDcc.tools.datalibrary.core import consts
+from tpDcc.tools.datalibrary.core import consts, itemorder, facetindex, customorder
 from tpDcc.tools.datalibrary.core.views import item
 from tpDcc.tools.datalibrary.data import group
 from tpDcc.tools.datalibrary.widgets import listview, treeview
@@ -125,6 +126,13 @@ class DataViewer(base.BaseWidget):
         self._delegate = None
         self._is_item_text_visible = True
         self._toast_enabled = True
+        self._item_order = None
+        self._item_views = dict()
+        self._group_items = dict()
+        self._item_count = 0
+        self._facet_index = facetindex.FacetIndex(self._item_field_value)
+        self._item_filters = list()
+        self._custom_order = customorder.CustomOrderStore()
 
         self._zoom_amount = self.DEFAULT_ZOOM_AMOUNT
         self._icon_size = QSize(self._zoom_amount, self._zoom_amount)
@@ -581,6 +589,7 @@ class DataViewer(base.BaseWidget):
         """
 
         self._dpi = dpi
+        self._tree_widget.invalidate_column_widths()
         self.refresh_size()
 
     # ============================================================================================================
@@ -821,6 +830,8 @@ class DataViewer(base.BaseWidget):
     def update_items(self):
         """
         Sets the items to the viewer
+        Views of the items that were already shown are reused. Sort keys are computed again, because the values of
+        the items can change between searches
         """
 
         selected_items = self.selected_items()
@@ -831,23 +842,26 @@ class DataViewer(base.BaseWidget):
                 self.clear_selection()
                 if self.library():
                     results = self.library().grouped_results()
-                    item_views = list()
-                    for group in results:
-                        if group != 'None':
-                            group_item = self.create_group_item(group)
-                            item_views.append(group_item)
-                        for item in results[group]:
-                            view_class = self.library_window().factory.get_view(item)
-                            if not view_class:
-                                continue
-                            item_view = view_class(item, library_window=self.library_window())
-                            item_views.append(item_view)
+                    data_items = [data_item for group_name in results for data_item in results[group_name]]
+                    self._item_order = itemorder.ItemOrderIndex(data_items, self._item_field_value)
+                    self._facet_index.update(data_items)
+                    old_item_views = self._item_views
+                    self._item_views = self._create_item_views(data_items)
+                    # Data of reused views can change between searches, so their contents are measured again
+                    reused_views = [
+                        view for key, view in self._item_views.items() if old_item_views.get(key) is view]
+                    self.tree_widget().invalidate_column_widths(reused_views)
+                    item_views = self._ordered_item_views()
 
                     if item_views:
                         self.tree_widget().set_items(item_views)
                         if selected_items:
                             self.select_items(selected_items)
                             self.scroll_to_selected_item()
+                    elif data_items:
+                        # Items are hidden by queries or filters. Index is kept, so filters can still list their
+                        # values and items can be reordered without searching again
+                        self.tree_widget().set_items(list())
                     else:
                         self.clear()
                 else:
@@ -855,12 +869,122 @@ class DataViewer(base.BaseWidget):
             finally:
                 self.itemSelectionChanged.emit()
 
+    def item_count(self):
+        """
+        Returns the number of items shown by the viewer, once item queries and filters are applied
+        :return: int
+        """
+
+        return self._item_count
+
+    def facet_index(self):
+        """
+        Returns the index that counts current items by the values of their fields
+        :return: FacetIndex
+        """
+
+        return self._facet_index
+
+    def item_filters(self):
+        """
+        Returns the filters that hide current items by the values of their fields
+        :return: list(object)
+        """
+
+        return self._item_filters
+
+    def add_item_filter(self, item_filter):
+        """
+        Adds a filter that hides current items by the values of their fields
+        Filters must implement an excluded_facets function that returns the field name and the excluded values
+        :param item_filter: object
+        """
+
+        if item_filter not in self._item_filters:
+            self._item_filters.append(item_filter)
+
+    def set_item_query(self, query):
+        """
+        Sets a named query that hides current items that do not match it. Queries are evaluated by the viewer on the
+        items found by the library, so changing a query does not need to search the library again
+        :param query: dict, library query with "name", "operator" and "filters" keys
+        :return: bool, True if the query changed and items must be reordered; False otherwise
+        """
+
+        return self._facet_index.set_query(query)
+
+    def remove_item_query(self, name):
+        """
+        Removes the named query with the given name
+        :param name: str
+        :return: bool, True if the query was removed and items must be reordered; False otherwise
+        """
+
+        return self._facet_index.remove_query(name)
+
+    def custom_order(self):
+        """
+        Returns the store with the custom order of the items
+        :return: CustomOrderStore
+        """
+
+        return self._custom_order
+
+    def item_identifier(self, data_item):
+        """
+        Returns the identifier used to store the custom order of the given item. Path is not always stored in the
+        item data, so the identifier of the item is used
+        :param data_item: DataItem
+        :return: str
+        """
+
+        return data_item.format_identifier()
+
+    def update_custom_order(self):
+        """
+        Reorders current items after their custom order changed. Only custom order sort keys are computed again
+        """
+
+        if self._item_order is None:
+            return
+
+        self._item_order.invalidate(customorder.CUSTOM_ORDER_FIELD)
+        self.reorder_items()
+
+    def reorder_items(self):
+        """
+        Groups, sorts and filters current items using the group by and sort by values of the library and the item
+        filters. Items are not searched again and their views are reused, so only the order of the rows changes
+        """
+
+        if not self.library():
+            return
+        if self._item_order is None:
+            self.library().search()
+            return
+
+        selected_items = self.selected_items()
+
+        with qt_contexts.block_signals(self.tree_widget()):
+            try:
+                self.tree_widget().set_items(self._ordered_item_views())
+                if selected_items:
+                    self.select_items(selected_items)
+                    self.scroll_to_selected_item()
+            finally:
+                self.itemSelectionChanged.emit()
+
     def clear(self):
         """
         Clear all elements in tree widget
         """
 
         self.tree_widget().clear()
+        self._item_order = None
+        self._item_views = dict()
+        self._group_items = dict()
+        self._item_count = 0
+        self._facet_index.clear()
 
     # ============================================================================================================
     # LIST VIEW
@@ -1179,6 +1303,91 @@ class DataViewer(base.BaseWidget):
         elif mode == self.TableMode:
             self.set_list_mode()
 
+    def _item_field_value(self, data_item, field):
+        """
+        Internal function that returns the value of the given field of the given item, used to group, sort and filter
+        items. Identifier and extension are not stored in the item data, so they are computed from the item path
+        :param data_item: DataItem
+        :param field: str
+        :return: object
+        """
+
+        if field == customorder.CUSTOM_ORDER_FIELD:
+            return self._custom_order.rank(self.item_identifier(data_item))
+        elif field == 'identifier':
+            return data_item.format_identifier()
+        elif field == 'extension':
+            return os.path.splitext(data_item.format_identifier().rstrip('/\\'))[-1]
+
+        return data_item.data.get(field)
+
+    def _filtered_rows(self):
+        """
+        Internal function that returns the rows of the current items that are not hidden by item queries or filters
+        Queries and filters are applied as intersections of the bitsets of the facet index
+        :return: list(int) or None, None if no item is filtered
+        """
+
+        facet_filters = list()
+        for item_filter in self._item_filters:
+            field, excluded_values = item_filter.excluded_facets()
+            if field and excluded_values:
+                facet_filters.append((field, excluded_values))
+        if not facet_filters and not self._facet_index.queries():
+            return None
+
+        mask = self._facet_index.query_mask()
+        for field, excluded_values in facet_filters:
+            mask &= self._facet_index.mask(field, excluded_values)
+
+        return self._facet_index.accepted_rows(self._item_order.items(), mask)
+
+    def _create_item_views(self, data_items):
+        """
+        Internal function that returns the views of the given items. Views of items already shown are reused
+        :param data_items: list(DataItem)
+        :return: dict(int, LibraryItem), views of the items by item id
+        """
+
+        item_views = dict()
+        for data_item in data_items:
+            item_view = self._item_views.get(id(data_item))
+            if item_view is None or item_view.item is not data_item:
+                view_class = self.library_window().factory.get_view(data_item)
+                if not view_class:
+                    continue
+                item_view = view_class(data_item, library_window=self.library_window())
+            item_views[id(data_item)] = item_view
+
+        return item_views
+
+    def _ordered_item_views(self):
+        """
+        Internal function that returns the views of current items grouped and sorted using the library group by and
+        sort by values. Group items are created only for new groups
+        :return: list(LibraryItem)
+        """
+
+        groups = self._item_order.grouped(self.library().group_by(), self.library().sort_by(), self._filtered_rows())
+
+        item_views = list()
+        group_items = dict()
+        item_count = 0
+        for group_name, data_items in groups.items():
+            if group_name != itemorder.NO_GROUP:
+                group_item = self._group_items.get(group_name) or self.create_group_item(group_name)
+                group_items[group_name] = group_item
+                item_views.append(group_item)
+            for data_item in data_items:
+                item_view = self._item_views.get(id(data_item))
+                if item_view is not None:
+                    item_views.append(item_view)
+                    item_count += 1
+        self._group_items = group_items
+        self._item_count = item_count
+
+        return item_views
+
     # ============================================================================================================
     # CALLBACKS
     # ============================================================================================================
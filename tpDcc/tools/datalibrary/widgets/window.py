@@ -188,6 +188,8 @@ class LibraryWindow(base.BaseWidget):
         self._sort_by_menu = self.SORTBY_MENU_CLASS(self)
         self._group_by_menu = self.GROUPBY_MENU_CLASS(self)
         self._filter_by_menu = self.FILTERBY_MENU_CLASS(self)
+        self._filter_by_menu.set_facet_index(self._viewer.facet_index())
+        self._viewer.add_item_filter(self._filter_by_menu)
         self._status_widget = self.STATUS_WIDGET_CLASS(self)
         self._sidebar_widget = self.SIDEBAR_WIDGET_CLASS(self)
         self._sidebar_widget.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -227,6 +229,9 @@ class LibraryWindow(base.BaseWidget):
         self._viewer.itemDropped.connect(self._on_item_dropped)
         self._viewer.keyPressed.connect(self._on_key_pressed)
         self._viewer.customContextMenuRequested.connect(self._on_show_items_context_menu)
+        self._group_by_menu.groupByChanged.connect(self._on_item_order_changed)
+        self._sort_by_menu.sortByChanged.connect(self._on_item_order_changed)
+        self._filter_by_menu.filterChanged.connect(self._on_item_filter_changed)
 
     def event(self, event):
         """
@@ -340,12 +345,13 @@ class LibraryWindow(base.BaseWidget):
                 self._items_factory = factory.ItemsFactory(paths=plugin_locations)
 
             self._path = path_utils.clean_path(os.path.dirname(self.database_path()))
+            self.load_custom_order()
 
             # This is very time consuming, we should avoid calling this
             self._library.sync()
 
-            # Add some default queries
-            self._library.add_query(
+            # Add some default queries. They are evaluated by the viewer on the items found by the library
+            self._viewer.set_item_query(
                 {'name': 'invalid extensions', 'operator': 'and', 'filters': [('extension', 'not', '.pyc')]}
             )
 
@@ -356,6 +362,7 @@ class LibraryWindow(base.BaseWidget):
         self._filter_by_menu.set_library(self._library)
         self._viewer.set_library(self._library)
         self._search_widget.set_library(self._library)
+        self._search_widget.set_viewer(self._viewer)
         self._sidebar_widget.set_library(self._library)
 
         self.set_refresh_enabled(True)
@@ -374,6 +381,41 @@ class LibraryWindow(base.BaseWidget):
 
         return self._library.identifier
 
+    def custom_order_path(self):
+        """
+        Returns path to the file that stores the custom order of the library items
+        :return: str or None
+        """
+
+        if not self._library or not self.path():
+            return None
+
+        return path_utils.clean_path(os.path.join(self.path(), consts.CUSTOM_ORDER_FILE_NAME))
+
+    def load_custom_order(self):
+        """
+        Loads the custom order of the library items into the viewer
+        """
+
+        custom_order_path = self.custom_order_path()
+        ranks = utils.read_json(custom_order_path) if custom_order_path else dict()
+        self._viewer.custom_order().set_ranks(ranks)
+        self._viewer.update_custom_order()
+
+    def save_custom_order(self):
+        """
+        Saves the custom order of the library items. Only the ranks that changed since the last save are updated and
+        the updates done within a short delay are written at once
+        """
+
+        custom_order_path = self.custom_order_path()
+        if not custom_order_path:
+            return
+
+        changes = self._viewer.custom_order().take_changes()
+        if changes:
+            utils.update_json(custom_order_path, changes, delay=consts.CUSTOM_ORDER_SAVE_DELAY)
+
     def path(self):
         """
         Returns the path being used by the library
@@ -1030,6 +1072,56 @@ class LibraryWindow(base.BaseWidget):
 
         return self.viewer().selected_items()
 
+    def load_items(self, items=None, functionality='load'):
+        """
+        Loads the given items or the selected ones if no items are given. If a client is available, all items are
+        loaded within a single DCC operation
+        :param items: list(LibraryItem) or None
+        :param functionality: str, data functionality to execute ('load' or 'import_data')
+        :return: bool
+        """
+
+        items = items or self.selected_items()
+        if not items or not self.library():
+            return False
+
+        library_path = self.library().identifier
+        data_paths = [item.item.format_identifier() for item in items]
+
+        # client is a property that returns the DCC client or None when the library runs without DCC
+        client = self.client
+        start_time = time.time()
+        if client:
+            success, message, result = client.load_multiple_data(
+                library_path=library_path, data_paths=data_paths, functionality=functionality)
+            for item_result in (result or dict()).get('items') or list():
+                if item_result.get('success'):
+                    logger.debug('"{}" done in {:.3f} seconds'.format(
+                        item_result.get('data_path'), item_result.get('elapsed_time', 0.0)))
+                else:
+                    logger.warning('"{}" failed: {}'.format(item_result.get('data_path'), item_result.get('msg')))
+        else:
+            success = True
+            message = ''
+            for item in items:
+                function = item.item.functionality().get(functionality)
+                if not function:
+                    success = False
+                    continue
+                try:
+                    function()
+                except Exception:
+                    logger.exception('Error while executing "{}" for "{}"'.format(functionality, item.item))
+                    success = False
+
+        elapsed_time = time.time() - start_time
+        if success:
+            self.show_info_message('{} items done in {:.3f} seconds'.format(len(items), elapsed_time))
+        else:
+            self.show_error_message(message or 'Some items failed. Check log for more information.')
+
+        return success
+
     # ============================================================================================================
     # STATUS WIDGET
     # ============================================================================================================
@@ -1458,7 +1550,8 @@ class LibraryWindow(base.BaseWidget):
         Show long the current refresh took
         """
 
-        item_count = len(self.library().results())
+        # Search and filters are applied by the viewer, so library results can contain hidden items
+        item_count = self.viewer().item_count()
         elapsed_time = self.library().search_time()
 
         plural = ''
@@ -1745,7 +1838,7 @@ class LibraryWindow(base.BaseWidget):
         settings = utils.read_settings(self._settings_file_path)
         settings.setdefault(self.name(), dict())
         settings[self.name()].update(settings_dict or self.settings())
-        utils.save_settings(settings)
+        utils.save_settings(settings, settings_file_path=self._settings_file_path)
 
         self.show_toast_message('Saved')
 
@@ -1891,6 +1984,15 @@ class LibraryWindow(base.BaseWidget):
                 # NOTE: related with item views will not work
                 self._menu_items.append(item_view)
 
+        if items and len(items) > 1:
+            load_action = QAction(resources.icon('load'), 'Load Selected', context_menu)
+            load_action.triggered.connect(partial(self.load_items, items, 'load'))
+            context_menu.addAction(load_action)
+            import_action = QAction(resources.icon('import'), 'Import Selected', context_menu)
+            import_action.triggered.connect(partial(self.load_items, items, 'import_data'))
+            context_menu.addAction(import_action)
+            context_menu.addSeparator()
+
         if not self.is_locked():
             context_menu.addMenu(self._create_new_item_menu())
             if item_view:
@@ -2096,6 +2198,22 @@ class LibraryWindow(base.BaseWidget):
         point = widget.mapToGlobal(QPoint(0, widget.height()))
         self._sort_by_menu.show(point)
 
+    def _on_item_order_changed(self, value):
+        """
+        Internal callback function called when the user changes the group by or sort by values of the library
+        :param value: list(str) or None
+        """
+
+        self._viewer.reorder_items()
+
+    def _on_item_filter_changed(self):
+        """
+        Internal callback function called when the user changes the items filters
+        """
+
+        self._viewer.reorder_items()
+        self.update_filters_button()
+
     def _on_toggle_view(self):
         """
         Internal callback function called whe the user press view action